@@ -85,6 +85,7 @@ from app.business.use_cases.delete_order_use_case import (
     DeleteOrderInputData
 )
 from app.adapters.api.auth_helpers import login_required
+from app.adapters.api.error_handlers import use_case_error_boundary
 from functools import wraps
 
 
@@ -131,84 +132,79 @@ def create_admin_routes(
     
     @admin_bp.route('/users', methods=['GET'])
     @admin_required
+    @use_case_error_boundary
     def list_users():
         """List all users with filters, pagination, and search"""
-        try:
-            # Extract query parameters
-            page = request.args.get('page', 1, type=int)
-            per_page = request.args.get('per_page', 20, type=int)
-            role_filter = request.args.get('role', type=str)
-            active_filter = request.args.get('active', type=str)
-            search_query = request.args.get('search', '', type=str)
-            sort_by = request.args.get('sort_by', 'newest', type=str)  # Use valid default: newest, oldest, name_asc, name_desc
-            
-            # Convert active_filter string to boolean
-            active_bool = None
-            if active_filter:
-                active_bool = active_filter.lower() in ('true', '1', 'yes')
-            
-            # Create input data
-            input_data = ListUsersInputData(
-                page=page,
-                per_page=per_page,
-                role_filter=role_filter,
-                active_filter=active_bool,
-                search_query=search_query,
-                sort_by=sort_by
-            )
-            
-            # Execute use case
-            output_data = list_users_use_case.execute(input_data)
-            
-            if not output_data.success:
-                return jsonify({
-                    'success': False,
-                    'error': output_data.error_message
-                }), 400
-            
-            # Convert users to dict format
-            users_dict = [
-                {
-                    'user_id': user.user_id,
-                    'username': user.username,
-                    'email': str(user.email),  # Convert Email value object to string
-                    'full_name': user.full_name,
-                    'phone_number': user.phone_number,
-                    'address': user.address,
-                    'role': user.role,
-                    'is_active': user.is_active,
-                    'created_at': user.created_at.isoformat() if user.created_at else None
-                }
-                for user in output_data.users
-            ]
-            
-            return jsonify({
-                'success': True,
-                'data': {
-                    'users': users_dict,
-                    'pagination': {
-                        'total_users': output_data.total_users,
-                        'total_pages': output_data.total_pages,
-                        'current_page': output_data.current_page,
-                        'per_page': per_page
-                    },
-                    'statistics': {
-                        'total_admins': output_data.total_admins,
-                        'total_customers': output_data.total_customers,
-                        'active_users': output_data.active_users,
-                        'inactive_users': output_data.inactive_users
-                    }
-                }
-            }), 200
-            
-        except Exception as e:
+        # Extract query parameters
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        role_filter = request.args.get('role', type=str)
+        active_filter = request.args.get('active', type=str)
+        search_query = request.args.get('search', '', type=str)
+        sort_by = request.args.get('sort_by', 'newest', type=str)  # Use valid default: newest, oldest, name_asc, name_desc
+        
+        # Convert active_filter string to boolean
+        active_bool = None
+        if active_filter:
+            active_bool = active_filter.lower() in ('true', '1', 'yes')
+        
+        # Create input data
+        input_data = ListUsersInputData(
+            page=page,
+            per_page=per_page,
+            role_filter=role_filter,
+            active_filter=active_bool,
+            search_query=search_query,
+            sort_by=sort_by
+        )
+        
+        # Execute use case
+        output_data = list_users_use_case.execute(input_data)
+        
+        if not output_data.success:
             return jsonify({
                 'success': False,
-                'error': str(e)
-            }), 500
+                'error': output_data.error_message
+            }), 400
+        
+        # Convert users to dict format
+        users_dict = [
+            {
+                'user_id': user.user_id,
+                'username': user.username,
+                'email': str(user.email),  # Convert Email value object to string
+                'full_name': user.full_name,
+                'phone_number': user.phone_number,
+                'address': user.address,
+                'role': user.role,
+                'is_active': user.is_active,
+                'created_at': user.created_at.isoformat() if user.created_at else None
+            }
+            for user in output_data.users
+        ]
+        
+        return jsonify({
+            'success': True,
+            'data': {
+                'users': users_dict,
+                'pagination': {
+                    'total_users': output_data.total_users,
+                    'total_pages': output_data.total_pages,
+                    'current_page': output_data.current_page,
+                    'per_page': per_page
+                },
+                'statistics': {
+                    'total_admins': output_data.total_admins,
+                    'total_customers': output_data.total_customers,
+                    'active_users': output_data.active_users,
+                    'inactive_users': output_data.inactive_users
+                }
+            }
+        }), 200
     
     @admin_bp.route('/users/search', methods=['GET'])
     @admin_required
+    @use_case_error_boundary
     def search_users():
         """Search users by query string"""
         try:
@@ -263,11 +259,6 @@ def create_admin_routes(
                 'success': False,
                 'error': str(e)
             }), 400
-        except Exception as e:
-            return jsonify({
-                'success': False,
-                'error': str(e)
-            }), 500
     
     @admin_bp.route('/users', methods=['POST'])
     @admin_required
@@ -327,6 +318,7 @@ def create_admin_routes(
     
     @admin_bp.route('/users/<int:user_id>', methods=['PUT'])
     @admin_required
+    @use_case_error_boundary
     def update_user(user_id):
         """Update user by admin"""
         try:
@@ -382,11 +374,6 @@ def create_admin_routes(
                 'success': False,
                 'error': str(e)
             }), 400
-        except Exception as e:
-            return jsonify({
-                'success': False,
-                'error': str(e)
-            }), 500
     
     @admin_bp.route('/users/<int:user_id>', methods=['DELETE'])
     @admin_required
@@ -582,6 +569,11 @@ def create_admin_routes(
                 'message': output_data.message
             }), 200
             
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         except Exception as e:
             return jsonify({
                 'success': False,
@@ -850,67 +842,61 @@ def create_admin_routes(
     
     @admin_bp.route('/orders', methods=['GET'])
     @admin_required
+    @use_case_error_boundary
     def list_orders():
         """List all orders with filters (admin view)"""
-        try:
-            # Get query parameters
-            page = request.args.get('page', 1, type=int)
-            per_page = request.args.get('per_page', 20, type=int)
-            status = request.args.get('status')
-            customer_id = request.args.get('customer_id', type=int)
-            
-            # Create input data
-            input_data = ListOrdersInputData(
-                page=page,
-                per_page=per_page,
-                status=status,
-                customer_id=customer_id
-            )
-            
-            # Execute use case
-            output_data = list_orders_use_case.execute(input_data)
-            
-            if not output_data.success:
-                return jsonify({
-                    'success': False,
-                    'error': output_data.message
-                }), 400
-            
-            # Convert to response
-            return jsonify({
-                'success': True,
-                'orders': [
-                    {
-                        'order_id': o.order_id,
-                        'customer_id': o.customer_id,
-                        'customer_name': o.customer_name,
-                        'customer_email': str(o.customer_email) if o.customer_email else None,
-                        'total_amount': o.total_amount,
-                        'status': o.status,
-                        'payment_method': o.payment_method,
-                        'order_date': o.order_date.isoformat() if o.order_date else None,
-                        'item_count': o.item_count
-                    }
-                    for o in output_data.orders
-                ],
-                'total_orders': output_data.total_orders,
-                'total_pages': output_data.total_pages,
-                'page': output_data.page,
-                'per_page': output_data.per_page,
-                'statistics': {
-                    'total_revenue': output_data.total_revenue,
-                    'pending_count': output_data.pending_count,
-                    'shipping_count': output_data.shipping_count,
-                    'completed_count': output_data.completed_count,
-                    'cancelled_count': output_data.cancelled_count
-                }
-            }), 200
-            
-        except Exception as e:
+        # Get query parameters
+        page = request.args.get('page', 1, type=int)
+        per_page = request.args.get('per_page', 20, type=int)
+        status = request.args.get('status')
+        customer_id = request.args.get('customer_id', type=int)
+        
+        # Create input data
+        input_data = ListOrdersInputData(
+            page=page,
+            per_page=per_page,
+            status=status,
+            customer_id=customer_id
+        )
+        
+        # Execute use case
+        output_data = list_orders_use_case.execute(input_data)
+        
+        if not output_data.success:
             return jsonify({
                 'success': False,
-                'error': str(e)
-            }), 500
+                'error': output_data.message
+            }), 400
+        
+        # Convert to response
+        return jsonify({
+            'success': True,
+            'orders': [
+                {
+                    'order_id': o.order_id,
+                    'customer_id': o.customer_id,
+                    'customer_name': o.customer_name,
+                    'customer_email': str(o.customer_email) if o.customer_email else None,
+                    'total_amount': o.total_amount,
+                    'status': o.status,
+                    'payment_method': o.payment_method,
+                    'order_date': o.order_date.isoformat() if o.order_date else None,
+                    'item_count': o.item_count
+                }
+                for o in output_data.orders
+            ],
+            'total_orders': output_data.total_orders,
+            'total_pages': output_data.total_pages,
+            'page': output_data.page,
+            'per_page': output_data.per_page,
+            'statistics': {
+                'total_revenue': output_data.total_revenue,
+                'pending_count': output_data.pending_count,
+                'shipping_count': output_data.shipping_count,
+                'completed_count': output_data.completed_count,
+                'cancelled_count': output_data.cancelled_count
+            }
+        }), 200
     
     @admin_bp.route('/orders', methods=['POST'])
     @admin_required
@@ -1002,6 +988,11 @@ def create_admin_routes(
                 'message': output_data.message
             }), 200
             
+        except ValueError as e:
+            return jsonify({
+                'success': False,
+                'error': str(e)
+            }), 400
         except Exception as e:
             return jsonify({
                 'success': False,
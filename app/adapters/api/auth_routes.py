@@ -17,6 +17,7 @@ from ...business.use_cases.login_user_use_case import (
 )
 from ...business.use_cases.get_user_use_case import GetUserUseCase, GetUserInputData
 from ...business.ports import IUserRepository
+from .error_handlers import use_case_error_boundary
 
 
 # Blueprint definition
@@ -44,6 +45,7 @@ def init_auth_routes(register_uc: RegisterUserUseCase,
 
 
 @auth_bp.route('/register', methods=['POST'])
+@use_case_error_boundary
 def register():
     """
     Register new user endpoint
@@ -62,65 +64,59 @@ def register():
         201: {"success": true, "user_id": int}
         400: {"success": false, "error": "message"}
     """
-    try:
-        # Parse request JSON (silent=True to avoid 415 errors)
-        data = request.get_json(silent=True)
-        
-        # Check if JSON data exists
-        if not data:
-            return jsonify({
-                'success': False,
-                'error': 'Request body must be JSON'
-            }), 400
-        
-        # Validate required fields
-        required_fields = ['username', 'email', 'password', 'full_name']
-        for field in required_fields:
-            if field not in data or not data[field]:
-                return jsonify({
-                    'success': False,
-                    'error': f'Missing required field: {field}'
-                }), 400
-        
-        # Hash password (Infrastructure concern) - using bcrypt
-        password = data['password'].encode('utf-8')
-        salt = bcrypt.gensalt()
-        password_hash = bcrypt.hashpw(password, salt).decode('utf-8')
-        
-        # Map HTTP request to Use Case Input
-        input_data = RegisterUserInputData(
-            username=data['username'],
-            email=data['email'],
-            password_hash=password_hash,
-            full_name=data['full_name'],
-            phone_number=data.get('phone_number'),
-            address=data.get('address')
-        )
-        
-        # Execute use case
-        output = _register_use_case.execute(input_data)
-        
-        # Map Use Case Output to HTTP Response
-        if output.success:
-            return jsonify({
-                'success': True,
-                'user_id': output.user_id,
-                'message': 'Registration successful'
-            }), 201
-        else:
+    # Parse request JSON (silent=True to avoid 415 errors)
+    data = request.get_json(silent=True)
+    
+    # Check if JSON data exists
+    if not data:
+        return jsonify({
+            'success': False,
+            'error': 'Request body must be JSON'
+        }), 400
+    
+    # Validate required fields
+    required_fields = ['username', 'email', 'password', 'full_name']
+    for field in required_fields:
+        if field not in data or not data[field]:
             return jsonify({
                 'success': False,
-                'error': output.error_message
+                'error': f'Missing required field: {field}'
             }), 400
-            
-    except Exception as e:
+    
+    # Hash password (Infrastructure concern) - using bcrypt
+    password = data['password'].encode('utf-8')
+    salt = bcrypt.gensalt()
+    password_hash = bcrypt.hashpw(password, salt).decode('utf-8')
+    
+    # Map HTTP request to Use Case Input
+    input_data = RegisterUserInputData(
+        username=data['username'],
+        email=data['email'],
+        password_hash=password_hash,
+        full_name=data['full_name'],
+        phone_number=data.get('phone_number'),
+        address=data.get('address')
+    )
+    
+    # Execute use case
+    output = _register_use_case.execute(input_data)
+    
+    # Map Use Case Output to HTTP Response
+    if output.success:
+        return jsonify({
+            'success': True,
+            'user_id': output.user_id,
+            'message': 'Registration successful'
+        }), 201
+    else:
         return jsonify({
             'success': False,
-            'error': f'Server error: {str(e)}'
-        }), 500
+            'error': output.error_message
+        }), 400
 
 
 @auth_bp.route('/login', methods=['POST'])
+@use_case_error_boundary
 def login():
     """
     User login endpoint
@@ -135,76 +131,69 @@ def login():
         200: {"success": true, "user": {...}}
         401: {"success": false, "error": "message"}
     """
-    try:
-        # Parse request JSON
-        data = request.get_json()
-        
-        # Validate required fields
-        if not data or 'username' not in data or 'password' not in data:
-            return jsonify({
-                'success': False,
-                'error': 'Username and password are required'
-            }), 400
-        
-        username_or_email = data['username']
-        password = data['password']
-        
-        # First, execute use case to get user info
-        # Note: Use case doesn't verify password (no bcrypt in business layer)
-        input_data = LoginUserInputData(
-            username_or_email=username_or_email,
-            password_hash=''  # Placeholder, not used in use case
-        )
-        
-        output = _login_use_case.execute(input_data)
-        
-        if not output.success:
-            return jsonify({
-                'success': False,
-                'error': output.error_message
-            }), 401
-        
-        # Now verify password (Infrastructure concern)
-        # Get user entity from repository to access password_hash
-        user = _user_repository.find_by_id(output.user_id)
-        
-        if not user:
-            return jsonify({
-                'success': False,
-                'error': 'User not found'
-            }), 401
-        
-        # Verify password hash using bcrypt
-        password_bytes = password.encode('utf-8')
-        stored_hash_bytes = user.password_hash.encode('utf-8')
-        if not bcrypt.checkpw(password_bytes, stored_hash_bytes):
-            return jsonify({
-                'success': False,
-                'error': 'Invalid username or password'
-            }), 401
-        
-        # Store user session
-        session['user_id'] = output.user_id
-        session['username'] = output.username
-        session['role'] = output.role
-        
-        # Return success response
+    # Parse request JSON
+    data = request.get_json()
+    
+    # Validate required fields
+    if not data or 'username' not in data or 'password' not in data:
         return jsonify({
-            'success': True,
-            'user': {
-                'id': output.user_id,
-                'username': output.username,
-                'role': output.role,
-                'full_name': user.full_name,
-                'email': user.email.address
-            }
-        }), 200
-        
-    except Exception as e:
+            'success': False,
+            'error': 'Username and password are required'
+        }), 400
+    
+    username_or_email = data['username']
+    password = data['password']
+    
+    # First, execute use case to get user info
+    # Note: Use case doesn't verify password (no bcrypt in business layer)
+    input_data = LoginUserInputData(
+        username_or_email=username_or_email,
+        password_hash=''  # Placeholder, not used in use case
+    )
+    
+    output = _login_use_case.execute(input_data)
+    
+    if not output.success:
         return jsonify({
             'success': False,
-            'error': f'Server error: {str(e)}'
-        }), 500
+            'error': output.error_message
+        }), 401
+    
+    # Now verify password (Infrastructure concern)
+    # Get user entity from repository to access password_hash
+    user = _user_repository.find_by_id(output.user_id)
+    
+    if not user:
+        return jsonify({
+            'success': False,
+            'error': 'User not found'
+        }), 401
+    
+    # Verify password hash using bcrypt
+    password_bytes = password.encode('utf-8')
+    stored_hash_bytes = user.password_hash.encode('utf-8')
+    if not bcrypt.checkpw(password_bytes, stored_hash_bytes):
+        return jsonify({
+            'success': False,
+            'error': 'Invalid username or password'
+        }), 401
+    
+    # Store user session
+    session['user_id'] = output.user_id
+    session['username'] = output.username
+    session['role'] = output.role
+    
+    # Return success response
+    return jsonify({
+        'success': True,
+        'user': {
+            'id': output.user_id,
+            'username': output.username,
+            'role': output.role,
+            'full_name': user.full_name,
+            'email': user.email.address
+        }
+    }), 200
 
 
 @auth_bp.route('/logout', methods=['POST'])
@@ -14,6 +14,7 @@ from app.business.use_cases.remove_cart_item_use_case import (
     RemoveCartItemInputData
 )
 from app.adapters.api.auth_helpers import login_required
+from app.adapters.api.error_handlers import use_case_error_boundary
 
 
 def create_cart_routes(
@@ -28,53 +29,47 @@ def create_cart_routes(
     
     @cart_bp.route('', methods=['GET'])
     @login_required
+    @use_case_error_boundary
     def view_cart():
         """View user's cart"""
-        try:
-            user_id = session.get('user_id')
-            
-            # Execute use case
-            output_data = view_cart_use_case.execute(user_id)
-            
-            if not output_data.success:
-                return jsonify({
-                    'success': False,
-                    'error': output_data.error_message
-                }), 400
-            
-            # Convert to response
-            return jsonify({
-                'success': True,
-                'cart': {
-                    'cart_id': output_data.cart_id,
-                    'items': [
-                        {
-                            'cart_item_id': item.cart_item_id,
-                            'product_id': item.product_id,
-                            'product_name': item.product_name,
-                            'product_image': item.product_image,
-                            'price': float(item.price),
-                            'currency': item.currency,
-                            'quantity': item.quantity,
-                            'subtotal': float(item.subtotal),
-                            'stock_available': item.stock_available,
-                            'is_available': item.is_available
-                        }
-                        for item in output_data.items
-                    ],
-                    'total_items': output_data.total_items,
-                    'subtotal': float(output_data.subtotal),
-                    'tax': float(output_data.tax),
-                    'shipping': float(output_data.shipping),
-                    'total': float(output_data.total)
-                }
-            }), 200
-            
-        except Exception as e:
+        user_id = session.get('user_id')
+        
+        # Execute use case
+        output_data = view_cart_use_case.execute(user_id)
+        
+        if not output_data.success:
             return jsonify({
                 'success': False,
-                'error': str(e)
-            }), 500
+                'error': output_data.error_message
+            }), 400
+        
+        # Convert to response
+        return jsonify({
+            'success': True,
+            'cart': {
+                'cart_id': output_data.cart_id,
+                'items': [
+                    {
+                        'cart_item_id': item.cart_item_id,
+                        'product_id': item.product_id,
+                        'product_name': item.product_name,
+                        'product_image': item.product_image,
+                        'price': float(item.price),
+                        'currency': item.currency,
+                        'quantity': item.quantity,
+                        'subtotal': float(item.subtotal),
+                        'stock_available': item.stock_available,
+                        'is_available': item.is_available
+                    }
+                    for item in output_data.items
+                ],
+                'total_items': output_data.total_items,
+                'subtotal': float(output_data.subtotal),
+                'tax': float(output_data.tax),
+                'shipping': float(output_data.shipping),
+                'total': float(output_data.total)
+            }
+        }), 200
     
     @cart_bp.route('/add', methods=['POST'])
     @login_required
@@ -125,81 +120,69 @@ def create_cart_routes(
     
     @cart_bp.route('/items/<int:cart_item_id>', methods=['PUT'])
     @login_required
+    @use_case_error_boundary
     def update_cart_item(cart_item_id: int):
         """Update cart item quantity"""
-        try:
-            user_id = session.get('user_id')
-            data = request.get_json()
-            
-            # Validate required fields
-            if not data or 'quantity' not in data:
-                return jsonify({
-                    'success': False,
-                    'error': 'Quantity is required'
-                }), 400
-            
-            # Create input data
-            input_data = UpdateCartItemInputData(
-                user_id=user_id,
-                cart_item_id=cart_item_id,
-                new_quantity=data['quantity']
-            )
-            
-            # Execute use case
-            output_data = update_cart_item_use_case.execute(input_data)
-            
-            if not output_data.success:
-                return jsonify({
-                    'success': False,
-                    'error': output_data.error_message
-                }), 400
-            
-            # Convert to response
+        user_id = session.get('user_id')
+        data = request.get_json()
+        
+        # Validate required fields
+        if not data or 'quantity' not in data:
             return jsonify({
-                'success': True,
-                'message': output_data.message,
-                'cart_item_id': output_data.cart_item_id,
-                'new_quantity': output_data.new_quantity
-            }), 200
-            
-        except Exception as e:
+                'success': False,
+                'error': 'Quantity is required'
+            }), 400
+        
+        # Create input data
+        input_data = UpdateCartItemInputData(
+            user_id=user_id,
+            cart_item_id=cart_item_id,
+            new_quantity=data['quantity']
+        )
+        
+        # Execute use case
+        output_data = update_cart_item_use_case.execute(input_data)
+        
+        if not output_data.success:
             return jsonify({
                 'success': False,
-                'error': str(e)
-            }), 500
+                'error': output_data.error_message
+            }), 400
+        
+        # Convert to response
+        return jsonify({
+            'success': True,
+            'message': output_data.message,
+            'cart_item_id': output_data.cart_item_id,
+            'new_quantity': output_data.new_quantity
+        }), 200
     
     @cart_bp.route('/items/<int:cart_item_id>', methods=['DELETE'])
     @login_required
+    @use_case_error_boundary
     def remove_cart_item(cart_item_id: int):
         """Remove item from cart"""
-        try:
-            user_id = session.get('user_id')
-            
-            # Create input data
-            input_data = RemoveCartItemInputData(
-                user_id=user_id,
-                cart_item_id=cart_item_id
-            )
-            
-            # Execute use case
-            output_data = remove_cart_item_use_case.execute(input_data)
-            
-            if not output_data.success:
-                return jsonify({
-                    'success': False,
-                    'error': output_data.error_message
-                }), 400
-            
-            # Convert to response
-            return jsonify({
-                'success': True,
-                'message': output_data.message
-            }), 200
-            
-        except Exception as e:
+        user_id = session.get('user_id')
+        
+        # Create input data
+        input_data = RemoveCartItemInputData(
+            user_id=user_id,
+            cart_item_id=cart_item_id
+        )
+        
+        # Execute use case
+        output_data = remove_cart_item_use_case.execute(input_data)
+        
+        if not output_data.success:
             return jsonify({
                 'success': False,
-                'error': str(e)
-            }), 500
+                'error': output_data.error_message
+            }), 400
+        
+        # Convert to response
+        return jsonify({
+            'success': True,
+            'message': output_data.message
+        }), 200
     
     return cart_bp
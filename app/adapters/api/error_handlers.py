@@ -0,0 +1,32 @@
+"""
+Error Handlers - Decorators that turn unexpected failures into HTTP responses
+"""
+from functools import wraps
+from flask import current_app, jsonify
+
+
+def use_case_error_boundary(f):
+    """
+    Decorator to catch unexpected errors raised while a route runs a use case.
+    
+    Use cases only report expected business failures in their output data;
+    anything else propagates here, is logged once with its traceback and
+    answered with a generic 500 so internals are not leaked to the client.
+    
+    Usage:
+        @app.route('/products')
+        @use_case_error_boundary
+        def list_products():
+            ...
+    """
+    @wraps(f)
+    def decorated_function(*args, **kwargs):
+        try:
+            return f(*args, **kwargs)
+        except Exception:
+            current_app.logger.exception("Unhandled error in %s", f.__name__)
+            return jsonify({
+                'success': False,
+                'error': 'Internal server error'
+            }), 500
+    return decorated_function
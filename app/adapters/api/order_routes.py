@@ -14,6 +14,7 @@ from app.business.use_cases.cancel_order_use_case import (
     CancelOrderInputData
 )
 from app.adapters.api.auth_helpers import login_required
+from app.adapters.api.error_handlers import use_case_error_boundary
 from app.domain.exceptions import ValidationException, OrderNotFoundException
 
 
@@ -29,50 +30,44 @@ def create_order_routes(
     
     @order_bp.route('', methods=['POST'])
     @login_required
+    @use_case_error_boundary
     def place_order():
         """Place a new order from cart"""
-        try:
-            user_id = session.get('user_id')
-            data = request.get_json(silent=True)  # Use silent=True to avoid 415 errors
-            
-            # Validate required fields
-            if not data or 'shipping_address' not in data or 'phone_number' not in data or 'payment_method' not in data:
-                return jsonify({
-                    'success': False,
-                    'error': 'Shipping address, phone number, and payment method are required'
-                }), 400
-            
-            # Create input data
-            input_data = PlaceOrderInputData(
-                user_id=user_id,
-                shipping_address=data['shipping_address'],
-                phone_number=data['phone_number'],
-                payment_method=data['payment_method'],
-                notes=data.get('notes', '')
-            )
-            
-            # Execute use case
-            output_data = place_order_use_case.execute(input_data)
-            
-            if not output_data.success:
-                return jsonify({
-                    'success': False,
-                    'error': output_data.error_message
-                }), 400
-            
-            # Convert to response
+        user_id = session.get('user_id')
+        data = request.get_json(silent=True)  # Use silent=True to avoid 415 errors
+        
+        # Validate required fields
+        if not data or 'shipping_address' not in data or 'phone_number' not in data or 'payment_method' not in data:
             return jsonify({
-                'success': True,
-                'message': output_data.message,
-                'order_id': output_data.order_id,
-                'total_amount': output_data.total_amount
-            }), 201
-            
-        except Exception as e:
+                'success': False,
+                'error': 'Shipping address, phone number, and payment method are required'
+            }), 400
+        
+        # Create input data
+        input_data = PlaceOrderInputData(
+            user_id=user_id,
+            shipping_address=data['shipping_address'],
+            phone_number=data['phone_number'],
+            payment_method=data['payment_method'],
+            notes=data.get('notes', '')
+        )
+        
+        # Execute use case
+        output_data = place_order_use_case.execute(input_data)
+        
+        if not output_data.success:
             return jsonify({
                 'success': False,
-                'error': str(e)
-            }), 500
+                'error': output_data.error_message
+            }), 400
+        
+        # Convert to response
+        return jsonify({
+            'success': True,
+            'message': output_data.message,
+            'order_id': output_data.order_id,
+            'total_amount': output_data.total_amount
+        }), 201
     
     @order_bp.route('/my-orders', methods=['GET'])
     @login_required
@@ -7,6 +7,8 @@ from .brand_repository_adapter import BrandRepositoryAdapter
 from .category_repository_adapter import CategoryRepositoryAdapter
 from .cart_repository_adapter import CartRepositoryAdapter
 from .order_repository_adapter import OrderRepositoryAdapter
+from .caching_repository_adapters import CachingCategoryRepository, CachingBrandRepository
+from .unit_of_work import SqlAlchemyUnitOfWork
 
 __all__ = [
     'UserRepositoryAdapter',
@@ -14,5 +16,8 @@ __all__ = [
     'BrandRepositoryAdapter',
     'CategoryRepositoryAdapter',
     'CartRepositoryAdapter',
-    'OrderRepositoryAdapter'
+    'OrderRepositoryAdapter',
+    'CachingCategoryRepository',
+    'CachingBrandRepository',
+    'SqlAlchemyUnitOfWork'
 ]
@@ -3,10 +3,13 @@ Brand Repository Adapter - Infrastructure Implementation
 Implements IBrandRepository port from Business layer
 """
 from typing import Optional, List
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ...business.ports.brand_repository import IBrandRepository
 from ...domain.entities import Brand
+from ...domain.exceptions import BrandNotFoundException, BrandAlreadyExistsException
 from ...infrastructure.database.models import BrandModel
 
 
@@ -53,12 +56,18 @@ class BrandRepositoryAdapter(IBrandRepository):
         return None
     
     def find_all(self, active_only: bool = True) -> List[Brand]:
-        """Find all brands"""
-        query = self._session.query(BrandModel)
+        """Find all brands (selects plain columns, no ORM objects)"""
+        query = self._session.query(
+            BrandModel.brand_id,
+            BrandModel.name,
+            BrandModel.description,
+            BrandModel.logo_url,
+            BrandModel.is_active,
+            BrandModel.created_at
+        )
         if active_only:
             query = query.filter(BrandModel.is_active == True)
-        brand_models = query.all()
-        return [self._to_domain_entity(model) for model in brand_models]
+        return Brand.reconstruct_many(query.all())
     
     def delete(self, brand_id: int) -> bool:
         """Delete brand"""
@@ -73,6 +82,50 @@ class BrandRepositoryAdapter(IBrandRepository):
         """Check if brand name exists"""
         return self._session.query(BrandModel).filter_by(name=name).count() > 0
     
+    def update_details_atomic(
+        self,
+        brand_id: int,
+        name: str,
+        description: Optional[str],
+        logo_url: Optional[str]
+    ) -> Brand:
+        """Update brand with one UPDATE ... RETURNING; duplicates hit the unique name constraint"""
+        try:
+            row = self._session.execute(
+                update(BrandModel)
+                .where(BrandModel.brand_id == brand_id)
+                .values(
+                    name=name,
+                    description=Brand.normalize_description(description),
+                    logo_url=logo_url
+                )
+                .returning(
+                    BrandModel.brand_id,
+                    BrandModel.name,
+                    BrandModel.description,
+                    BrandModel.logo_url,
+                    BrandModel.is_active,
+                    BrandModel.created_at
+                )
+                .execution_options(synchronize_session=False)
+            ).first()
+        except IntegrityError:
+            self._session.rollback()
+            raise BrandAlreadyExistsException(name)
+        
+        if row is None:
+            raise BrandNotFoundException(brand_id)
+        
+        self._session.commit()
+        return Brand.reconstruct(
+            brand_id=row.brand_id,
+            name=row.name,
+            description=row.description,
+            logo_url=row.logo_url,
+            is_active=row.is_active,
+            created_at=row.created_at
+        )
+    
     def count(self, active_only: bool = True) -> int:
         """Count total brands"""
         return self._session.query(BrandModel).count()
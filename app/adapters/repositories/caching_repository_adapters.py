@@ -0,0 +1,144 @@
+"""
+Caching Repository Adapters - Read-through caches for category/brand lookups
+Wrap the SQLAlchemy adapters and implement the same ports
+
+Categories and brands change rarely compared to how often the catalog
+resolves their names, so find_by_id results are kept in a TTL cache and
+invalidated on every write going through the same repository.
+"""
+import copy
+from typing import Optional, List
+
+from ...business.ports.category_repository import ICategoryRepository
+from ...business.ports.brand_repository import IBrandRepository
+from ...domain.entities import Category, Brand
+from .lookup_cache import TTLCache
+
+
+class CachingCategoryRepository(ICategoryRepository):
+    """Category repository decorator caching find_by_id lookups"""
+    
+    def __init__(self, inner: ICategoryRepository, maxsize: int = 1024, ttl: float = 300.0):
+        """
+        Args:
+            inner: Repository doing the real data access
+            maxsize: Maximum cached categories
+            ttl: Seconds before a cached category is reloaded
+        """
+        self._inner = inner
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+    
+    def save(self, category: Category) -> Category:
+        """Save category and drop its cached copy"""
+        try:
+            return self._inner.save(category)
+        finally:
+            if category.id is not None:
+                self._cache.pop(category.id)
+    
+    def find_by_id(self, category_id: int) -> Optional[Category]:
+        """Find category by ID, served from cache when possible"""
+        cached = self._cache.get(category_id)
+        if cached is None:
+            cached = self._inner.find_by_id(category_id)
+            if cached is None:
+                return None
+            self._cache.set(category_id, cached)
+        # Hand out a copy so callers mutating the entity never touch the cache
+        return copy.copy(cached)
+    
+    def find_by_name(self, name: str) -> Optional[Category]:
+        return self._inner.find_by_name(name)
+    
+    def find_all(self, active_only: bool = True) -> List[Category]:
+        return self._inner.find_all(active_only=active_only)
+    
+    def delete(self, category_id: int) -> bool:
+        """Delete category and drop its cached copy"""
+        try:
+            return self._inner.delete(category_id)
+        finally:
+            self._cache.pop(category_id)
+    
+    def exists_by_name(self, name: str) -> bool:
+        return self._inner.exists_by_name(name)
+    
+    def update_details_atomic(
+        self,
+        category_id: int,
+        name: str,
+        description: Optional[str]
+    ) -> Category:
+        """Update category and drop its cached copy"""
+        try:
+            return self._inner.update_details_atomic(category_id, name, description)
+        finally:
+            self._cache.pop(category_id)
+    
+    def count(self, active_only: bool = True) -> int:
+        return self._inner.count(active_only=active_only)
+
+
+class CachingBrandRepository(IBrandRepository):
+    """Brand repository decorator caching find_by_id lookups"""
+    
+    def __init__(self, inner: IBrandRepository, maxsize: int = 1024, ttl: float = 300.0):
+        """
+        Args:
+            inner: Repository doing the real data access
+            maxsize: Maximum cached brands
+            ttl: Seconds before a cached brand is reloaded
+        """
+        self._inner = inner
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+    
+    def save(self, brand: Brand) -> Brand:
+        """Save brand and drop its cached copy"""
+        try:
+            return self._inner.save(brand)
+        finally:
+            if brand.id is not None:
+                self._cache.pop(brand.id)
+    
+    def find_by_id(self, brand_id: int) -> Optional[Brand]:
+        """Find brand by ID, served from cache when possible"""
+        cached = self._cache.get(brand_id)
+        if cached is None:
+            cached = self._inner.find_by_id(brand_id)
+            if cached is None:
+                return None
+            self._cache.set(brand_id, cached)
+        # Hand out a copy so callers mutating the entity never touch the cache
+        return copy.copy(cached)
+    
+    def find_by_name(self, name: str) -> Optional[Brand]:
+        return self._inner.find_by_name(name)
+    
+    def find_all(self, active_only: bool = True) -> List[Brand]:
+        return self._inner.find_all(active_only=active_only)
+    
+    def delete(self, brand_id: int) -> bool:
+        """Delete brand and drop its cached copy"""
+        try:
+            return self._inner.delete(brand_id)
+        finally:
+            self._cache.pop(brand_id)
+    
+    def exists_by_name(self, name: str) -> bool:
+        return self._inner.exists_by_name(name)
+    
+    def update_details_atomic(
+        self,
+        brand_id: int,
+        name: str,
+        description: Optional[str],
+        logo_url: Optional[str]
+    ) -> Brand:
+        """Update brand and drop its cached copy"""
+        try:
+            return self._inner.update_details_atomic(brand_id, name, description, logo_url)
+        finally:
+            self._cache.pop(brand_id)
+    
+    def count(self, active_only: bool = True) -> int:
+        return self._inner.count(active_only=active_only)
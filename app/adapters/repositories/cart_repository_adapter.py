@@ -1,12 +1,22 @@
 """Cart Repository Adapter - Infrastructure implementation of cart persistence."""
 from typing import Optional
+from sqlalchemy import select, update
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload
 
-from ...business.ports.cart_repository import ICartRepository
+from ...business.ports.cart_repository import (
+    ICartRepository,
+    CartItemUpdateStatus,
+    CartItemUpdateResult,
+    CartLineView,
+    CartView
+)
 from ...domain.entities.cart import Cart, CartItem
+from ...domain.value_objects.money import Money, VND
 from ...infrastructure.config.database import get_session
 from ...infrastructure.database.models.cart_model import CartModel, CartItemModel
+from ...infrastructure.database.models.product_model import ProductModel
+from .unit_of_work import commit_or_flush, in_unit_of_work
 
 
 class CartRepositoryAdapter(ICartRepository):
@@ -95,6 +105,97 @@ class CartRepositoryAdapter(ICartRepository):
         """
         return self.find_by_customer_id(user_id)
     
+    def find_by_user_id_with_items(self, user_id: int) -> Optional[Cart]:
+        """
+        Find a user's cart and its items with a single JOIN query.
+        
+        Only the cart item rows are joined: the domain cart carries product
+        IDs, so product columns are not loaded.
+        
+        Args:
+            user_id: User ID to find cart for
+            
+        Returns:
+            Cart entity with items if found, None otherwise
+        """
+        session = self._session or get_session()
+        try:
+            cart_model = (session.query(CartModel)
+                         .options(joinedload(CartModel.items))
+                         .filter(CartModel.user_id == user_id)
+                         .first())
+            
+            if not cart_model:
+                return None
+            
+            return self._to_domain_entity(cart_model)
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
+    def find_cart_view(self, user_id: int) -> Optional[CartView]:
+        """
+        Load a user's cart items with their product details in one JOIN query.
+        
+        Only the columns needed to display the cart are selected and no
+        entities are built. Items whose product is gone are counted in
+        item_count but get no line, matching a product lookup miss.
+        
+        Args:
+            user_id: User ID to find cart for
+            
+        Returns:
+            CartView if the user has a cart, None otherwise
+        """
+        session = self._session or get_session()
+        try:
+            rows = (session.query(
+                        CartModel.cart_id,
+                        CartItemModel.cart_item_id,
+                        CartItemModel.quantity,
+                        ProductModel.product_id,
+                        ProductModel.name,
+                        ProductModel.image_url,
+                        ProductModel.price,
+                        ProductModel.stock_quantity,
+                        ProductModel.is_visible
+                    )
+                    .select_from(CartModel)
+                    .outerjoin(CartItemModel, CartItemModel.cart_id == CartModel.cart_id)
+                    .outerjoin(ProductModel, ProductModel.product_id == CartItemModel.product_id)
+                    .filter(CartModel.user_id == user_id)
+                    .order_by(CartItemModel.cart_item_id)
+                    .all())
+            
+            if not rows:
+                return None
+            
+            return CartView(
+                cart_id=rows[0].cart_id,
+                item_count=sum(1 for row in rows if row.cart_item_id is not None),
+                lines=tuple(
+                    CartLineView(
+                        cart_item_id=row.cart_item_id,
+                        quantity=row.quantity,
+                        product_id=row.product_id,
+                        product_name=row.name,
+                        product_image=row.image_url,
+                        price=Money(float(row.price), VND),
+                        stock_quantity=row.stock_quantity,
+                        is_visible=row.is_visible
+                    )
+                    for row in rows
+                    if row.product_id is not None
+                )
+            )
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
     def create_cart(self, user_id: int) -> Cart:
         """
         Create a new empty cart for a user.
@@ -188,6 +289,42 @@ class CartRepositoryAdapter(ICartRepository):
         finally:
             session.close()
     
+    def find_cart_item_for_user(self, user_id: int, cart_item_id: int) -> Optional[CartItem]:
+        """
+        Find a cart item in the user's cart with a single joined query.
+        
+        Args:
+            user_id: Owner's user ID
+            cart_item_id: Cart item ID
+            
+        Returns:
+            CartItem if it exists in the user's cart, None otherwise
+        """
+        session = self._session or get_session()
+        try:
+            item_model = (session.query(CartItemModel)
+                          .join(CartModel, CartModel.cart_id == CartItemModel.cart_id)
+                          .filter(
+                              CartItemModel.cart_item_id == cart_item_id,
+                              CartModel.user_id == user_id
+                          )
+                          .first())
+            
+            if not item_model:
+                return None
+            
+            return CartItem(
+                product_id=item_model.product_id,
+                quantity=item_model.quantity,
+                cart_item_id=item_model.cart_item_id,
+                cart_id=item_model.cart_id
+            )
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
     def add_item_to_cart(self, cart_id: int, product_id: int, quantity: int) -> CartItem:
         """
         Add a new item to the cart.
@@ -259,6 +396,88 @@ class CartRepositoryAdapter(ICartRepository):
         finally:
             session.close()
     
+    def try_update_quantity(
+        self,
+        user_id: int,
+        cart_item_id: int,
+        new_quantity: int
+    ) -> CartItemUpdateResult:
+        """
+        Set quantity with one conditional UPDATE ... RETURNING.
+        
+        The statement only matches when the item is in the user's cart and the
+        product has enough stock. When nothing matches, a single diagnostic
+        SELECT works out why.
+        
+        Args:
+            user_id: Owner's user ID
+            cart_item_id: Cart item ID
+            new_quantity: Quantity to set
+            
+        Returns:
+            CartItemUpdateResult describing the outcome
+        """
+        session = self._session or get_session()
+        try:
+            user_cart_ids = select(CartModel.cart_id).where(CartModel.user_id == user_id)
+            product_stock = (select(ProductModel.stock_quantity)
+                             .where(ProductModel.product_id == CartItemModel.product_id)
+                             .scalar_subquery())
+            
+            row = session.execute(
+                update(CartItemModel)
+                .where(
+                    CartItemModel.cart_item_id == cart_item_id,
+                    CartItemModel.cart_id.in_(user_cart_ids),
+                    product_stock >= new_quantity
+                )
+                .values(quantity=new_quantity)
+                .returning(
+                    CartItemModel.cart_item_id,
+                    CartItemModel.cart_id,
+                    CartItemModel.product_id,
+                    CartItemModel.quantity
+                )
+                .execution_options(synchronize_session=False)
+            ).first()
+            
+            if row:
+                session.commit()
+                return CartItemUpdateResult(
+                    status=CartItemUpdateStatus.OK,
+                    cart_item=CartItem(
+                        product_id=row.product_id,
+                        quantity=row.quantity,
+                        cart_item_id=row.cart_item_id,
+                        cart_id=row.cart_id
+                    )
+                )
+            
+            # Nothing updated: find out which condition failed
+            diagnosis = session.execute(
+                select(CartModel.user_id, ProductModel.stock_quantity)
+                .select_from(CartItemModel)
+                .join(CartModel, CartModel.cart_id == CartItemModel.cart_id)
+                .outerjoin(ProductModel, ProductModel.product_id == CartItemModel.product_id)
+                .where(CartItemModel.cart_item_id == cart_item_id)
+            ).first()
+            
+            if not diagnosis:
+                return CartItemUpdateResult(status=CartItemUpdateStatus.NOT_FOUND)
+            if diagnosis.user_id != user_id:
+                return CartItemUpdateResult(status=CartItemUpdateStatus.NOT_YOURS)
+            if diagnosis.stock_quantity is None:
+                return CartItemUpdateResult(status=CartItemUpdateStatus.PRODUCT_UNAVAILABLE)
+            return CartItemUpdateResult(
+                status=CartItemUpdateStatus.INSUFFICIENT_STOCK,
+                available_stock=diagnosis.stock_quantity
+            )
+        except Exception as e:
+            session.rollback()
+            raise e
+        finally:
+            session.close()
+    
     def save(self, cart: Cart) -> Cart:
         """
         Save cart (create or update).
@@ -269,6 +488,8 @@ class CartRepositoryAdapter(ICartRepository):
         Returns:
             Saved cart entity with updated ID
         """
+        # Stamp updated_at once for every mutation made since the last save
+        cart.touch_updated_at()
         session = self._session or get_session()
         try:
             if cart.id is None:
@@ -353,13 +574,14 @@ class CartRepositoryAdapter(ICartRepository):
                 CartItemModel.cart_id == cart_model.cart_id
             ).delete()
             
-            session.commit()
+            commit_or_flush(session)
             return True
         except Exception as e:
             session.rollback()
             raise e
         finally:
-            session.close()
+            if not in_unit_of_work(session):
+                session.close()
     
     def remove_cart_item(self, cart_item_id: int) -> bool:
         """
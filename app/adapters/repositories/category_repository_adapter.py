@@ -3,10 +3,13 @@ Category Repository Adapter - Infrastructure Implementation
 Implements ICategoryRepository port from Business layer
 """
 from typing import Optional, List
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from ...business.ports.category_repository import ICategoryRepository
 from ...domain.entities import Category
+from ...domain.exceptions import CategoryNotFoundException, CategoryAlreadyExistsException
 from ...infrastructure.database.models import CategoryModel
 
 
@@ -53,11 +56,15 @@ class CategoryRepositoryAdapter(ICategoryRepository):
         return None
     
     def find_all(self, active_only: bool = True) -> List[Category]:
-        """Find all categories"""
-        query = self._session.query(CategoryModel)
+        """Find all categories (selects plain columns, no ORM objects)"""
+        query = self._session.query(
+            CategoryModel.category_id,
+            CategoryModel.name,
+            CategoryModel.description,
+            CategoryModel.created_at
+        )
         # Note: categories table does not have is_active column in SQL Server schema
-        category_models = query.all()
-        return [self._to_domain_entity(model) for model in category_models]
+        return Category.reconstruct_many(query.all())
     
     def delete(self, category_id: int) -> bool:
         """Delete category"""
@@ -72,6 +79,44 @@ class CategoryRepositoryAdapter(ICategoryRepository):
         """Check if category name exists"""
         return self._session.query(CategoryModel).filter_by(name=name).count() > 0
     
+    def update_details_atomic(
+        self,
+        category_id: int,
+        name: str,
+        description: Optional[str]
+    ) -> Category:
+        """Update category with one UPDATE ... RETURNING; duplicates hit the unique name constraint"""
+        try:
+            row = self._session.execute(
+                update(CategoryModel)
+                .where(CategoryModel.category_id == category_id)
+                .values(
+                    name=name,
+                    description=Category.normalize_description(description)
+                )
+                .returning(
+                    CategoryModel.category_id,
+                    CategoryModel.name,
+                    CategoryModel.description,
+                    CategoryModel.created_at
+                )
+                .execution_options(synchronize_session=False)
+            ).first()
+        except IntegrityError:
+            self._session.rollback()
+            raise CategoryAlreadyExistsException(name)
+        
+        if row is None:
+            raise CategoryNotFoundException(category_id)
+        
+        self._session.commit()
+        return Category.reconstruct(
+            category_id=row.category_id,
+            name=row.name,
+            description=row.description,
+            created_at=row.created_at
+        )
+    
     def count(self, active_only: bool = True) -> int:
         """Count total categories"""
         return self._session.query(CategoryModel).count()
@@ -0,0 +1,69 @@
+"""
+Lookup Cache - In-process TTL + LRU cache for read-mostly repository lookups
+Infrastructure helper used by caching repository decorators
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class TTLCache:
+    """
+    Small thread-safe LRU cache whose entries expire after a fixed TTL
+    
+    Repositories are shared by every request of the Flask app, so the cache
+    is guarded by a lock.
+    """
+    
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """
+        Args:
+            maxsize: Maximum number of entries kept (least recently used evicted first)
+            ttl: Seconds an entry stays valid
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache maxsize must be positive")
+        if ttl <= 0:
+            raise ValueError("Cache ttl must be positive")
+        
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: 'OrderedDict[Hashable, tuple]' = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return cached value or None if missing/expired"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            
+            self._entries.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any):
+        """Store value under key"""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self._ttl)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+    
+    def pop(self, key: Hashable):
+        """Invalidate a single key"""
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def clear(self):
+        """Invalidate every key"""
+        with self._lock:
+            self._entries.clear()
+    
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,14 +3,16 @@ from typing import Optional, List, Tuple
 from datetime import datetime
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import joinedload
-from sqlalchemy import func
+from sqlalchemy import exists, func, update
 
 from ...business.ports.order_repository import IOrderRepository
 from ...domain.entities.order import Order, OrderItem
-from ...domain.value_objects.money import Money
+from ...domain.value_objects.money import Money, VND
 from ...domain.enums import OrderStatus, PaymentMethod
+from ...domain.exceptions import ConcurrencyConflictException
 from ...infrastructure.config.database import get_session
 from ...infrastructure.database.models.order_model import OrderModel, OrderItemModel
+from .unit_of_work import commit_or_flush, in_unit_of_work
 
 
 class OrderRepositoryAdapter(IOrderRepository):
@@ -35,6 +37,9 @@ class OrderRepositoryAdapter(IOrderRepository):
             
         Returns:
             Saved order entity with updated ID
+            
+        Raises:
+            ConcurrencyConflictException: If an existing order changed since it was read
         """
         session = self._session or get_session()
         try:
@@ -45,23 +50,31 @@ class OrderRepositoryAdapter(IOrderRepository):
                 session.flush()  # Get the ID
                 order = self._to_domain_entity(order_model)
             else:
-                # Update existing order
-                order_model = session.query(OrderModel).filter(
-                    OrderModel.order_id == order.id
-                ).first()
+                # Update existing order only if nobody changed it since it was read
+                result = session.execute(
+                    update(OrderModel)
+                    .where(OrderModel.order_id == order.id, OrderModel.version == order.version)
+                    .values(**self._column_values(order), version=OrderModel.version + 1)
+                    .execution_options(synchronize_session=False)
+                )
                 
-                if not order_model:
-                    raise ValueError(f"Order with id {order.id} not found")
+                if result.rowcount == 0:
+                    if not session.query(exists().where(OrderModel.order_id == order.id)).scalar():
+                        raise ValueError(f"Order with id {order.id} not found")
+                    raise ConcurrencyConflictException('Order', order.id)
                 
-                self._update_model_from_entity(order_model, order, session)
+                commit_or_flush(session)
+                order.increment_version()
+                return order
             
-            session.commit()
+            commit_or_flush(session)
             return order
         except Exception as e:
             session.rollback()
             raise e
         finally:
-            session.close()
+            if not in_unit_of_work(session):
+                session.close()
     
     def find_by_id(self, order_id: int) -> Optional[Order]:
         """
@@ -332,12 +345,12 @@ class OrderRepositoryAdapter(IOrderRepository):
                 product_id=item_model.product_id,
                 product_name=item_model.product_name,
                 quantity=item_model.quantity,
-                unit_price=Money(item_model.unit_price, 'VND')
+                unit_price=Money(item_model.unit_price, VND)
             )
             order_items.append(order_item)
         
         # Reconstruct order with items
-        # Order.reconstruct(order_id, customer_id, items, payment_method, shipping_address, phone_number, notes, status, total_amount, created_at, updated_at)
+        # Order.reconstruct(order_id, customer_id, items, payment_method, shipping_address, phone_number, notes, status, total_amount, created_at, updated_at, version)
         return Order.reconstruct(
             order_id=order_model.order_id,
             customer_id=order_model.user_id,
@@ -347,9 +360,10 @@ class OrderRepositoryAdapter(IOrderRepository):
             phone_number=order_model.phone_number,
             notes=order_model.notes or "",
             status=OrderStatus(order_model.order_status),
-            total_amount=Money(order_model.total_amount, 'VND'),
+            total_amount=Money(order_model.total_amount, VND),
             created_at=order_model.created_at,
-            updated_at=order_model.created_at  # OrderModel doesn't have updated_at
+            updated_at=order_model.created_at,  # OrderModel doesn't have updated_at
+            version=order_model.version
         )
     
     def _to_orm_model(self, order: Order) -> OrderModel:
@@ -385,25 +399,25 @@ class OrderRepositoryAdapter(IOrderRepository):
         
         return order_model
     
-    def _update_model_from_entity(self, order_model: OrderModel, order: Order, session) -> None:
+    def _column_values(self, order: Order) -> dict:
         """
-        Update existing ORM model from domain entity.
+        Column values of an existing order for a versioned UPDATE.
         
         Args:
-            order_model: Existing OrderModel instance
             order: Order domain entity with updates
-            session: SQLAlchemy session
-        """
-        # Update order fields (typically only status changes after creation)
-        order_model.shipping_address = order.shipping_address
-        order_model.phone_number = order.phone_number
-        order_model.notes = order.notes
-        order_model.order_status = order.status.value
-        order_model.payment_method = order.payment_method.value
-        order_model.total_amount = order.total_amount.amount
-        
-        # Note: Order items are typically not updated after creation
-        # If needed, implement similar logic to cart items update
+            
+        Returns:
+            Mapping of OrderModel column names to values
+        """
+        # Order items are not updated after creation
+        return {
+            'shipping_address': order.shipping_address,
+            'phone_number': order.phone_number,
+            'notes': order.notes,
+            'order_status': order.status.value,
+            'payment_method': order.payment_method.value,
+            'total_amount': order.total_amount.amount
+        }
     
     def delete(self, order_id: int) -> bool:
         """
@@ -529,8 +543,6 @@ class OrderRepositoryAdapter(IOrderRepository):
         """
         session = self._session or get_session()
         try:
-            from sqlalchemy import func
-            
             query = session.query(OrderModel)
             
             # Apply filters if provided
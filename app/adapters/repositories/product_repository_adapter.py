@@ -5,13 +5,14 @@ Implements IProductRepository port from Business layer
 ⚠️  CRITICAL: This adapter MUST follow the port interface EXACTLY
 """
 from typing import Optional, List
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
+from sqlalchemy.orm import Session, aliased
+from sqlalchemy import case, exists, or_, update
 
-from ...business.ports.product_repository import IProductRepository
+from ...business.ports.product_repository import IProductRepository, ProductUpdateContext
 from ...domain.entities import Product
-from ...domain.value_objects import Money
-from ...infrastructure.database.models import ProductModel
+from ...domain.value_objects.money import Money, VND
+from ...infrastructure.database.models import ProductModel, CategoryModel, BrandModel
+from .unit_of_work import commit_or_flush
 
 
 class ProductRepositoryAdapter(IProductRepository):
@@ -56,6 +57,35 @@ class ProductRepositoryAdapter(IProductRepository):
             self._session.rollback()
             raise e
     
+    def save_many(self, products: List[Product]) -> None:
+        """Update existing products with a single executemany UPDATE"""
+        if not products:
+            return
+        
+        try:
+            self._session.execute(
+                update(ProductModel),
+                [
+                    {
+                        'product_id': product.id,
+                        'name': product.name,
+                        'description': product.description,
+                        'price': product.price.amount,
+                        'stock_quantity': product.stock_quantity,
+                        'category_id': product.category_id,
+                        'brand_id': product.brand_id,
+                        'image_url': product.image_url,
+                        'is_visible': product.is_visible
+                    }
+                    for product in products
+                ]
+            )
+            commit_or_flush(self._session)
+            
+        except Exception as e:
+            self._session.rollback()
+            raise e
+    
     def find_by_id(self, product_id: int) -> Optional[Product]:
         """Find product by ID"""
         product_model = self._session.query(ProductModel).filter_by(product_id=product_id).first()
@@ -63,52 +93,70 @@ class ProductRepositoryAdapter(IProductRepository):
             return self._to_domain_entity(product_model)
         return None
     
-    def find_all(self, skip: int = 0, limit: int = 100, visible_only: bool = True) -> List[Product]:
+    def find_all(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        visible_only: bool = True,
+        available_only: bool = False
+    ) -> List[Product]:
         """Find all products with pagination"""
         query = self._session.query(ProductModel)
         
-        if visible_only:
+        if visible_only or available_only:
             query = query.filter_by(is_visible=True)
+        if available_only:
+            query = query.filter(ProductModel.stock_quantity > 0)
         
         product_models = query.order_by(ProductModel.product_id).offset(skip).limit(limit).all()
         return [self._to_domain_entity(model) for model in product_models]
     
-    def find_by_category(self, category_id: int, skip: int = 0, limit: int = 100) -> List[Product]:
+    def find_by_category(
+        self,
+        category_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        available_only: bool = False
+    ) -> List[Product]:
         """Find products by category"""
-        product_models = (
-            self._session.query(ProductModel)
-            .filter_by(category_id=category_id, is_visible=True)
-            .order_by(ProductModel.product_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = self._session.query(ProductModel).filter_by(category_id=category_id, is_visible=True)
+        if available_only:
+            query = query.filter(ProductModel.stock_quantity > 0)
+        
+        product_models = query.order_by(ProductModel.product_id).offset(skip).limit(limit).all()
         return [self._to_domain_entity(model) for model in product_models]
     
-    def find_by_brand(self, brand_id: int, skip: int = 0, limit: int = 100) -> List[Product]:
+    def find_by_brand(
+        self,
+        brand_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        available_only: bool = False
+    ) -> List[Product]:
         """Find products by brand"""
-        product_models = (
-            self._session.query(ProductModel)
-            .filter_by(brand_id=brand_id, is_visible=True)
-            .order_by(ProductModel.product_id)
-            .offset(skip)
-            .limit(limit)
-            .all()
-        )
+        query = self._session.query(ProductModel).filter_by(brand_id=brand_id, is_visible=True)
+        if available_only:
+            query = query.filter(ProductModel.stock_quantity > 0)
+        
+        product_models = query.order_by(ProductModel.product_id).offset(skip).limit(limit).all()
         return [self._to_domain_entity(model) for model in product_models]
     
-    def search_by_name(self, query: str, skip: int = 0, limit: int = 100) -> List[Product]:
+    def search_by_name(
+        self,
+        query: str,
+        skip: int = 0,
+        limit: int = 100,
+        available_only: bool = False
+    ) -> List[Product]:
         """Search products by name"""
-        product_models = (
-            self._session.query(ProductModel)
-            .filter(
-                ProductModel.name.ilike(f'%{query}%'),
-                ProductModel.is_visible == True
-            )
-            .offset(skip)
-            .limit(limit)
-            .all()
+        product_query = self._session.query(ProductModel).filter(
+            ProductModel.name.ilike(f'%{query}%'),
+            ProductModel.is_visible == True
         )
+        if available_only:
+            product_query = product_query.filter(ProductModel.stock_quantity > 0)
+        
+        product_models = product_query.offset(skip).limit(limit).all()
         return [self._to_domain_entity(model) for model in product_models]
     
     def find_by_ids(self, product_ids: List[int]) -> List[Product]:
@@ -127,6 +175,37 @@ class ProductRepositoryAdapter(IProductRepository):
             return self._to_domain_entity(product_model)
         return None
     
+    def fetch_update_context(
+        self,
+        product_id: int,
+        category_id: int,
+        brand_id: int,
+        name: str
+    ) -> Optional[ProductUpdateContext]:
+        """Load product with category/brand existence and name conflict flags in one SELECT"""
+        other = aliased(ProductModel)
+        
+        def flag(*conditions):
+            # CASE WHEN EXISTS: SQL Server does not allow a bare EXISTS in the select list
+            return case((exists().where(*conditions), True), else_=False)
+        
+        row = self._session.query(
+            ProductModel,
+            flag(CategoryModel.category_id == category_id).label('category_exists'),
+            flag(BrandModel.brand_id == brand_id).label('brand_exists'),
+            flag(other.name == name, other.product_id != product_id).label('name_taken')
+        ).filter(ProductModel.product_id == product_id).first()
+        
+        if row is None:
+            return None
+        
+        return ProductUpdateContext(
+            product=self._to_domain_entity(row[0]),
+            category_exists=bool(row.category_exists),
+            brand_exists=bool(row.brand_exists),
+            name_taken=bool(row.name_taken)
+        )
+    
     def delete(self, product_id: int) -> bool:
         """Delete product"""
         product_model = self._session.query(ProductModel).filter_by(product_id=product_id).first()
@@ -172,7 +251,7 @@ class ProductRepositoryAdapter(IProductRepository):
             product_id=model.product_id,
             name=model.name,
             description=model.description,
-            price=Money(float(model.price), 'VND'),
+            price=Money(float(model.price), VND),
             stock_quantity=model.stock_quantity,
             category_id=model.category_id,
             brand_id=model.brand_id,
@@ -0,0 +1,55 @@
+"""
+SQLAlchemy Unit of Work - Infrastructure Implementation
+Implements IUnitOfWork port from Business layer
+"""
+from sqlalchemy.orm import Session
+
+from ...business.ports.unit_of_work import IUnitOfWork
+
+# Session.info key marking a session whose writes are owned by a unit of work
+_UNIT_OF_WORK_KEY = 'unit_of_work'
+
+
+def in_unit_of_work(session: Session) -> bool:
+    """Return True while a unit of work owns the session's transaction"""
+    return session.info.get(_UNIT_OF_WORK_KEY, False)
+
+
+def commit_or_flush(session: Session) -> None:
+    """
+    Commit the session, or only flush it inside a unit of work
+    
+    Repositories call this instead of session.commit() so their writes join
+    an enclosing unit of work and are committed together with it.
+    """
+    if in_unit_of_work(session):
+        session.flush()
+    else:
+        session.commit()
+
+
+class SqlAlchemyUnitOfWork(IUnitOfWork):
+    """Unit of work over the session shared by the participating repositories"""
+    
+    def __init__(self, session: Session):
+        """
+        Args:
+            session: SQLAlchemy session (or scoped session) used by the repositories
+        """
+        self._session = session
+    
+    def __enter__(self) -> 'SqlAlchemyUnitOfWork':
+        self._session.info[_UNIT_OF_WORK_KEY] = True
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self.rollback()
+        finally:
+            self._session.info.pop(_UNIT_OF_WORK_KEY, None)
+    
+    def commit(self) -> None:
+        self._session.commit()
+    
+    def rollback(self) -> None:
+        self._session.rollback()
@@ -6,14 +6,15 @@ Implements IUserRepository port from Business layer
 No modifications to business layer contracts!
 """
 from typing import Optional, List
-from sqlalchemy.orm import Session
+from sqlalchemy import case, exists, literal, update
+from sqlalchemy.orm import Session, aliased
 from sqlalchemy.exc import IntegrityError
 
-from ...business.ports.user_repository import IUserRepository
+from ...business.ports.user_repository import IUserRepository, UserUpdateContext
 from ...domain.entities import User
 from ...domain.enums import UserRole
 from ...domain.value_objects import Email, PhoneNumber
-from ...domain.exceptions import UserAlreadyExistsException
+from ...domain.exceptions import UserAlreadyExistsException, ConcurrencyConflictException
 from ...infrastructure.database.models import UserModel
 
 
@@ -33,25 +34,43 @@ class UserRepositoryAdapter(IUserRepository):
         self._session = session
     
     def save(self, user: User) -> User:
-        """Save user to database"""
+        """
+        Save user to database
+        
+        Existing users are written with a versioned UPDATE that only matches
+        the row version the entity was read with.
+        
+        Raises:
+            ConcurrencyConflictException: If the row changed since it was read
+        """
         try:
             if user.id is None:
                 # Create new user
                 user_model = self._to_orm_model(user)
                 self._session.add(user_model)
             else:
-                # Update existing user
-                user_model = self._session.query(UserModel).filter_by(user_id=user.id).first()
-                if not user_model:
+                # Update existing user only if nobody changed it since it was read
+                result = self._session.execute(
+                    update(UserModel)
+                    .where(UserModel.user_id == user.id, UserModel.version == user.version)
+                    .values(**self._column_values(user), version=UserModel.version + 1)
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount == 0:
+                    if self._session.query(exists().where(UserModel.user_id == user.id)).scalar():
+                        raise ConcurrencyConflictException('User', user.id)
                     # User doesn't exist, create new
                     user_model = self._to_orm_model(user)
                     self._session.add(user_model)
                 else:
-                    # Update existing
-                    self._update_model_from_entity(user_model, user)
+                    user_model = None
             
             self._session.commit()
-            self._session.refresh(user_model)
+            if user_model is None:
+                user.increment_version()
+                user_model = self._session.query(UserModel).filter_by(user_id=user.id).first()
+            else:
+                self._session.refresh(user_model)
             
             return self._to_domain_entity(user_model)
             
@@ -122,6 +141,39 @@ class UserRepositoryAdapter(IUserRepository):
         count = self._session.query(UserModel).filter_by(email=email.address).count()
         return count > 0
     
+    def fetch_for_update(
+        self,
+        user_id: int,
+        candidate_username: Optional[str] = None,
+        candidate_email: Optional[Email] = None
+    ) -> Optional[UserUpdateContext]:
+        """Load user and username/email conflict flags in one SELECT"""
+        other = aliased(UserModel)
+        
+        def taken(column, value):
+            # CASE WHEN EXISTS: SQL Server does not allow a bare EXISTS in the select list
+            if value is None:
+                return literal(False)
+            return case(
+                (exists().where(column == value, other.user_id != user_id), True),
+                else_=False
+            )
+        
+        row = self._session.query(
+            UserModel,
+            taken(other.username, candidate_username).label('username_taken'),
+            taken(other.email, candidate_email.address if candidate_email else None).label('email_taken')
+        ).filter(UserModel.user_id == user_id).first()
+        
+        if row is None:
+            return None
+        
+        return UserUpdateContext(
+            user=self._to_domain_entity(row[0]),
+            username_taken=bool(row.username_taken),
+            email_taken=bool(row.email_taken)
+        )
+    
     def count(self) -> int:
         """Count total users"""
         return self._session.query(UserModel).count()
@@ -197,7 +249,7 @@ class UserRepositoryAdapter(IUserRepository):
         Search users by query string (matches username, full_name, email)
         
         Args:
-            query: Search query string
+            query: Search query string, already lowercased by the caller
             limit: Max results to return
         
         Returns:
@@ -207,7 +259,8 @@ class UserRepositoryAdapter(IUserRepository):
         user_models = self._session.query(UserModel).filter(
             (UserModel.username.ilike(search_term)) |
             (UserModel.full_name.ilike(search_term)) |
-            (UserModel.email.ilike(search_term))
+            # Emails are stored lowercased (Email value object): no LOWER() per row
+            (UserModel.email.like(search_term))
         ).limit(limit).all()
         
         return [self._to_domain_entity(model) for model in user_models]
@@ -259,7 +312,8 @@ class UserRepositoryAdapter(IUserRepository):
             address=model.address,
             role=UserRole.ADMIN if model.role_id == 1 else UserRole.CUSTOMER,
             is_active=model.is_active,
-            created_at=model.created_at
+            created_at=model.created_at,
+            version=model.version
         )
     
     def _to_orm_model(self, entity: User) -> UserModel:
@@ -282,15 +336,17 @@ class UserRepositoryAdapter(IUserRepository):
             created_at=entity.created_at
         )
     
-    def _update_model_from_entity(self, model: UserModel, entity: User):
+    def _column_values(self, entity: User) -> dict:
         """
-        Update existing ORM model from domain entity
+        Column values of an existing user for a versioned UPDATE
         """
-        model.username = entity.username
-        model.email = entity.email.address
-        model.password_hash = entity.password_hash
-        model.full_name = entity.full_name
-        model.phone_number = entity.phone_number.number if entity.phone_number else None
-        model.address = entity.address
-        model.role_id = 1 if entity.role == UserRole.ADMIN else 2
-        model.is_active = entity.is_active
+        return {
+            'username': entity.username,
+            'email': entity.email.address,
+            'password_hash': entity.password_hash,
+            'full_name': entity.full_name,
+            'phone_number': entity.phone_number.number if entity.phone_number else None,
+            'address': entity.address,
+            'role_id': 1 if entity.role == UserRole.ADMIN else 2,
+            'is_active': entity.is_active
+        }
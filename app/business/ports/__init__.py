@@ -1,16 +1,31 @@
 """Ports - Repository and Service Interfaces"""
-from .user_repository import IUserRepository
-from .product_repository import IProductRepository
+from .user_repository import IUserRepository, UserUpdateContext
+from .product_repository import IProductRepository, ProductUpdateContext
 from .order_repository import IOrderRepository
-from .cart_repository import ICartRepository
+from .cart_repository import (
+    ICartRepository,
+    CartItemUpdateStatus,
+    CartItemUpdateResult,
+    CartLineView,
+    CartView
+)
 from .category_repository import ICategoryRepository
 from .brand_repository import IBrandRepository
+from .unit_of_work import IUnitOfWork, NullUnitOfWork
 
 __all__ = [
     'IUserRepository',
+    'UserUpdateContext',
     'IProductRepository',
+    'ProductUpdateContext',
     'IOrderRepository',
     'ICartRepository',
+    'CartItemUpdateStatus',
+    'CartItemUpdateResult',
+    'CartLineView',
+    'CartView',
     'ICategoryRepository',
-    'IBrandRepository'
+    'IBrandRepository',
+    'IUnitOfWork',
+    'NullUnitOfWork'
 ]
@@ -88,6 +88,32 @@ class IBrandRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def update_details_atomic(
+        self,
+        brand_id: int,
+        name: str,
+        description: Optional[str],
+        logo_url: Optional[str]
+    ) -> Brand:
+        """
+        Update a brand's details in a single statement
+        
+        Args:
+            brand_id: ID of the brand to update
+            name: New brand name
+            description: New description
+            logo_url: New logo URL
+            
+        Returns:
+            Updated brand
+            
+        Raises:
+            BrandNotFoundException: If no brand has this ID
+            BrandAlreadyExistsException: If another brand already uses the name
+        """
+        pass
+    
     @abstractmethod
     def count(self, active_only: bool = True) -> int:
         """
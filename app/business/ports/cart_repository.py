@@ -3,8 +3,49 @@ Cart Repository Interface (Port)
 Business layer defines the contract - Infrastructure implements it
 """
 from abc import ABC, abstractmethod
-from typing import Optional
-from ...domain.entities import Cart
+from dataclasses import dataclass
+from enum import Enum
+from typing import Optional, Tuple
+from ...domain.entities import Cart, CartItem
+from ...domain.value_objects import Money
+
+
+class CartItemUpdateStatus(Enum):
+    """Outcome of a conditional cart item quantity update"""
+    OK = "OK"
+    NOT_FOUND = "NOT_FOUND"
+    NOT_YOURS = "NOT_YOURS"
+    PRODUCT_UNAVAILABLE = "PRODUCT_UNAVAILABLE"
+    INSUFFICIENT_STOCK = "INSUFFICIENT_STOCK"
+
+
+@dataclass(frozen=True)
+class CartItemUpdateResult:
+    """Result of ICartRepository.try_update_quantity"""
+    status: CartItemUpdateStatus
+    cart_item: Optional[CartItem] = None  # Updated item when status is OK
+    available_stock: Optional[int] = None  # Set when status is INSUFFICIENT_STOCK
+
+
+@dataclass(frozen=True, slots=True)
+class CartLineView:
+    """One cart item joined with the current state of its product (read model)"""
+    cart_item_id: int
+    quantity: int
+    product_id: int
+    product_name: str
+    product_image: Optional[str]
+    price: Money
+    stock_quantity: int
+    is_visible: bool
+
+
+@dataclass(frozen=True, slots=True)
+class CartView:
+    """Read-only projection of a cart for display, built without the Cart aggregate"""
+    cart_id: int
+    item_count: int  # Every cart item, including those whose product no longer exists
+    lines: Tuple[CartLineView, ...] = ()  # Items whose product still exists
 
 
 class ICartRepository(ABC):
@@ -49,6 +90,34 @@ class ICartRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def find_by_user_id_with_items(self, user_id: int) -> Optional[Cart]:
+        """
+        Find a user's cart with its items loaded in the same query
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            Cart entity with items, or None if not found
+        """
+        pass
+    
+    @abstractmethod
+    def find_cart_view(self, user_id: int) -> Optional[CartView]:
+        """
+        Load a user's cart items with their product details in one JOIN query
+        
+        Read-only path for displaying a cart: no Cart or Product entities are built.
+        
+        Args:
+            user_id: User ID
+            
+        Returns:
+            CartView, or None if the user has no cart
+        """
+        pass
+    
     @abstractmethod
     def delete(self, cart_id: int) -> bool:
         """
@@ -87,3 +156,40 @@ class ICartRepository(ABC):
             True if removed, False if not found
         """
         pass
+    
+    @abstractmethod
+    def find_cart_item_for_user(self, user_id: int, cart_item_id: int) -> Optional[CartItem]:
+        """
+        Find a cart item only if it belongs to the user's cart
+        
+        Args:
+            user_id: Owner's user ID
+            cart_item_id: Cart item ID
+            
+        Returns:
+            CartItem if it exists in the user's cart, None otherwise
+        """
+        pass
+    
+    @abstractmethod
+    def try_update_quantity(
+        self,
+        user_id: int,
+        cart_item_id: int,
+        new_quantity: int
+    ) -> CartItemUpdateResult:
+        """
+        Set a cart item's quantity if it belongs to the user and stock allows it
+        
+        Ownership and stock are checked by the same statement that writes, so
+        no other request can change them in between.
+        
+        Args:
+            user_id: Owner's user ID
+            cart_item_id: Cart item ID
+            new_quantity: Quantity to set
+            
+        Returns:
+            CartItemUpdateResult describing the outcome
+        """
+        pass
@@ -88,6 +88,30 @@ class ICategoryRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def update_details_atomic(
+        self,
+        category_id: int,
+        name: str,
+        description: Optional[str]
+    ) -> Category:
+        """
+        Update a category's details in a single statement
+        
+        Args:
+            category_id: ID of the category to update
+            name: New category name
+            description: New description
+            
+        Returns:
+            Updated category
+            
+        Raises:
+            CategoryNotFoundException: If no category has this ID
+            CategoryAlreadyExistsException: If another category already uses the name
+        """
+        pass
+    
     @abstractmethod
     def count(self, active_only: bool = True) -> int:
         """
@@ -22,6 +22,10 @@ class IOrderRepository(ABC):
             
         Returns:
             Saved order with ID assigned
+            
+        Raises:
+            ConcurrencyConflictException: If an existing order was modified
+                since it was read (its version no longer matches)
         """
         pass
     
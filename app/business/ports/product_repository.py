@@ -3,10 +3,20 @@ Product Repository Interface (Port)
 Business layer defines the contract - Infrastructure implements it
 """
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Optional, List
 from ...domain.entities import Product
 
 
+@dataclass(frozen=True)
+class ProductUpdateContext:
+    """Product to update plus whether its new category/brand exist and its new name is free"""
+    product: Product
+    category_exists: bool = True
+    brand_exists: bool = True
+    name_taken: bool = False
+
+
 class IProductRepository(ABC):
     """Interface for Product repository operations"""
     
@@ -23,6 +33,16 @@ class IProductRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def save_many(self, products: List[Product]) -> None:
+        """
+        Update multiple existing products in one round-trip and transaction
+        
+        Args:
+            products: Product entities that already have an ID
+        """
+        pass
+    
     @abstractmethod
     def find_by_id(self, product_id: int) -> Optional[Product]:
         """
@@ -41,7 +61,8 @@ class IProductRepository(ABC):
         self,
         skip: int = 0,
         limit: int = 100,
-        visible_only: bool = True
+        visible_only: bool = True,
+        available_only: bool = False
     ) -> List[Product]:
         """
         Find all products with pagination
@@ -50,6 +71,7 @@ class IProductRepository(ABC):
             skip: Number of records to skip
             limit: Maximum number of records to return
             visible_only: If True, return only visible products
+            available_only: If True, return only visible products that are in stock
             
         Returns:
             List of product entities
@@ -61,7 +83,8 @@ class IProductRepository(ABC):
         self,
         category_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        available_only: bool = False
     ) -> List[Product]:
         """
         Find products by category
@@ -70,6 +93,7 @@ class IProductRepository(ABC):
             category_id: Category ID
             skip: Number of records to skip
             limit: Maximum number of records to return
+            available_only: If True, return only products that are in stock
             
         Returns:
             List of product entities
@@ -81,7 +105,8 @@ class IProductRepository(ABC):
         self,
         brand_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        available_only: bool = False
     ) -> List[Product]:
         """
         Find products by brand
@@ -90,6 +115,7 @@ class IProductRepository(ABC):
             brand_id: Brand ID
             skip: Number of records to skip
             limit: Maximum number of records to return
+            available_only: If True, return only products that are in stock
             
         Returns:
             List of product entities
@@ -97,7 +123,13 @@ class IProductRepository(ABC):
         pass
     
     @abstractmethod
-    def search_by_name(self, query: str, skip: int = 0, limit: int = 100) -> List[Product]:
+    def search_by_name(
+        self,
+        query: str,
+        skip: int = 0,
+        limit: int = 100,
+        available_only: bool = False
+    ) -> List[Product]:
         """
         Search products by name
         
@@ -105,6 +137,7 @@ class IProductRepository(ABC):
             query: Search query
             skip: Number of records to skip
             limit: Maximum number of records to return
+            available_only: If True, return only products that are in stock
             
         Returns:
             List of product entities matching query
@@ -137,6 +170,28 @@ class IProductRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def fetch_update_context(
+        self,
+        product_id: int,
+        category_id: int,
+        brand_id: int,
+        name: str
+    ) -> Optional[ProductUpdateContext]:
+        """
+        Load a product together with the reference and uniqueness checks for an update
+        
+        Args:
+            product_id: ID of the product being updated
+            category_id: Requested category ID
+            brand_id: Requested brand ID
+            name: Requested product name (checked against other products only)
+            
+        Returns:
+            ProductUpdateContext, or None if the product does not exist
+        """
+        pass
+    
     @abstractmethod
     def delete(self, product_id: int) -> bool:
         """
@@ -0,0 +1,42 @@
+"""
+Unit of Work Interface (Port)
+Groups several repository writes into one transaction
+"""
+from abc import ABC, abstractmethod
+
+
+class IUnitOfWork(ABC):
+    """
+    Interface for a transaction spanning multiple repository calls
+    
+    Writes issued inside the `with` block are buffered until commit();
+    leaving the block without committing rolls them back.
+    """
+    
+    def __enter__(self) -> 'IUnitOfWork':
+        """Begin the unit of work"""
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        """End the unit of work, rolling back anything not committed"""
+        self.rollback()
+    
+    @abstractmethod
+    def commit(self) -> None:
+        """Commit all writes issued inside the unit of work"""
+        pass
+    
+    @abstractmethod
+    def rollback(self) -> None:
+        """Discard all uncommitted writes issued inside the unit of work"""
+        pass
+
+
+class NullUnitOfWork(IUnitOfWork):
+    """Unit of work that does nothing: each repository commits its own writes"""
+    
+    def commit(self) -> None:
+        pass
+    
+    def rollback(self) -> None:
+        pass
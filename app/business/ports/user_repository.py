@@ -3,11 +3,20 @@ User Repository Interface (Port)
 Business layer defines the contract - Infrastructure implements it
 """
 from abc import ABC, abstractmethod
+from dataclasses import dataclass
 from typing import Optional, List
 from ...domain.entities import User
 from ...domain.value_objects import Email
 
 
+@dataclass(frozen=True)
+class UserUpdateContext:
+    """User to update plus whether the requested username/email belong to someone else"""
+    user: User
+    username_taken: bool = False
+    email_taken: bool = False
+
+
 class IUserRepository(ABC):
     """Interface for User repository operations"""
     
@@ -23,7 +32,11 @@ class IUserRepository(ABC):
             Saved user with ID assigned
             
         Raises:
-            UserAlreadyExistsException: If username or email already exists
+            UserAlreadyExistsException: If username or email already exists.
+                Implementations detect this from the database unique
+                constraints, so callers need no exists_by_* pre-check.
+            ConcurrencyConflictException: If an existing user was modified
+                since it was read (its version no longer matches)
         """
         pass
     
@@ -134,6 +147,27 @@ class IUserRepository(ABC):
         """
         pass
     
+    @abstractmethod
+    def fetch_for_update(
+        self,
+        user_id: int,
+        candidate_username: Optional[str] = None,
+        candidate_email: Optional[Email] = None
+    ) -> Optional[UserUpdateContext]:
+        """
+        Load a user together with uniqueness checks for a pending update
+        
+        Args:
+            user_id: ID of the user being updated
+            candidate_username: Requested username (None to skip the check)
+            candidate_email: Requested email (None to skip the check)
+            
+        Returns:
+            UserUpdateContext whose flags are True when another user already
+            has the username/email, or None if the user does not exist
+        """
+        pass
+    
     @abstractmethod
     def count(self) -> int:
         """
@@ -175,7 +209,7 @@ class IUserRepository(ABC):
         Search users by query (username, email, full_name)
         
         Args:
-            query: Search query (minimum 2 characters)
+            query: Search query (minimum 2 characters), already lowercased
             limit: Maximum results (default 50)
             
         Returns:
@@ -66,7 +66,7 @@ class CreateOrderByAdminUseCase:
                     )
             
             # Validate items
-            if not input_data.items or len(input_data.items) == 0:
+            if not input_data.items:
                 return CreateOrderByAdminOutputData(
                     success=False,
                     message="Order must have at least one item"
@@ -8,7 +8,7 @@ from app.business.ports.product_repository import IProductRepository
 from app.business.ports.category_repository import ICategoryRepository
 from app.business.ports.brand_repository import IBrandRepository
 from app.domain.entities.product import Product
-from app.domain.value_objects.money import Money
+from app.domain.value_objects.money import Money, VND
 from app.domain.exceptions import (
     ValidationException,
     CategoryNotFoundException,
@@ -105,7 +105,7 @@ class CreateProductUseCase:
             product = Product(
                 name=input_data.name,
                 description=input_data.description,
-                price=Money(Decimal(str(input_data.price)), 'VND'),
+                price=Money(Decimal(str(input_data.price)), VND),
                 stock_quantity=input_data.stock_quantity,
                 category_id=input_data.category_id,
                 brand_id=input_data.brand_id,
@@ -25,6 +25,9 @@ from ...domain.enums import UserRole
 from ...domain.value_objects import Email, PhoneNumber
 from ...domain.exceptions import UserAlreadyExistsException
 
+# Username: alphanumeric + underscore only (checked with fullmatch)
+_USERNAME_RE = re.compile(r'[A-Za-z0-9_]+')
+
 
 @dataclass
 class CreateUserInputData:
@@ -56,7 +59,7 @@ class CreateUserInputData:
             raise ValueError("Username cannot be empty")
         if len(self.username) < 3 or len(self.username) > 50:
             raise ValueError("Username must be between 3 and 50 characters")
-        if not re.match(r'^[a-zA-Z0-9_]+$', self.username):
+        if not _USERNAME_RE.fullmatch(self.username):
             raise ValueError("Username can only contain letters, numbers, and underscores")
         
         # Validate email
@@ -8,7 +8,7 @@ from decimal import Decimal
 from app.business.ports.order_repository import IOrderRepository
 from app.business.ports.product_repository import IProductRepository
 from app.business.ports.user_repository import IUserRepository
-from app.domain.entities.order import OrderStatus
+from app.domain.entities.order import Order, OrderStatus
 
 
 class GetDashboardStatsOutputData:
@@ -148,8 +148,7 @@ class GetDashboardStatsUseCase:
     def _calculate_total_revenue(self) -> float:
         """Calculate total revenue from completed orders"""
         completed_orders = self.order_repository.find_by_status(OrderStatus.COMPLETED.value)
-        total = sum(order.total_amount.amount for order in completed_orders)
-        return float(total)
+        return float(Order.calculate_totals_bulk(completed_orders).amount)
     
     def _get_revenue_trend(self, start_date: datetime, end_date: datetime, days: int):
         """Get daily revenue for the specified period"""
@@ -167,7 +166,7 @@ class GetDashboardStatsUseCase:
                 status=OrderStatus.COMPLETED.value
             )
             
-            daily_revenue = sum(order.total_amount.amount for order in daily_orders)
+            daily_revenue = Order.calculate_totals_bulk(daily_orders).amount
             
             dates.append(date.strftime('%Y-%m-%d'))
             values.append(float(daily_revenue))
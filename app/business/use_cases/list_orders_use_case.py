@@ -2,13 +2,20 @@
 List Orders Use Case - Admin view all orders with filters and pagination
 Clean Architecture - Business Layer
 """
+from functools import cached_property
 from typing import Optional, List
 from datetime import datetime
 from app.business.ports.order_repository import IOrderRepository
 from app.business.ports.user_repository import IUserRepository
+from app.domain.enums import OrderStatus, PaymentMethod
 from app.domain.exceptions import ValidationException
 
 
+# Enum -> string lookups, built once instead of reading .value per row
+_STATUS_STR = {status: status.value for status in OrderStatus}
+_PAYMENT_METHOD_STR = {method: method.value for method in PaymentMethod}
+
+
 class ListOrdersInputData:
     """Input data for listing orders"""
     
@@ -36,6 +43,11 @@ class ListOrdersInputData:
 class OrderItemOutputData:
     """Output data for a single order in the list"""
     
+    __slots__ = (
+        'order_id', 'customer_id', 'customer_name', 'customer_email', 'total_amount',
+        'status', 'payment_method', 'shipping_address', 'order_date', 'item_count'
+    )
+    
     def __init__(
         self,
         order_id: int,
@@ -71,7 +83,6 @@ class ListOrdersOutputData:
         total_orders: int,
         page: int,
         per_page: int,
-        total_pages: int,
         # Statistics
         total_revenue: float = 0,
         pending_count: int = 0,
@@ -85,13 +96,19 @@ class ListOrdersOutputData:
         self.total_orders = total_orders
         self.page = page
         self.per_page = per_page
-        self.total_pages = total_pages
         self.total_revenue = total_revenue
         self.pending_count = pending_count
         self.shipping_count = shipping_count
         self.completed_count = completed_count
         self.cancelled_count = cancelled_count
         self.message = message
+    
+    @cached_property
+    def total_pages(self) -> int:
+        """Total pages, computed on first access"""
+        if self.total_orders == 0 or self.per_page < 1:
+            return 0
+        return (self.total_orders + self.per_page - 1) // self.per_page
 
 
 class ListOrdersUseCase:
@@ -117,66 +134,9 @@ class ListOrdersUseCase:
         Returns:
             ListOrdersOutputData with orders and statistics
         """
+        # Validate input
         try:
-            # Validate input
             self._validate_input(input_data)
-            
-            # Build filters
-            filters = self._build_filters(input_data)
-            
-            # Get paginated orders
-            orders, total = self.order_repository.find_with_filters(
-                filters=filters,
-                page=input_data.page,
-                per_page=input_data.per_page,
-                sort_by=input_data.sort_by
-            )
-            
-            # Enrich orders with customer information
-            order_items = []
-            for order in orders:
-                customer = self.user_repository.find_by_id(order.customer_id)
-                customer_name = customer.full_name if customer else "Unknown"
-                customer_email = customer.email if customer else ""
-                
-                # Handle both Money object (production) and float/int (tests)
-                total_amount = order.total_amount.amount if hasattr(order.total_amount, 'amount') else order.total_amount
-                order_date = order.created_at if hasattr(order, 'created_at') else order.order_date
-                order_id = order.id if hasattr(order, 'id') else order.order_id
-                
-                order_items.append(OrderItemOutputData(
-                    order_id=order_id,
-                    customer_id=order.customer_id,
-                    customer_name=customer_name,
-                    customer_email=customer_email,
-                    total_amount=total_amount,
-                    status=order.status.value,
-                    payment_method=order.payment_method.value,
-                    shipping_address=order.shipping_address,
-                    order_date=order_date,
-                    item_count=len(order.items)
-                ))
-            
-            # Calculate statistics
-            stats = self.order_repository.get_order_statistics(filters)
-            
-            # Calculate total pages
-            total_pages = (total + input_data.per_page - 1) // input_data.per_page
-            
-            return ListOrdersOutputData(
-                success=True,
-                orders=order_items,
-                total_orders=total,
-                page=input_data.page,
-                per_page=input_data.per_page,
-                total_pages=total_pages,
-                total_revenue=stats.get('total_revenue', 0),
-                pending_count=stats.get('pending_count', 0),
-                shipping_count=stats.get('shipping_count', 0),
-                completed_count=stats.get('completed_count', 0),
-                cancelled_count=stats.get('cancelled_count', 0)
-            )
-            
         except ValidationException as e:
             return ListOrdersOutputData(
                 success=False,
@@ -184,19 +144,60 @@ class ListOrdersUseCase:
                 total_orders=0,
                 page=input_data.page,
                 per_page=input_data.per_page,
-                total_pages=0,
                 message=str(e)
             )
-        except Exception as e:
-            return ListOrdersOutputData(
-                success=False,
-                orders=[],
-                total_orders=0,
-                page=input_data.page,
-                per_page=input_data.per_page,
-                total_pages=0,
-                message=f"Error listing orders: {str(e)}"
-            )
+        
+        # Build filters
+        filters = self._build_filters(input_data)
+        
+        # Get paginated orders
+        orders, total = self.order_repository.find_with_filters(
+            filters=filters,
+            page=input_data.page,
+            per_page=input_data.per_page,
+            sort_by=input_data.sort_by
+        )
+        
+        # Enrich orders with customer information
+        order_items = []
+        for order in orders:
+            customer = self.user_repository.find_by_id(order.customer_id)
+            customer_name = customer.full_name if customer else "Unknown"
+            customer_email = customer.email if customer else ""
+            
+            # Handle both Money object (production) and float/int (tests)
+            total_amount = order.total_amount.amount if hasattr(order.total_amount, 'amount') else order.total_amount
+            order_date = order.created_at if hasattr(order, 'created_at') else order.order_date
+            order_id = order.id if hasattr(order, 'id') else order.order_id
+            
+            order_items.append(OrderItemOutputData(
+                order_id=order_id,
+                customer_id=order.customer_id,
+                customer_name=customer_name,
+                customer_email=customer_email,
+                total_amount=total_amount,
+                status=_STATUS_STR[order.status],
+                payment_method=_PAYMENT_METHOD_STR[order.payment_method],
+                shipping_address=order.shipping_address,
+                order_date=order_date,
+                item_count=len(order.items)
+            ))
+        
+        # Calculate statistics
+        stats = self.order_repository.get_order_statistics(filters)
+        
+        return ListOrdersOutputData(
+            success=True,
+            orders=order_items,
+            total_orders=total,
+            page=input_data.page,
+            per_page=input_data.per_page,
+            total_revenue=stats.get('total_revenue', 0),
+            pending_count=stats.get('pending_count', 0),
+            shipping_count=stats.get('shipping_count', 0),
+            completed_count=stats.get('completed_count', 0),
+            cancelled_count=stats.get('cancelled_count', 0)
+        )
     
     def _validate_input(self, input_data: ListOrdersInputData):
         """Validate input data"""
@@ -215,22 +216,17 @@ class ListOrdersUseCase:
             raise ValidationException(f"Invalid sort option. Must be one of: {', '.join(valid_sort_options)}")
     
     def _build_filters(self, input_data: ListOrdersInputData) -> dict:
-        """Build filter dictionary from input data"""
-        filters = {}
-        
-        if input_data.status:
-            filters['status'] = input_data.status
-        
-        if input_data.customer_id:
-            filters['customer_id'] = input_data.customer_id
-        
-        if input_data.start_date:
-            filters['start_date'] = input_data.start_date
-        
-        if input_data.end_date:
-            filters['end_date'] = input_data.end_date
-        
-        if input_data.search_query:
-            filters['search_query'] = input_data.search_query
+        """Build filter dictionary from input data (empty values are left out)"""
+        search_query = input_data.search_query
+        if search_query:
+            # Normalize once: trim and collapse inner whitespace runs
+            search_query = ' '.join(search_query.split())
         
-        return filters
+        candidates = (
+            ('status', input_data.status),
+            ('customer_id', input_data.customer_id),
+            ('start_date', input_data.start_date),
+            ('end_date', input_data.end_date),
+            ('search_query', search_query),
+        )
+        return {key: value for key, value in candidates if value}
@@ -2,7 +2,8 @@
 List Products Use Case - Business Layer
 Handles product listing with pagination, filtering, and sorting
 """
-from typing import Optional, List
+import heapq
+from typing import Optional, List, Dict
 from dataclasses import dataclass
 from ...business.ports import IProductRepository, ICategoryRepository, IBrandRepository
 from ...domain.entities import Product
@@ -21,8 +22,7 @@ class ListProductsInputData:
     sort_by: str = 'newest'  # newest, price_asc, price_desc, name
 
 
-@dataclass
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProductItemOutputData:
     """Single product data for output"""
     product_id: int
@@ -81,111 +81,104 @@ class ListProductsUseCase:
         Returns:
             ListProductsOutputData with products and pagination info
         """
-        try:
-            # Validate input
-            if input_data.page < 1:
-                input_data.page = 1
-            if input_data.per_page < 1 or input_data.per_page > 100:
-                input_data.per_page = 12
-            
-            # Get products based on filters
-            if input_data.category_id:
-                products = self.product_repository.find_by_category(input_data.category_id)
-            elif input_data.brand_id:
-                products = self.product_repository.find_by_brand(input_data.brand_id)
-            elif input_data.search_query:
-                products = self.product_repository.search_by_name(input_data.search_query)
-            else:
-                products = self.product_repository.find_all()
-            
-            # Filter by price range
-            if input_data.min_price is not None or input_data.max_price is not None:
-                products = self._filter_by_price(
-                    products,
-                    input_data.min_price,
-                    input_data.max_price
-                )
-            
-            # Filter only visible products
-            products = [p for p in products if p.is_available_for_purchase()]
-            
-            # Sort products
-            products = self._sort_products(products, input_data.sort_by)
-            
-            # Calculate pagination
-            total_products = len(products)
-            total_pages = (total_products + input_data.per_page - 1) // input_data.per_page
-            
-            # Ensure page is within bounds
-            if input_data.page > total_pages and total_pages > 0:
-                input_data.page = total_pages
-            
-            # Paginate
-            start_idx = (input_data.page - 1) * input_data.per_page
-            end_idx = start_idx + input_data.per_page
-            paginated_products = products[start_idx:end_idx]
-            
-            # Convert to output format
-            product_items = []
-            for product in paginated_products:
-                # Get category and brand names
-                category_name = None
-                if product.category_id:
-                    category = self.category_repository.find_by_id(product.category_id)
-                    if category:
-                        category_name = category.name
-                
-                brand_name = None
-                if product.brand_id:
-                    brand = self.brand_repository.find_by_id(product.brand_id)
-                    if brand:
-                        brand_name = brand.name
-                
-                product_items.append(ProductItemOutputData(
-                    product_id=product.id,  # Product entity uses .id, not .product_id
-                    name=product.name,
-                    description=product.description,
-                    price=float(product.price.amount),
-                    currency=product.price.currency,
-                    stock_quantity=product.stock_quantity,
-                    category_name=category_name,
-                    brand_name=brand_name,
-                    image_url=product.image_url,
-                    is_available=product.is_available_for_purchase()
-                ))
-            
-            return ListProductsOutputData(
-                success=True,
-                products=product_items,
-                total_products=total_products,
-                total_pages=total_pages,
-                current_page=input_data.page,
-                has_next=input_data.page < total_pages,
-                has_prev=input_data.page > 1
+        # Validate input
+        if input_data.page < 1:
+            input_data.page = 1
+        if input_data.per_page < 1 or input_data.per_page > 100:
+            input_data.per_page = 12
+        
+        # Get products based on filters (only visible, in-stock rows)
+        if input_data.category_id:
+            products = self.product_repository.find_by_category(
+                input_data.category_id, available_only=True
             )
-            
-        except Exception as e:
-            return ListProductsOutputData(
-                success=False,
-                products=[],
-                total_products=0,
-                total_pages=0,
-                current_page=1,
-                has_next=False,
-                has_prev=False,
-                error_message=str(e)
+        elif input_data.brand_id:
+            products = self.product_repository.find_by_brand(
+                input_data.brand_id, available_only=True
+            )
+        elif input_data.search_query:
+            products = self.product_repository.search_by_name(
+                input_data.search_query, available_only=True
+            )
+        else:
+            products = self.product_repository.find_all(available_only=True)
+        
+        # Convert Decimal prices to float once per product
+        prices = {product.id: float(product.price.amount) for product in products}
+        
+        # Filter by price range
+        if input_data.min_price is not None or input_data.max_price is not None:
+            products = self._filter_by_price(
+                products,
+                prices,
+                input_data.min_price,
+                input_data.max_price
             )
+        
+        # Calculate pagination
+        total_products = len(products)
+        total_pages = (total_products + input_data.per_page - 1) // input_data.per_page
+        
+        # Ensure page is within bounds
+        if input_data.page > total_pages and total_pages > 0:
+            input_data.page = total_pages
+        
+        # Sort only as far as the requested page, then paginate
+        start_idx = (input_data.page - 1) * input_data.per_page
+        end_idx = start_idx + input_data.per_page
+        products = self._sort_products(products, prices, input_data.sort_by, limit=end_idx)
+        paginated_products = products[start_idx:end_idx]
+        
+        # Convert to output format
+        product_items = []
+        for product in paginated_products:
+            # Get category and brand names
+            category_name = None
+            if product.category_id:
+                category = self.category_repository.find_by_id(product.category_id)
+                if category:
+                    category_name = category.name
+            
+            brand_name = None
+            if product.brand_id:
+                brand = self.brand_repository.find_by_id(product.brand_id)
+                if brand:
+                    brand_name = brand.name
+            
+            product_items.append(ProductItemOutputData(
+                product_id=product.id,  # Product entity uses .id, not .product_id
+                name=product.name,
+                description=product.description,
+                price=prices[product.id],
+                currency=product.price.currency,
+                stock_quantity=product.stock_quantity,
+                category_name=category_name,
+                brand_name=brand_name,
+                image_url=product.image_url,
+                is_available=product.is_available_for_purchase()
+            ))
+        
+        return ListProductsOutputData(
+            success=True,
+            products=product_items,
+            total_products=total_products,
+            total_pages=total_pages,
+            current_page=input_data.page,
+            has_next=input_data.page < total_pages,
+            has_prev=input_data.page > 1
+        )
     
     def _filter_by_price(
         self,
         products: List[Product],
+        prices: Dict[int, float],
         min_price: Optional[float],
         max_price: Optional[float]
     ) -> List[Product]:
         """Filter products by price range"""
         filtered = []
         for product in products:
-            price = float(product.price.amount)
+            price = prices[product.id]
             if min_price is not None and price < min_price:
                 continue
             if max_price is not None and price > max_price:
@@ -193,16 +186,32 @@ class ListProductsUseCase:
             filtered.append(product)
         return filtered
     
-    def _sort_products(self, products: List[Product], sort_by: str) -> List[Product]:
-        """Sort products based on criteria"""
+    def _sort_products(
+        self,
+        products: List[Product],
+        prices: Dict[int, float],
+        sort_by: str,
+        limit: Optional[int] = None
+    ) -> List[Product]:
+        """
+        Sort products based on criteria
+        
+        When limit is given only the first `limit` products of the ordering are
+        returned, using a heap selection (O(N log k)) instead of a full sort.
+        """
         if sort_by == 'price_asc':
-            return sorted(products, key=lambda p: float(p.price.amount))
+            key, descending = (lambda p: prices[p.id]), False
         elif sort_by == 'price_desc':
-            return sorted(products, key=lambda p: float(p.price.amount), reverse=True)
+            key, descending = (lambda p: prices[p.id]), True
         elif sort_by == 'name':
-            return sorted(products, key=lambda p: p.name.lower())
+            key, descending = (lambda p: p.name.lower()), False
         elif sort_by == 'newest':
             # Assuming products with higher IDs are newer
-            return sorted(products, key=lambda p: p.id, reverse=True)  # Product entity uses .id
+            key, descending = (lambda p: p.id), True  # Product entity uses .id
         else:
             return products
+        
+        if limit is not None and limit < len(products):
+            select = heapq.nlargest if descending else heapq.nsmallest
+            return select(limit, products, key=key)
+        return sorted(products, key=key, reverse=descending)
@@ -3,6 +3,8 @@ List Users Use Case - Admin views all users with filters and pagination
 Clean Architecture - Business Layer
 NO framework dependencies!
 """
+from concurrent.futures import Executor
+from functools import cached_property
 from typing import List, Optional
 from dataclasses import dataclass
 from datetime import datetime
@@ -13,7 +15,11 @@ from app.domain.enums import UserRole
 from app.domain.exceptions import ValidationException
 
 
-@dataclass
+# Enum -> string lookup, built once instead of reading .value per row
+_ROLE_STR = {role: role.value for role in UserRole}
+
+
+@dataclass(frozen=True, slots=True)
 class UserItemOutputData:
     """Single user data for output (NO password_hash!)"""
     user_id: int
@@ -44,14 +50,21 @@ class ListUsersOutputData:
     success: bool
     users: List[UserItemOutputData]
     total_users: int
-    total_pages: int
     current_page: int
+    per_page: int = 20
     # Statistics
     total_admins: int = 0
     total_customers: int = 0
     active_users: int = 0
     inactive_users: int = 0
     error_message: Optional[str] = None
+    
+    @cached_property
+    def total_pages(self) -> int:
+        """Total pages, computed on first access"""
+        if self.total_users == 0:
+            return 0
+        return (self.total_users + self.per_page - 1) // self.per_page  # Ceiling division
 
 
 class ListUsersUseCase:
@@ -68,14 +81,17 @@ class ListUsersUseCase:
     - Calculate statistics: admins, customers, active, inactive
     """
     
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(self, user_repository: IUserRepository, executor: Optional[Executor] = None):
         """
         Initialize use case with repository dependency
         
         Args:
             user_repository: Repository for user data access
+            executor: Optional executor; when given, statistics are queried
+                concurrently with the user page (repository must be thread-safe)
         """
         self.user_repository = user_repository
+        self.executor = executor
     
     def execute(self, input_data: ListUsersInputData) -> ListUsersOutputData:
         """
@@ -87,60 +103,54 @@ class ListUsersUseCase:
         Returns:
             ListUsersOutputData with users and statistics
         """
+        # Step 1: Validate and normalize input
         try:
-            # Step 1: Validate and normalize input
             validated_input = self._validate_and_normalize_input(input_data)
-            
-            # Step 2: Build filters
-            filters = self._build_filters(validated_input)
-            
-            # Step 3: Get users from repository
-            users, total_count = self.user_repository.find_all_with_filters(
-                filters=filters,
-                page=validated_input.page,
-                per_page=validated_input.per_page,
-                sort_by=validated_input.sort_by
-            )
-            
-            # Step 4: Convert to output DTOs (sanitize - NO password_hash!)
-            user_items = self._convert_to_output_dtos(users)
-            
-            # Step 5: Calculate pagination
-            total_pages = self._calculate_total_pages(total_count, validated_input.per_page)
-            
-            # Step 6: Calculate statistics
-            statistics = self._calculate_statistics()
-            
-            return ListUsersOutputData(
-                success=True,
-                users=user_items,
-                total_users=total_count,
-                total_pages=total_pages,
-                current_page=validated_input.page,
-                total_admins=statistics['total_admins'],
-                total_customers=statistics['total_customers'],
-                active_users=statistics['active_users'],
-                inactive_users=statistics['inactive_users']
-            )
-            
         except ValidationException as e:
             return ListUsersOutputData(
                 success=False,
                 users=[],
                 total_users=0,
-                total_pages=0,
                 current_page=input_data.page,
                 error_message=str(e)
             )
-        except Exception as e:
-            return ListUsersOutputData(
-                success=False,
-                users=[],
-                total_users=0,
-                total_pages=0,
-                current_page=input_data.page,
-                error_message=f"Error listing users: {str(e)}"
-            )
+        
+        # Step 2: Build filters
+        filters = self._build_filters(validated_input)
+        
+        # Statistics do not depend on the page: start them early if we can
+        statistics_future = None
+        if self.executor is not None:
+            statistics_future = self.executor.submit(self._calculate_statistics)
+        
+        # Step 3: Get users from repository
+        users, total_count = self.user_repository.find_all_with_filters(
+            filters=filters,
+            page=validated_input.page,
+            per_page=validated_input.per_page,
+            sort_by=validated_input.sort_by
+        )
+        
+        # Step 4: Convert to output DTOs (sanitize - NO password_hash!)
+        user_items = self._convert_to_output_dtos(users)
+        
+        # Step 5: Calculate statistics
+        if statistics_future is not None:
+            statistics = statistics_future.result()
+        else:
+            statistics = self._calculate_statistics()
+        
+        return ListUsersOutputData(
+            success=True,
+            users=user_items,
+            total_users=total_count,
+            current_page=validated_input.page,
+            per_page=validated_input.per_page,
+            total_admins=statistics['total_admins'],
+            total_customers=statistics['total_customers'],
+            active_users=statistics['active_users'],
+            inactive_users=statistics['inactive_users']
+        )
     
     def _validate_and_normalize_input(self, input_data: ListUsersInputData) -> ListUsersInputData:
         """
@@ -199,7 +209,10 @@ class ListUsersUseCase:
             filters['is_active'] = input_data.active_filter
         
         if input_data.search_query:
-            filters['search_query'] = input_data.search_query.strip()
+            # Normalize once: trim and collapse inner whitespace runs
+            search_query = ' '.join(input_data.search_query.split())
+            if search_query:
+                filters['search_query'] = search_query
         
         return filters
     
@@ -209,35 +222,21 @@ class ListUsersUseCase:
         
         CRITICAL: NEVER expose password_hash!
         """
-        user_items = []
-        
-        for user in users:
-            # Sanitize phone_number - convert to string or None
-            phone_str = user.phone_number.number if user.phone_number else None
-            
-            # Sanitize email - convert to string
-            email_str = user.email.address
-            
-            user_item = UserItemOutputData(
+        return [
+            UserItemOutputData(
                 user_id=user.id,
                 username=user.username,
-                email=email_str,
+                email=user.email.address,  # Sanitize email - convert to string
                 full_name=user.full_name,
-                role=user.role.value,  # Convert enum to string
+                role=_ROLE_STR[user.role],  # Convert enum to string
                 is_active=user.is_active,
-                phone_number=phone_str,
+                # Sanitize phone_number - convert to string or None
+                phone_number=user.phone_number.number if user.phone_number else None,
                 address=user.address,
                 created_at=user.created_at
             )
-            user_items.append(user_item)
-        
-        return user_items
-    
-    def _calculate_total_pages(self, total_count: int, per_page: int) -> int:
-        """Calculate total pages"""
-        if total_count == 0:
-            return 0
-        return (total_count + per_page - 1) // per_page  # Ceiling division
+            for user in users
+        ]
     
     def _calculate_statistics(self) -> dict:
         """
@@ -54,48 +54,41 @@ class LoginUserUseCase:
         Returns:
             LoginUserOutputData with success status and user info
         """
-        try:
-            # Try to find user by username first
-            user = self.user_repository.find_by_username(input_data.username_or_email)
-            
-            # If not found, try email
-            if not user:
-                try:
-                    email = Email(input_data.username_or_email)
-                    user = self.user_repository.find_by_email(email)
-                except ValueError:
-                    # Not a valid email, user not found
-                    pass
-            
-            # User not found
-            if not user:
-                return LoginUserOutputData(
-                    success=False,
-                    error_message="Invalid username or email"
-                )
-            
-            # Check if user is active
+        # Try to find user by username first
+        user = self.user_repository.find_by_username(input_data.username_or_email)
+        
+        # If not found, try email (only when it looks like one)
+        if not user and isinstance(input_data.username_or_email, str):
             try:
-                user.ensure_active()
-            except InvalidCredentialsException as e:
-                return LoginUserOutputData(
-                    success=False,
-                    error_message="Account is deactivated"
-                )
-            
-            # Password verification will be done in the adapter layer
-            # (Infrastructure) where we have access to bcrypt
-            # Here we just return user info for verification
-            
+                email = Email(input_data.username_or_email)
+            except ValueError:
+                email = None
+            if email:
+                user = self.user_repository.find_by_email(email)
+        
+        # User not found
+        if not user:
             return LoginUserOutputData(
-                success=True,
-                user_id=user.id,
-                username=user.username,
-                role=user.role.value
+                success=False,
+                error_message="Invalid username or email"
             )
-            
-        except Exception as e:
+        
+        # Check if user is active
+        try:
+            user.ensure_active()
+        except InvalidCredentialsException as e:
             return LoginUserOutputData(
                 success=False,
-                error_message=f"Login failed: {str(e)}"
+                error_message="Account is deactivated"
             )
+        
+        # Password verification will be done in the adapter layer
+        # (Infrastructure) where we have access to bcrypt
+        # Here we just return user info for verification
+        
+        return LoginUserOutputData(
+            success=True,
+            user_id=user.id,
+            username=user.username,
+            role=user.role.value
+        )
@@ -11,17 +11,24 @@ Business Logic:
 """
 
 from dataclasses import dataclass
-from typing import Optional
-from app.domain.entities.order import Order
+from typing import Final, Optional
+from app.domain.entities.order import Order, OrderItem
 from app.domain.value_objects.money import Money
 from app.domain.enums import PaymentMethod
 from app.business.ports.order_repository import IOrderRepository
 from app.business.ports.cart_repository import ICartRepository
 from app.business.ports.product_repository import IProductRepository
+from app.business.ports.unit_of_work import IUnitOfWork, NullUnitOfWork
 from app.domain.exceptions import ValidationException, InsufficientStockException
 
+# Payment method lookup by upper-case name, built once at import time
+_PAYMENT_METHODS = {method.name: method for method in PaymentMethod}
 
-@dataclass
+_SHIPPING_ADDRESS_MIN_LENGTH: Final[int] = 10
+_PHONE_NUMBER_MIN_LENGTH: Final[int] = 10
+
+
+@dataclass(slots=True)
 class PlaceOrderInputData:
     """Input data for placing an order"""
     user_id: int
@@ -31,8 +38,7 @@ class PlaceOrderInputData:
     notes: Optional[str] = ""
 
 
-@dataclass
-@dataclass
+@dataclass(slots=True)
 class PlaceOrderOutputData:
     """Output data after placing an order"""
     success: bool
@@ -40,7 +46,11 @@ class PlaceOrderOutputData:
     error_message: str = ""
     order_id: Optional[int] = None
     order_total: Optional[float] = 0
-    total_amount: Optional[float] = 0  # Alias for compatibility
+    
+    @property
+    def total_amount(self) -> Optional[float]:
+        """Alias of order_total kept for compatibility"""
+        return self.order_total
 
 
 class PlaceOrderUseCase:
@@ -50,7 +60,8 @@ class PlaceOrderUseCase:
         self,
         order_repository: IOrderRepository,
         cart_repository: ICartRepository,
-        product_repository: IProductRepository
+        product_repository: IProductRepository,
+        unit_of_work: Optional[IUnitOfWork] = None
     ):
         """
         Initialize the use case.
@@ -59,10 +70,13 @@ class PlaceOrderUseCase:
             order_repository: Repository for order persistence
             cart_repository: Repository for cart operations
             product_repository: Repository for product stock management
+            unit_of_work: Transaction grouping the stock, order and cart writes
+                (optional; without it each repository commits on its own)
         """
         self.order_repository = order_repository
         self.cart_repository = cart_repository
         self.product_repository = product_repository
+        self.unit_of_work = unit_of_work or NullUnitOfWork()
     
     def execute(self, input_data: PlaceOrderInputData) -> PlaceOrderOutputData:
         """
@@ -79,14 +93,23 @@ class PlaceOrderUseCase:
             # Validate input
             self._validate_input(input_data)
             
-            # Get user's cart
-            cart = self.cart_repository.find_by_user_id(input_data.user_id)
-            if cart is None or not cart.items:
+            # Get user's cart with its items in one query
+            cart = self.cart_repository.find_by_user_id_with_items(input_data.user_id)
+            if cart is None or cart.is_empty():
                 raise ValidationException("Cart is empty. Cannot place order.")
             
-            # Validate stock availability for all items
-            for cart_item in cart.items:
-                product = self.product_repository.find_by_id(cart_item.product_id)
+            # Load every product in the cart with a single query
+            products = {
+                product.id: product
+                for product in self.product_repository.find_by_ids(
+                    [cart_item.product_id for cart_item in cart.items_view]
+                )
+            }
+            
+            # Validate stock availability and build order items in one pass
+            order_items = []
+            for cart_item in cart.items_view:
+                product = products.get(cart_item.product_id)
                 if product is None:
                     raise ValidationException(f"Product with ID {cart_item.product_id} not found")
                 
@@ -99,35 +122,20 @@ class PlaceOrderUseCase:
                         requested=cart_item.quantity,
                         available=product.stock_quantity
                     )
-            
-            # Calculate total from cart by loading each product
-            from decimal import Decimal
-            total_amount = Decimal('0')
-            for item in cart.items:
-                product = self.product_repository.find_by_id(item.product_id)
-                if product:
-                    total_amount += product.price.amount * item.quantity
-            
-            # Parse payment method
-            try:
-                payment_method_enum = PaymentMethod[input_data.payment_method.upper()]
-            except KeyError:
-                raise ValidationException(f"Invalid payment method: {input_data.payment_method}")
-            
-            # Create OrderItem entities from cart items
-            from app.domain.entities.order import OrderItem
-            order_items = []
-            for cart_item in cart.items:
-                product = self.product_repository.find_by_id(cart_item.product_id)
-                order_item = OrderItem(
+                
+                order_items.append(OrderItem(
                     product_id=product.id,  # Product entity uses .id, not .product_id
                     product_name=product.name,
                     quantity=cart_item.quantity,
                     unit_price=product.price
-                )
-                order_items.append(order_item)
+                ))
+            
+            # Parse payment method
+            payment_method_enum = _PAYMENT_METHODS.get(input_data.payment_method.upper())
+            if payment_method_enum is None:
+                raise ValidationException(f"Invalid payment method: {input_data.payment_method}")
             
-            # Create order entity
+            # Create order entity (computes the total from its items)
             order = Order(
                 customer_id=input_data.user_id,
                 items=order_items,
@@ -137,36 +145,29 @@ class PlaceOrderUseCase:
                 notes=input_data.notes
             )
             
-            # Reduce product stock for each item
+            # Reduce product stock in memory
             for order_item in order.items:
-                product = self.product_repository.find_by_id(order_item.product_id)
-                product.reduce_stock(order_item.quantity)
-                self.product_repository.save(product)
+                products[order_item.product_id].reduce_stock(order_item.quantity)
             
-            # Save order
-            saved_order = self.order_repository.save(order)
-        
-            # Clear cart after successful order
-            self.cart_repository.clear_cart(input_data.user_id)
+            # Stock update, order and cart clear commit together or not at all
+            with self.unit_of_work:
+                self.product_repository.save_many(list(products.values()))
+                saved_order = self.order_repository.save(order)
+                self.cart_repository.clear_cart(input_data.user_id)
+                self.unit_of_work.commit()
             
             return PlaceOrderOutputData(
                 success=True,
                 order_id=saved_order.id,
                 order_total=saved_order.total_amount.amount,
-                total_amount=saved_order.total_amount.amount,
                 message=f"Order #{saved_order.id} placed successfully"
             )
         
-        except (ValidationException, InsufficientStockException) as e:
+        except (ValidationException, InsufficientStockException, ValueError) as e:
             return PlaceOrderOutputData(
                 success=False,
                 error_message=str(e)
             )
-        except Exception as e:
-            return PlaceOrderOutputData(
-                success=False,
-                error_message=f"An error occurred while placing order: {str(e)}"
-            )
     
     def _validate_input(self, input_data: PlaceOrderInputData) -> None:
         """
@@ -181,11 +182,17 @@ class PlaceOrderUseCase:
         if input_data.user_id <= 0:
             raise ValidationException("Invalid user ID")
         
-        if not input_data.shipping_address or len(input_data.shipping_address.strip()) < 10:
-            raise ValidationException("Shipping address must be at least 10 characters")
+        input_data.shipping_address = (input_data.shipping_address or '').strip()
+        if len(input_data.shipping_address) < _SHIPPING_ADDRESS_MIN_LENGTH:
+            raise ValidationException(
+                f"Shipping address must be at least {_SHIPPING_ADDRESS_MIN_LENGTH} characters"
+            )
         
-        if not input_data.phone_number or len(input_data.phone_number.strip()) < 10:
-            raise ValidationException("Phone number must be at least 10 digits")
+        input_data.phone_number = (input_data.phone_number or '').strip()
+        if len(input_data.phone_number) < _PHONE_NUMBER_MIN_LENGTH:
+            raise ValidationException(
+                f"Phone number must be at least {_PHONE_NUMBER_MIN_LENGTH} digits"
+            )
         
         if not input_data.payment_method:
             raise ValidationException("Payment method is required")
@@ -73,7 +73,8 @@ class RegisterUserUseCase:
                 role=UserRole.CUSTOMER  # Default role
             )
             
-            # Save user via repository
+            # Save user via repository (single INSERT: duplicates are reported
+            # by the unique constraints as UserAlreadyExistsException)
             saved_user = self.user_repository.save(user)
             
             return RegisterUserOutputData(
@@ -91,8 +92,3 @@ class RegisterUserUseCase:
                 success=False,
                 error_message=str(e)
             )
-        except Exception as e:
-            return RegisterUserOutputData(
-                success=False,
-                error_message=f"Registration failed: {str(e)}"
-            )
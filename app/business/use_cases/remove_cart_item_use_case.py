@@ -7,14 +7,14 @@ from app.domain.exceptions import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoveCartItemInputData:
     """Input data for removing cart item"""
     user_id: int
     cart_item_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class RemoveCartItemOutputData:
     """Output data for removing cart item"""
     success: bool
@@ -40,16 +40,17 @@ class RemoveCartItemUseCase:
             # Validate input
             self._validate_input(input_data)
             
-            # Find cart item
-            cart_item = self.cart_repository.find_cart_item_by_id(input_data.cart_item_id)
+            # Find cart item in the user's cart
+            cart_item = self.cart_repository.find_cart_item_for_user(
+                input_data.user_id,
+                input_data.cart_item_id
+            )
             if not cart_item:
-                raise CartItemNotFoundException(
-                    f"Cart item with ID {input_data.cart_item_id} not found"
-                )
-            
-            # Verify cart belongs to user
-            cart = self.cart_repository.find_by_user_id(input_data.user_id)
-            if not cart or cart.id != cart_item.cart_id:
+                # Only on a miss: tell "not found" apart from "not yours"
+                if not self.cart_repository.find_cart_item_by_id(input_data.cart_item_id):
+                    raise CartItemNotFoundException(
+                        f"Cart item with ID {input_data.cart_item_id} not found"
+                    )
                 raise ValidationException("This cart item does not belong to you")
             
             # Remove item
@@ -65,11 +66,6 @@ class RemoveCartItemUseCase:
                 success=False,
                 error_message=str(e)
             )
-        except Exception as e:
-            return RemoveCartItemOutputData(
-                success=False,
-                error_message=f"An error occurred while removing cart item: {str(e)}"
-            )
 
     def _validate_input(self, input_data: RemoveCartItemInputData) -> None:
         """Validate input data"""
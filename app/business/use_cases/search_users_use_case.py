@@ -15,13 +15,18 @@ Clean Architecture:
 - No framework dependencies
 """
 from typing import List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from ...business.ports.user_repository import IUserRepository
 from ...domain.entities import User
+from ...domain.enums import UserRole
 
 
-@dataclass
+# Enum -> string lookup, built once instead of reading .value per row
+_ROLE_STR = {role: role.value for role in UserRole}
+
+
+@dataclass(slots=True)
 class SearchUsersInputData:
     """
     Input DTO for SearchUsers use case
@@ -30,6 +35,7 @@ class SearchUsersInputData:
     - search_query: minimum 2 characters, not empty
     """
     search_query: str
+    search_query_lc: str = field(init=False, default="")  # Lowercased once for the repository
     
     def __post_init__(self):
         """Validate input data"""
@@ -43,9 +49,11 @@ class SearchUsersInputData:
         # Validate minimum length
         if len(self.search_query) < 2:
             raise ValueError("Search query must be at least 2 characters")
+        
+        self.search_query_lc = self.search_query.lower()
 
 
-@dataclass
+@dataclass(slots=True)
 class UserSearchResultData:
     """
     Individual user result DTO
@@ -62,7 +70,7 @@ class UserSearchResultData:
     address: str = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SearchUsersOutputData:
     """
     Output DTO for SearchUsers use case
@@ -119,36 +127,25 @@ class SearchUsersUseCase:
         Returns:
             SearchUsersOutputData with results or error
         """
-        try:
-            # Step 1: Query is already validated in InputData.__post_init__
-            search_query = input_data.search_query
-            
-            # Step 2: Search via repository (limit 50 for performance)
-            users = self._user_repository.search_by_query(
-                query=search_query,
-                limit=50
-            )
-            
-            # Step 3: Convert domain entities to output DTOs
-            result_dtos = self._convert_to_result_dtos(users)
-            
-            # Step 4: Return success output
-            return SearchUsersOutputData(
-                success=True,
-                results=result_dtos,
-                total_results=len(result_dtos),
-                search_query=search_query
-            )
+        # Step 1: Query is already validated in InputData.__post_init__
+        search_query = input_data.search_query
         
-        except Exception as e:
-            # Handle any repository or unexpected errors
-            return SearchUsersOutputData(
-                success=False,
-                results=[],
-                total_results=0,
-                search_query=input_data.search_query,
-                error_message=f"Error searching users: {str(e)}"
-            )
+        # Step 2: Search via repository (limit 50 for performance)
+        users = self._user_repository.search_by_query(
+            query=input_data.search_query_lc,
+            limit=50
+        )
+        
+        # Step 3: Convert domain entities to output DTOs
+        result_dtos = self._convert_to_result_dtos(users)
+        
+        # Step 4: Return success output
+        return SearchUsersOutputData(
+            success=True,
+            results=result_dtos,
+            total_results=len(result_dtos),
+            search_query=search_query
+        )
     
     def _convert_to_result_dtos(self, users: List[User]) -> List[UserSearchResultData]:
         """
@@ -162,25 +159,16 @@ class SearchUsersUseCase:
         Returns:
             List of UserSearchResultData DTOs
         """
-        result_dtos = []
-        
-        for user in users:
-            # Extract and sanitize data
-            phone_str = user.phone_number.number if user.phone_number else None
-            email_str = user.email.address
-            
-            # Create DTO (NO password_hash!)
-            result_dto = UserSearchResultData(
+        return [
+            UserSearchResultData(
                 user_id=user.id,
                 username=user.username,
-                email=email_str,
+                email=user.email.address,
                 full_name=user.full_name,
-                role=user.role.value,
+                role=_ROLE_STR[user.role],
                 is_active=user.is_active,
-                phone_number=phone_str,
+                phone_number=user.phone_number.number if user.phone_number else None,
                 address=user.address
             )
-            
-            result_dtos.append(result_dto)
-        
-        return result_dtos
+            for user in users
+        ]
@@ -2,20 +2,21 @@
 Use Case: Update Brand
 
 Business Logic:
-- Validates brand exists
 - Validates new name and description
-- Checks for duplicate brand names (excluding self)
-- Updates brand information
-- Saves changes to repository
+- Updates brand information in a single repository call
+- Reports missing brands and duplicate names (excluding self)
 """
 
 from dataclasses import dataclass
-from app.domain.entities.brand import Brand
+from typing import Final
 from app.business.ports.brand_repository import IBrandRepository
-from app.domain.exceptions import ValidationException, BrandNotFoundException, BrandAlreadyExistsException
+from app.domain.exceptions import ValidationException
 
+_NAME_MIN_LENGTH: Final[int] = 2
+_NAME_MAX_LENGTH: Final[int] = 100
 
-@dataclass
+
+@dataclass(slots=True)
 class UpdateBrandInputData:
     """Input data for updating a brand"""
     brand_id: int
@@ -24,7 +25,7 @@ class UpdateBrandInputData:
     logo_url: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateBrandOutputData:
     """Output data after updating a brand"""
     success: bool
@@ -63,27 +64,15 @@ class UpdateBrandUseCase:
         # Validate input
         self._validate_input(input_data)
         
-        # Get existing brand
-        brand = self.brand_repository.find_by_id(input_data.brand_id)
-        if brand is None:
-            raise BrandNotFoundException(input_data.brand_id)
-        
-        # Check for duplicate name (excluding self)
-        if input_data.name != brand.name:
-            existing_brand = self.brand_repository.find_by_name(input_data.name)
-            if existing_brand is not None and existing_brand.id != brand.id:
-                raise BrandAlreadyExistsException(input_data.name)
-        
-        # Update brand using domain method
-        brand.update_details(
+        # Single UPDATE ... RETURNING: a missing row or a duplicate name is
+        # reported by the repository instead of being checked up front
+        updated_brand = self.brand_repository.update_details_atomic(
+            brand_id=input_data.brand_id,
             name=input_data.name,
             description=input_data.description,
             logo_url=input_data.logo_url
         )
         
-        # Save changes
-        updated_brand = self.brand_repository.save(brand)
-        
         return UpdateBrandOutputData(
             success=True,
             brand_id=updated_brand.id,
@@ -104,8 +93,9 @@ class UpdateBrandUseCase:
         if input_data.brand_id <= 0:
             raise ValidationException("Invalid brand ID")
         
-        if not input_data.name or len(input_data.name.strip()) < 2:
-            raise ValidationException("Brand name must be at least 2 characters")
+        input_data.name = (input_data.name or '').strip()
+        if len(input_data.name) < _NAME_MIN_LENGTH:
+            raise ValidationException(f"Brand name must be at least {_NAME_MIN_LENGTH} characters")
         
-        if len(input_data.name) > 100:
-            raise ValidationException("Brand name must not exceed 100 characters")
+        if len(input_data.name) > _NAME_MAX_LENGTH:
+            raise ValidationException(f"Brand name must not exceed {_NAME_MAX_LENGTH} characters")
@@ -1,8 +1,7 @@
 """Update Cart Item Use Case - Update quantity of cart item"""
 from dataclasses import dataclass
 from typing import Optional
-from app.business.ports.cart_repository import ICartRepository
-from app.business.ports.product_repository import IProductRepository
+from app.business.ports.cart_repository import ICartRepository, CartItemUpdateStatus
 from app.domain.exceptions import (
     CartItemNotFoundException,
     InsufficientStockException,
@@ -10,7 +9,7 @@ from app.domain.exceptions import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateCartItemInputData:
     """Input data for updating cart item"""
     user_id: int
@@ -18,7 +17,7 @@ class UpdateCartItemInputData:
     new_quantity: int
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateCartItemOutputData:
     """Output data for updating cart item"""
     success: bool
@@ -31,13 +30,8 @@ class UpdateCartItemOutputData:
 class UpdateCartItemUseCase:
     """Use case for updating cart item quantity"""
 
-    def __init__(
-        self,
-        cart_repository: ICartRepository,
-        product_repository: IProductRepository
-    ):
+    def __init__(self, cart_repository: ICartRepository):
         self.cart_repository = cart_repository
-        self.product_repository = product_repository
 
     def execute(self, input_data: UpdateCartItemInputData) -> UpdateCartItemOutputData:
         """
@@ -53,34 +47,27 @@ class UpdateCartItemUseCase:
             # Validate input
             self._validate_input(input_data)
             
-            # Find cart item
-            cart_item = self.cart_repository.find_cart_item_by_id(input_data.cart_item_id)
-            if not cart_item:
+            # Check ownership and stock and write in a single statement
+            result = self.cart_repository.try_update_quantity(
+                input_data.user_id,
+                input_data.cart_item_id,
+                input_data.new_quantity
+            )
+            
+            if result.status == CartItemUpdateStatus.NOT_FOUND:
                 raise CartItemNotFoundException(
                     f"Cart item with ID {input_data.cart_item_id} not found"
                 )
-            
-            # Verify cart belongs to user
-            cart = self.cart_repository.find_by_user_id(input_data.user_id)
-            if not cart or cart.id != cart_item.cart_id:
+            if result.status == CartItemUpdateStatus.NOT_YOURS:
                 raise ValidationException("This cart item does not belong to you")
-            
-            # Get product to check stock
-            product = self.product_repository.find_by_id(cart_item.product_id)
-            if not product:
+            if result.status == CartItemUpdateStatus.PRODUCT_UNAVAILABLE:
                 raise ValidationException("Product no longer available")
-            
-            # Check stock availability
-            if product.stock_quantity < input_data.new_quantity:
+            if result.status == CartItemUpdateStatus.INSUFFICIENT_STOCK:
                 raise InsufficientStockException(
-                    f"Only {product.stock_quantity} items available in stock"
+                    f"Only {result.available_stock} items available in stock"
                 )
             
-            # Update quantity
-            updated_item = self.cart_repository.update_cart_item_quantity(
-                input_data.cart_item_id,
-                input_data.new_quantity
-            )
+            updated_item = result.cart_item
             
             return UpdateCartItemOutputData(
                 success=True,
@@ -94,11 +81,6 @@ class UpdateCartItemUseCase:
                 success=False,
                 error_message=str(e)
             )
-        except Exception as e:
-            return UpdateCartItemOutputData(
-                success=False,
-                error_message=f"An error occurred while updating cart item: {str(e)}"
-            )
 
     def _validate_input(self, input_data: UpdateCartItemInputData) -> None:
         """Validate input data"""
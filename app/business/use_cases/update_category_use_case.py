@@ -2,20 +2,21 @@
 Use Case: Update Category
 
 Business Logic:
-- Validates category exists
 - Validates new name and description
-- Checks for duplicate category names (excluding self)
-- Updates category information
-- Saves changes to repository
+- Updates category information in a single repository call
+- Reports missing categories and duplicate names (excluding self)
 """
 
 from dataclasses import dataclass
-from app.domain.entities.category import Category
+from typing import Final
 from app.business.ports.category_repository import ICategoryRepository
-from app.domain.exceptions import ValidationException, CategoryNotFoundException, CategoryAlreadyExistsException
+from app.domain.exceptions import ValidationException
 
+_NAME_MIN_LENGTH: Final[int] = 3
+_NAME_MAX_LENGTH: Final[int] = 100
 
-@dataclass
+
+@dataclass(slots=True)
 class UpdateCategoryInputData:
     """Input data for updating a category"""
     category_id: int
@@ -23,7 +24,7 @@ class UpdateCategoryInputData:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class UpdateCategoryOutputData:
     """Output data after updating a category"""
     success: bool
@@ -62,26 +63,14 @@ class UpdateCategoryUseCase:
         # Validate input
         self._validate_input(input_data)
         
-        # Get existing category
-        category = self.category_repository.find_by_id(input_data.category_id)
-        if category is None:
-            raise CategoryNotFoundException(input_data.category_id)
-        
-        # Check for duplicate name (excluding self)
-        if input_data.name != category.name:
-            existing_category = self.category_repository.find_by_name(input_data.name)
-            if existing_category is not None and existing_category.id != category.id:
-                raise CategoryAlreadyExistsException(input_data.name)
-        
-        # Update category using domain method
-        category.update_details(
+        # Single UPDATE ... RETURNING: a missing row or a duplicate name is
+        # reported by the repository instead of being checked up front
+        updated_category = self.category_repository.update_details_atomic(
+            category_id=input_data.category_id,
             name=input_data.name,
             description=input_data.description
         )
         
-        # Save changes
-        updated_category = self.category_repository.save(category)
-        
         return UpdateCategoryOutputData(
             success=True,
             category_id=updated_category.id,
@@ -102,8 +91,9 @@ class UpdateCategoryUseCase:
         if input_data.category_id <= 0:
             raise ValidationException("Invalid category ID")
         
-        if not input_data.name or len(input_data.name.strip()) < 3:
-            raise ValidationException("Category name must be at least 3 characters")
+        input_data.name = (input_data.name or '').strip()
+        if len(input_data.name) < _NAME_MIN_LENGTH:
+            raise ValidationException(f"Category name must be at least {_NAME_MIN_LENGTH} characters")
         
-        if len(input_data.name) > 100:
-            raise ValidationException("Category name must not exceed 100 characters")
+        if len(input_data.name) > _NAME_MAX_LENGTH:
+            raise ValidationException(f"Category name must not exceed {_NAME_MAX_LENGTH} characters")
@@ -2,28 +2,40 @@
 Update Order Status Use Case - Admin updates order workflow status
 Clean Architecture - Business Layer
 """
-from typing import Optional
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, Optional, Tuple
 from app.business.ports.order_repository import IOrderRepository
 from app.domain.entities.order import OrderStatus
 from app.domain.exceptions import (
-    OrderNotFoundException,
     InvalidOrderStatusTransitionException,
-    ValidationException
+    ConcurrencyConflictException
 )
 
+# Status value -> member, so parsing skips Enum lookup and its ValueError
+_STATUS_BY_VALUE: Dict[str, OrderStatus] = {status.value.upper(): status for status in OrderStatus}
 
+
+@dataclass(slots=True)
 class UpdateOrderStatusInputData:
     """Input data for updating order status"""
+    order_id: int
+    new_status: str
+    admin_notes: Optional[str] = None
     
-    def __init__(self, order_id: int, new_status: str, admin_notes: Optional[str] = None):
-        self.order_id = order_id
-        self.new_status = new_status
-        self.admin_notes = admin_notes
+    def __post_init__(self):
+        """Validate input data"""
+        if self.order_id <= 0:
+            raise ValueError("Invalid order ID")
+        
+        if not self.new_status:
+            raise ValueError("New status is required")
 
 
 class UpdateOrderStatusOutputData:
     """Output data for order status update"""
     
+    __slots__ = ('success', 'order_id', 'old_status', 'new_status', 'message')
+    
     def __init__(
         self,
         success: bool,
@@ -46,13 +58,25 @@ class UpdateOrderStatusUseCase:
     """
     
     # Valid status transitions (aligned with OrderStatus enum)
-    VALID_TRANSITIONS = {
-        OrderStatus.PENDING: [OrderStatus.SHIPPING, OrderStatus.CANCELLED],
-        OrderStatus.SHIPPING: [OrderStatus.COMPLETED],
-        OrderStatus.COMPLETED: [],  # Final state
-        OrderStatus.CANCELLED: []   # Final state
+    VALID_TRANSITIONS: Dict[OrderStatus, FrozenSet[OrderStatus]] = {
+        OrderStatus.PENDING: frozenset({OrderStatus.SHIPPING, OrderStatus.CANCELLED}),
+        OrderStatus.SHIPPING: frozenset({OrderStatus.COMPLETED}),
+        OrderStatus.COMPLETED: frozenset(),  # Final state
+        OrderStatus.CANCELLED: frozenset()   # Final state
     }
     
+    # Allowed target values per status for error messages, in enum order
+    _ALLOWED_VALUES: Dict[OrderStatus, Tuple[str, ...]] = {
+        current: tuple(status.value for status in OrderStatus if status in allowed)
+        for current, allowed in VALID_TRANSITIONS.items()
+    }
+    
+    # Every status value, joined once for the invalid-status message
+    _VALID_STATUS_NAMES = ', '.join(status.value for status in OrderStatus)
+    
+    # Attempts at read-modify-save before giving up on a version conflict
+    MAX_SAVE_ATTEMPTS = 3
+    
     def __init__(self, order_repository: IOrderRepository):
         self.order_repository = order_repository
     
@@ -67,52 +91,16 @@ class UpdateOrderStatusUseCase:
             UpdateOrderStatusOutputData with update result
         """
         try:
-            # Validate input
-            self._validate_input(input_data)
-            
-            # Get order
-            order = self.order_repository.find_by_id(input_data.order_id)
-            if not order:
-                raise OrderNotFoundException(input_data.order_id)
-            
-            # Parse new status
-            try:
-                new_status = OrderStatus(input_data.new_status.upper())
-            except ValueError:
-                valid_statuses = [status.value for status in OrderStatus]
-                raise ValidationException(
-                    f"Invalid status. Must be one of: {', '.join(valid_statuses)}"
-                )
-            
-            # Check if transition is valid
-            old_status = order.status
-            if not self._is_valid_transition(old_status, new_status):
-                raise InvalidOrderStatusTransitionException(
-                    old_status.value,
-                    new_status.value,
-                    self._get_allowed_transitions(old_status)
-                )
-            
-            # Update order status
-            order.update_status(new_status)
-            
-            # Save order
-            self.order_repository.save(order)
-            
-            return UpdateOrderStatusOutputData(
-                success=True,
-                order_id=order.id,
-                old_status=old_status.value,
-                new_status=new_status.value,
-                message=f"Order status updated from {old_status.value} to {new_status.value}"
-            )
-            
-        except (OrderNotFoundException, InvalidOrderStatusTransitionException, ValidationException) as e:
-            return UpdateOrderStatusOutputData(
-                success=False,
-                order_id=input_data.order_id,
-                message=str(e)
-            )
+            for attempt in range(1, self.MAX_SAVE_ATTEMPTS + 1):
+                try:
+                    return self._apply_status_update(input_data)
+                except ConcurrencyConflictException:
+                    # Someone else saved the order first: re-read and re-check the transition
+                    if attempt == self.MAX_SAVE_ATTEMPTS:
+                        raise
+        
+        except (InvalidOrderStatusTransitionException, ConcurrencyConflictException) as e:
+            return self._failure(input_data, str(e))
         except Exception as e:
             return UpdateOrderStatusOutputData(
                 success=False,
@@ -120,20 +108,74 @@ class UpdateOrderStatusUseCase:
                 message=f"Error updating order status: {str(e)}"
             )
     
-    def _validate_input(self, input_data: UpdateOrderStatusInputData):
-        """Validate input data"""
-        if input_data.order_id <= 0:
-            raise ValidationException("Invalid order ID")
+    def _apply_status_update(self, input_data: UpdateOrderStatusInputData) -> UpdateOrderStatusOutputData:
+        """
+        Read the order, apply the transition and save with a version check
         
-        if not input_data.new_status:
-            raise ValidationException("New status is required")
+        Business-rule failures are returned as unsuccessful output data.
+        
+        Raises:
+            ConcurrencyConflictException: If the order changed since it was read
+        """
+        # Get order
+        order = self.order_repository.find_by_id(input_data.order_id)
+        if not order:
+            return self._failure(input_data, f"Order with ID {input_data.order_id} not found")
+        
+        # Parse new status
+        new_status = _STATUS_BY_VALUE.get(input_data.new_status.upper())
+        if new_status is None:
+            return self._failure(
+                input_data,
+                f"Invalid status. Must be one of: {self._VALID_STATUS_NAMES}"
+            )
+        
+        # Re-sending the current status is a no-op: nothing to validate or save
+        old_status = order.status
+        if new_status == old_status:
+            return UpdateOrderStatusOutputData(
+                success=True,
+                order_id=order.id,
+                old_status=old_status.value,
+                new_status=new_status.value,
+                message=f"Order status is already {new_status.value}"
+            )
+        
+        # Check if transition is valid
+        if not self._is_valid_transition(old_status, new_status):
+            allowed = ', '.join(self._get_allowed_transitions(old_status)) or 'none'
+            return self._failure(
+                input_data,
+                f"Cannot transition order from {old_status.value} to {new_status.value}. "
+                f"Allowed transitions: {allowed}"
+            )
+        
+        # Update order status
+        order.update_status(new_status)
+        
+        # Save order
+        self.order_repository.save(order)
+        
+        return UpdateOrderStatusOutputData(
+            success=True,
+            order_id=order.id,
+            old_status=old_status.value,
+            new_status=new_status.value,
+            message=f"Order status updated from {old_status.value} to {new_status.value}"
+        )
+    
+    def _failure(self, input_data: UpdateOrderStatusInputData, message: str) -> UpdateOrderStatusOutputData:
+        """Build the output for a rejected update"""
+        return UpdateOrderStatusOutputData(
+            success=False,
+            order_id=input_data.order_id,
+            message=message
+        )
     
     def _is_valid_transition(self, current_status: OrderStatus, new_status: OrderStatus) -> bool:
         """Check if status transition is valid"""
-        allowed_transitions = self.VALID_TRANSITIONS.get(current_status, [])
-        return new_status in allowed_transitions
+        return new_status in self.VALID_TRANSITIONS.get(current_status, frozenset())
     
-    def _get_allowed_transitions(self, current_status: OrderStatus) -> list:
-        """Get list of allowed status transitions"""
-        allowed = self.VALID_TRANSITIONS.get(current_status, [])
-        return [status.value for status in allowed]
+    def _get_allowed_transitions(self, current_status: OrderStatus) -> Tuple[str, ...]:
+        """Get allowed status transitions as status values"""
+        return self._ALLOWED_VALUES.get(current_status, ())
@@ -2,12 +2,11 @@
 Update Product Use Case - Admin updates existing product
 Clean Architecture - Business Layer
 """
-from typing import Optional
-from decimal import Decimal
+from dataclasses import dataclass
+from typing import Optional, Union
+from decimal import Decimal, InvalidOperation
 from app.business.ports.product_repository import IProductRepository
-from app.business.ports.category_repository import ICategoryRepository
-from app.business.ports.brand_repository import IBrandRepository
-from app.domain.value_objects.money import Money
+from app.domain.value_objects.money import Money, VND
 from app.domain.exceptions import (
     ProductNotFoundException,
     ValidationException,
@@ -16,35 +15,67 @@ from app.domain.exceptions import (
 )
 
 
+@dataclass(slots=True)
 class UpdateProductInputData:
     """Input data for updating a product"""
+    product_id: int
+    name: str
+    description: str
+    price: Union[Decimal, str, float]
+    stock_quantity: int
+    category_id: int
+    brand_id: int
+    image_url: Optional[str] = None
+    is_visible: bool = True
     
-    def __init__(
-        self,
-        product_id: int,
-        name: str,
-        description: str,
-        price: float,
-        stock_quantity: int,
-        category_id: int,
-        brand_id: int,
-        image_url: Optional[str] = None,
-        is_visible: bool = True
-    ):
-        self.product_id = product_id
-        self.name = name
-        self.description = description
-        self.price = price
-        self.stock_quantity = stock_quantity
-        self.category_id = category_id
-        self.brand_id = brand_id
-        self.image_url = image_url
-        self.is_visible = is_visible
+    def __post_init__(self):
+        """Normalize, then validate, so validation and persistence see the same values"""
+        if isinstance(self.name, str):
+            self.name = self.name.strip()
+        if isinstance(self.description, str):
+            self.description = self.description.strip()
+        # Convert once at the boundary; floats go through their shortest repr
+        if self.price is not None and not isinstance(self.price, Decimal):
+            try:
+                self.price = Decimal(str(self.price))
+            except InvalidOperation:
+                raise ValueError("Giá sản phẩm phải là số")
+        
+        # Validate
+        if not isinstance(self.product_id, int) or self.product_id <= 0:
+            raise ValueError("ID sản phẩm không hợp lệ")
+        
+        if not self.name or len(self.name) < 3:
+            raise ValueError("Tên sản phẩm phải có ít nhất 3 ký tự")
+        
+        if not self.description or len(self.description) < 10:
+            raise ValueError("Mô tả sản phẩm phải có ít nhất 10 ký tự")
+        
+        if self.price is None:
+            raise ValueError("Giá sản phẩm phải lớn hơn 0")
+        
+        # NaN cannot be compared and Infinity cannot be stored
+        if not self.price.is_finite():
+            raise ValueError("Giá sản phẩm không hợp lệ")
+        
+        if self.price <= 0:
+            raise ValueError("Giá sản phẩm phải lớn hơn 0")
+        
+        if not isinstance(self.stock_quantity, int) or self.stock_quantity < 0:
+            raise ValueError("Số lượng tồn kho không thể âm")
+        
+        if not isinstance(self.category_id, int) or self.category_id <= 0:
+            raise ValueError("Danh mục không hợp lệ")
+        
+        if not isinstance(self.brand_id, int) or self.brand_id <= 0:
+            raise ValueError("Thương hiệu không hợp lệ")
 
 
 class UpdateProductOutputData:
     """Output data for product update"""
     
+    __slots__ = ('success', 'product_id', 'product_name', 'message')
+    
     def __init__(
         self,
         success: bool,
@@ -64,15 +95,8 @@ class UpdateProductUseCase:
     Validates business rules and updates product entity
     """
     
-    def __init__(
-        self,
-        product_repository: IProductRepository,
-        category_repository: ICategoryRepository,
-        brand_repository: IBrandRepository
-    ):
+    def __init__(self, product_repository: IProductRepository):
         self.product_repository = product_repository
-        self.category_repository = category_repository
-        self.brand_repository = brand_repository
     
     def execute(self, input_data: UpdateProductInputData) -> UpdateProductOutputData:
         """
@@ -85,46 +109,42 @@ class UpdateProductUseCase:
             UpdateProductOutputData with update result
         """
         try:
-            # Step 1: Validate input
-            self._validate_input(input_data)
-            
-            # Step 2: Get existing product
-            product = self.product_repository.find_by_id(input_data.product_id)
-            if not product:
+            # Step 1: Get existing product, check its category and brand exist
+            # and that the name is free, all in one repository call
+            context = self.product_repository.fetch_update_context(
+                input_data.product_id,
+                category_id=input_data.category_id,
+                brand_id=input_data.brand_id,
+                name=input_data.name
+            )
+            if context is None:
                 raise ProductNotFoundException(product_id=input_data.product_id)
+            product = context.product
             
-            # Step 3: Verify category exists
-            category = self.category_repository.find_by_id(input_data.category_id)
-            if not category:
+            # Step 2: Verify category exists
+            if not context.category_exists:
                 raise CategoryNotFoundException(input_data.category_id)
             
-            # Step 4: Verify brand exists
-            brand = self.brand_repository.find_by_id(input_data.brand_id)
-            if not brand:
+            # Step 3: Verify brand exists
+            if not context.brand_exists:
                 raise BrandNotFoundException(input_data.brand_id)
             
-            # Step 5: Check for duplicate name (excluding current product)
-            existing_product = self.product_repository.find_by_name(input_data.name)
-            if existing_product and existing_product.id != input_data.product_id:
+            # Step 4: Check for duplicate name (excluding current product)
+            if context.name_taken:
                 raise ValidationException(f"Sản phẩm với tên '{input_data.name}' đã tồn tại")
             
-            # Step 6: Update product entity using domain methods
+            # Step 5: Update product entity using domain methods
             product.update_details(
                 name=input_data.name,
                 description=input_data.description,
-                price=Money(Decimal(str(input_data.price)), 'VND'),
+                price=Money(input_data.price, VND),
                 category_id=input_data.category_id,
                 brand_id=input_data.brand_id,
                 image_url=input_data.image_url
             )
             
             # Handle stock quantity change
-            if input_data.stock_quantity != product.stock_quantity:
-                stock_diff = input_data.stock_quantity - product.stock_quantity
-                if stock_diff > 0:
-                    product.add_stock(stock_diff)
-                else:
-                    product.reduce_stock(-stock_diff)
+            product.set_stock(input_data.stock_quantity)
             
             # Handle visibility
             if input_data.is_visible and not product.is_visible:
@@ -132,7 +152,7 @@ class UpdateProductUseCase:
             elif not input_data.is_visible and product.is_visible:
                 product.hide()
             
-            # Step 7: Save changes
+            # Step 6: Save changes
             saved_product = self.product_repository.save(product)
             
             return UpdateProductOutputData(
@@ -153,26 +173,3 @@ class UpdateProductUseCase:
                 success=False,
                 message=f"Lỗi không xác định: {str(e)}"
             )
-    
-    def _validate_input(self, input_data: UpdateProductInputData):
-        """Validate input data"""
-        if input_data.product_id <= 0:
-            raise ValidationException("ID sản phẩm không hợp lệ")
-        
-        if not input_data.name or len(input_data.name.strip()) < 3:
-            raise ValidationException("Tên sản phẩm phải có ít nhất 3 ký tự")
-        
-        if not input_data.description or len(input_data.description.strip()) < 10:
-            raise ValidationException("Mô tả sản phẩm phải có ít nhất 10 ký tự")
-        
-        if input_data.price <= 0:
-            raise ValidationException("Giá sản phẩm phải lớn hơn 0")
-        
-        if input_data.stock_quantity < 0:
-            raise ValidationException("Số lượng tồn kho không thể âm")
-        
-        if input_data.category_id <= 0:
-            raise ValidationException("Danh mục không hợp lệ")
-        
-        if input_data.brand_id <= 0:
-            raise ValidationException("Thương hiệu không hợp lệ")
@@ -17,22 +17,35 @@ Clean Architecture:
 - Dependencies: Domain entities, Repository interface (Port)
 - NO infrastructure dependencies
 """
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional
 import re
 
 from ..ports import IUserRepository
-from ...domain.entities import User
 from ...domain.value_objects import Email, PhoneNumber
 from ...domain.enums import UserRole
-from ...domain.exceptions import UserNotFoundException, UserAlreadyExistsException
+from ...domain.exceptions import (
+    UserNotFoundException,
+    UserAlreadyExistsException,
+    ConcurrencyConflictException
+)
+
+# Username: alphanumeric + underscore only (checked with fullmatch)
+_USERNAME_RE = re.compile(r'[A-Za-z0-9_]+')
+
+
+@lru_cache(maxsize=4096)
+def _make_email(address: str) -> Email:
+    """Build a validated Email, reusing the instance for repeated addresses (Email is immutable)"""
+    return Email(address)
 
 
 # ============================================================================
 # INPUT DTO
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class UpdateUserInputData:
     """
     Input data for updating user by admin
@@ -59,6 +72,11 @@ class UpdateUserInputData:
     address: Optional[str] = None
     role: Optional[str] = None
     is_active: Optional[bool] = None
+    # Set by __post_init__ (slots need them declared)
+    _phone_provided: bool = field(init=False, default=False, repr=False)
+    _address_provided: bool = field(init=False, default=False, repr=False)
+    _address_value: Optional[str] = field(init=False, default=None, repr=False)
+    _has_changes: bool = field(init=False, default=False, repr=False)
     
     def __post_init__(self):
         """Validate input data"""
@@ -74,6 +92,14 @@ class UpdateUserInputData:
         self._address_provided = self.address is not None
         self._address_value = self.address  # Store original for clearing
         
+        # Nothing to update when every optional field was omitted
+        self._has_changes = any(
+            value is not None for value in (
+                self.username, self.email, self.full_name, self.phone_number,
+                self.address, self.role, self.is_active
+            )
+        )
+        
         # Validate username if provided
         if self.username is not None:
             self.username = self.username.strip()
@@ -81,12 +107,12 @@ class UpdateUserInputData:
                 raise ValueError("Username must be 3-50 characters")
             
             # Username: alphanumeric + underscore only
-            if not re.match(r'^[a-zA-Z0-9_]+$', self.username):
+            if not _USERNAME_RE.fullmatch(self.username):
                 raise ValueError("Username must contain only alphanumeric characters and underscores")
         
         # Validate email if provided
         if self.email is not None:
-            self.email = Email(self.email.strip())
+            self.email = _make_email(self.email.strip())
         
         # Validate full_name if provided
         if self.full_name is not None:
@@ -121,7 +147,7 @@ class UpdateUserInputData:
 # OUTPUT DTO
 # ============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class UpdateUserOutputData:
     """
     Output data for update user operation
@@ -163,6 +189,9 @@ class UpdateUserByAdminUseCase:
     6. All field validations
     """
     
+    # Attempts at read-modify-save before giving up on a version conflict
+    MAX_SAVE_ATTEMPTS = 3
+    
     def __init__(self, user_repository: IUserRepository):
         """
         Initialize use case with dependencies
@@ -183,147 +212,25 @@ class UpdateUserByAdminUseCase:
             UpdateUserOutputData with success/error information
         """
         try:
-            # Step 1: Fetch the user to update
-            user = self._user_repository.find_by_id(input_data.user_id)
-            if not user:
-                return UpdateUserOutputData(
-                    success=False,
-                    user_id=None,
-                    username=None,
-                    message=f"User with ID {input_data.user_id} not found"
-                )
+            # Nothing to apply: confirm the user exists but skip the write
+            if not input_data._has_changes:
+                return self._confirm_unchanged(input_data.user_id)
             
-            # Step 2: Self-action protection checks
-            is_self_action = (input_data.user_id == input_data.admin_user_id)
-            
-            # Check self-deactivation
-            if is_self_action and input_data.is_active is not None and not input_data.is_active:
-                return UpdateUserOutputData(
-                    success=False,
-                    user_id=None,
-                    username=None,
-                    message="Cannot deactivate yourself"
-                )
-            
-            # Check self-demotion
-            if is_self_action and input_data.role is not None:
-                if user.is_admin() and input_data.role == UserRole.CUSTOMER:
-                    return UpdateUserOutputData(
-                        success=False,
-                        user_id=None,
-                        username=None,
-                        message="Cannot change your own role"
-                    )
-            
-            # Step 3: Update username if provided
-            username_changed = False
-            if input_data.username is not None:
-                # Check if username changed
-                if input_data.username != user.username:
-                    # Check uniqueness
-                    if self._user_repository.exists_by_username(input_data.username):
-                        return UpdateUserOutputData(
-                            success=False,
-                            user_id=None,
-                            username=None,
-                            message=f"Username '{input_data.username}' already exists"
-                        )
-                    username_changed = True
-                    # Update username (directly modify private field via reconstruction)
-                    user = User.reconstruct(
-                        user_id=user.id,
-                        username=input_data.username,
-                        email=user.email,
-                        password_hash=user.password_hash,
-                        full_name=user.full_name,
-                        phone_number=user.phone_number,
-                        address=user.address,
-                        role=user.role,
-                        is_active=user.is_active,
-                        created_at=user.created_at
-                    )
-            
-            # Step 4: Update email if provided
-            if input_data.email is not None:
-                # Check if email changed
-                if input_data.email.address != user.email.address:
-                    # Check uniqueness
-                    if self._user_repository.exists_by_email(input_data.email):
-                        return UpdateUserOutputData(
-                            success=False,
-                            user_id=None,
-                            username=None,
-                            message=f"Email '{input_data.email.address}' already exists"
-                        )
-                    # Update email
-                    user = User.reconstruct(
-                        user_id=user.id,
-                        username=user.username,
-                        email=input_data.email,
-                        password_hash=user.password_hash,
-                        full_name=user.full_name,
-                        phone_number=user.phone_number,
-                        address=user.address,
-                        role=user.role,
-                        is_active=user.is_active,
-                        created_at=user.created_at
-                    )
-            
-            # Step 5: Update profile fields (full_name, phone, address)
-            # Handle full_name update
-            if input_data.full_name is not None:
-                user.update_profile(full_name=input_data.full_name)
-            
-            # Handle phone_number - including clearing (empty string → None)
-            if input_data._phone_provided:
-                if input_data.phone_number is None:
-                    # Clear phone by reconstructing user
-                    user = User.reconstruct(
-                        user_id=user.id,
-                        username=user.username,
-                        email=user.email,
-                        password_hash=user.password_hash,
-                        full_name=user.full_name,
-                        phone_number=None,
-                        address=user.address,
-                        role=user.role,
-                        is_active=user.is_active,
-                        created_at=user.created_at
-                    )
-                else:
-                    # Update phone
-                    user.update_profile(phone_number=input_data.phone_number)
-            
-            # Handle address - including clearing (empty string → None)
-            if input_data._address_provided:
-                # Pass the address value (can be empty string for clearing)
-                user.update_profile(address=input_data._address_value)
-            
-            # Step 6: Update role if provided
-            if input_data.role is not None:
-                current_role = user.role
-                if input_data.role != current_role:
-                    if input_data.role == UserRole.ADMIN:
-                        user.promote_to_admin()
-                    else:  # CUSTOMER
-                        user.demote_to_customer()
-            
-            # Step 7: Update is_active if provided
-            if input_data.is_active is not None:
-                if input_data.is_active and not user.is_active:
-                    user.activate()
-                elif not input_data.is_active and user.is_active:
-                    user.deactivate()
-            
-            # Step 8: Save updated user
-            updated_user = self._user_repository.save(user)
-            
-            # Step 9: Return success
+            for attempt in range(1, self.MAX_SAVE_ATTEMPTS + 1):
+                try:
+                    return self._apply_update(input_data)
+                except ConcurrencyConflictException:
+                    # Another admin saved the user first: re-read and re-apply
+                    if attempt == self.MAX_SAVE_ATTEMPTS:
+                        raise
+        
+        except ConcurrencyConflictException as e:
+            # Still conflicting after every retry
             return UpdateUserOutputData(
-                success=True,
-                user_id=updated_user.id,
-                username=updated_user.username,
-                message="User updated successfully"
+                success=False,
+                user_id=None,
+                username=None,
+                message=str(e)
             )
         
         except ValueError as e:
@@ -343,12 +250,141 @@ class UpdateUserByAdminUseCase:
                 username=None,
                 message=str(e)
             )
+    
+    def _confirm_unchanged(self, user_id: int) -> UpdateUserOutputData:
+        """Report an empty update as successful only for an existing user"""
+        user = self._user_repository.find_by_id(user_id)
+        if user is None:
+            return UpdateUserOutputData(
+                success=False,
+                user_id=None,
+                username=None,
+                message=f"User with ID {user_id} not found"
+            )
         
-        except Exception as e:
-            # Unexpected errors
+        return UpdateUserOutputData(
+            success=True,
+            user_id=user.id,
+            username=user.username,
+            message="No changes to update"
+        )
+    
+    def _apply_update(self, input_data: UpdateUserInputData) -> UpdateUserOutputData:
+        """
+        Read the user, apply the requested changes and save with a version check
+        
+        Raises:
+            ConcurrencyConflictException: If the user changed since it was read
+        """
+        # Step 1: Fetch the user to update and check the requested
+        # username/email against other users in the same query
+        context = self._user_repository.fetch_for_update(
+            input_data.user_id,
+            candidate_username=input_data.username,
+            candidate_email=input_data.email
+        )
+        if context is None:
             return UpdateUserOutputData(
                 success=False,
                 user_id=None,
                 username=None,
-                message=f"Failed to update user: {str(e)}"
+                message=f"User with ID {input_data.user_id} not found"
             )
+        user = context.user
+        
+        # Step 2: Self-action protection checks
+        is_self_action = (input_data.user_id == input_data.admin_user_id)
+        
+        # Check self-deactivation
+        if is_self_action and input_data.is_active is not None and not input_data.is_active:
+            return UpdateUserOutputData(
+                success=False,
+                user_id=None,
+                username=None,
+                message="Cannot deactivate yourself"
+            )
+        
+        # Check self-demotion
+        if is_self_action and input_data.role is not None:
+            if user.is_admin() and input_data.role == UserRole.CUSTOMER:
+                return UpdateUserOutputData(
+                    success=False,
+                    user_id=None,
+                    username=None,
+                    message="Cannot change your own role"
+                )
+        
+        # Step 3: Update username if provided
+        username_changed = False
+        if input_data.username is not None:
+            # Check if username changed
+            if input_data.username != user.username:
+                # Check uniqueness
+                if context.username_taken:
+                    return UpdateUserOutputData(
+                        success=False,
+                        user_id=None,
+                        username=None,
+                        message=f"Username '{input_data.username}' already exists"
+                    )
+                username_changed = True
+                user.change_username(input_data.username)
+        
+        # Step 4: Update email if provided
+        if input_data.email is not None:
+            # Check if email changed
+            if input_data.email.address != user.email.address:
+                # Check uniqueness
+                if context.email_taken:
+                    return UpdateUserOutputData(
+                        success=False,
+                        user_id=None,
+                        username=None,
+                        message=f"Email '{input_data.email.address}' already exists"
+                    )
+                user.change_email(input_data.email)
+        
+        # Step 5: Update profile fields (full_name, phone, address)
+        # Handle full_name update
+        if input_data.full_name is not None:
+            user.update_profile(full_name=input_data.full_name)
+        
+        # Handle phone_number - including clearing (empty string → None)
+        if input_data._phone_provided:
+            if input_data.phone_number is None:
+                user.clear_phone()
+            else:
+                # Update phone
+                user.update_profile(phone_number=input_data.phone_number)
+        
+        # Handle address - including clearing (empty string → None)
+        if input_data._address_provided:
+            # Pass the address value (can be empty string for clearing)
+            user.update_profile(address=input_data._address_value)
+        
+        # Step 6: Update role if provided
+        if input_data.role is not None:
+            current_role = user.role
+            if input_data.role != current_role:
+                if input_data.role == UserRole.ADMIN:
+                    user.promote_to_admin()
+                else:  # CUSTOMER
+                    user.demote_to_customer()
+        
+        # Step 7: Update is_active if provided
+        if input_data.is_active is not None:
+            if input_data.is_active and not user.is_active:
+                user.activate()
+            elif not input_data.is_active and user.is_active:
+                user.deactivate()
+        
+        # Step 8: Save updated user
+        updated_user = self._user_repository.save(user)
+        
+        # Step 9: Return success
+        return UpdateUserOutputData(
+            success=True,
+            user_id=updated_user.id,
+            username=updated_user.username,
+            message="User updated successfully"
+        )
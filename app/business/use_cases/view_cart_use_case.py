@@ -1,13 +1,39 @@
 """View Cart Use Case - Retrieve user's cart with items"""
 from dataclasses import dataclass
-from typing import List, Optional
+from functools import lru_cache
+from typing import Optional, Tuple
 from decimal import Decimal
-from app.business.ports.cart_repository import ICartRepository
-from app.business.ports.product_repository import IProductRepository
+from app.business.ports.cart_repository import ICartRepository, CartLineView
 from app.domain.exceptions import ValidationException
 
+# Totals are computed in integer cents and converted to Decimal only for output;
+# prices are stored with two decimal places, so the conversion is exact
+_ZERO = Decimal('0.00')
+_TAX_PERCENT = 10  # 10% tax on subtotal
+_FREE_SHIPPING_THRESHOLD_CENTS = 500_00
+_STANDARD_SHIPPING_CENTS = 20_00
 
-@dataclass
+
+def _to_cents(amount: Decimal) -> int:
+    """Convert a two-decimal amount to integer cents"""
+    return int(amount.scaleb(2))
+
+
+def _from_cents(cents: int) -> Decimal:
+    """Convert integer cents back to a two-decimal amount"""
+    return Decimal(cents).scaleb(-2)
+
+
+@lru_cache(maxsize=4096)
+def _tax_cents(subtotal_cents: int) -> int:
+    """10% tax in cents, rounded half to even; cached since carts often share subtotals"""
+    tax_cents, remainder = divmod(subtotal_cents * _TAX_PERCENT, 100)
+    if remainder > 50 or (remainder == 50 and tax_cents % 2):
+        tax_cents += 1
+    return tax_cents
+
+
+@dataclass(frozen=True, slots=True)
 class CartItemOutputData:
     """Output data for a single cart item"""
     cart_item_id: int
@@ -22,34 +48,25 @@ class CartItemOutputData:
     is_available: bool
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ViewCartOutputData:
-    """Output data for viewing cart"""
+    """Output data for viewing cart (immutable and hashable, so snapshots can be cached)"""
     success: bool
     cart_id: Optional[int] = None
-    items: List[CartItemOutputData] = None
+    items: Tuple[CartItemOutputData, ...] = ()
     total_items: int = 0
-    subtotal: Decimal = Decimal('0.00')
-    tax: Decimal = Decimal('0.00')
-    shipping: Decimal = Decimal('0.00')
-    total: Decimal = Decimal('0.00')
+    subtotal: Decimal = _ZERO
+    tax: Decimal = _ZERO
+    shipping: Decimal = _ZERO
+    total: Decimal = _ZERO
     error_message: str = ""
-    
-    def __post_init__(self):
-        if self.items is None:
-            self.items = []
 
 
 class ViewCartUseCase:
     """Use case for viewing the shopping cart"""
 
-    def __init__(
-        self,
-        cart_repository: ICartRepository,
-        product_repository: IProductRepository
-    ):
+    def __init__(self, cart_repository: ICartRepository):
         self.cart_repository = cart_repository
-        self.product_repository = product_repository
 
     def execute(self, user_id: int) -> ViewCartOutputData:
         """
@@ -67,69 +84,45 @@ class ViewCartUseCase:
             if user_id <= 0:
                 raise ValidationException("Invalid user ID")
             
-            # Find cart for user
-            cart = self.cart_repository.find_by_user_id(user_id)
+            # Load the cart lines joined with current product details in one query
+            cart_view = self.cart_repository.find_cart_view(user_id)
             
             # If no cart exists, return empty cart
-            if not cart or not cart.items:
+            if cart_view is None or not cart_view.item_count:
                 return ViewCartOutputData(
                     success=True,
                     cart_id=None,
-                    items=[],
+                    items=(),
                     total_items=0,
-                    subtotal=Decimal('0.00'),
-                    tax=Decimal('0.00'),
-                    shipping=Decimal('0.00'),
-                    total=Decimal('0.00')
+                    subtotal=_ZERO,
+                    tax=_ZERO,
+                    shipping=_ZERO,
+                    total=_ZERO
                 )
             
-            # Build cart items with product information
-            cart_items = []
-            subtotal = Decimal('0.00')
-            
-            for item in cart.items:
-                # Get current product information
-                product = self.product_repository.find_by_id(item.product_id)
-                
-                if product:
-                    # Calculate item subtotal
-                    item_subtotal = product.price.multiply(Decimal(item.quantity))
-                    subtotal += item_subtotal.amount
-                    
-                    # Check stock availability
-                    is_available = (
-                        product.is_visible and
-                        product.stock_quantity is not None and
-                        product.stock_quantity >= item.quantity
-                    )
-                    
-                    cart_items.append(CartItemOutputData(
-                        cart_item_id=item.cart_item_id,
-                        product_id=product.id,  # Product entity uses .id, not .product_id
-                        product_name=product.name,
-                        product_image=product.image_url,
-                        price=product.price.amount,
-                        currency=product.price.currency,
-                        quantity=item.quantity,
-                        subtotal=item_subtotal.amount,
-                        stock_available=product.stock_quantity,
-                        is_available=is_available
-                    ))
+            # Build cart items straight into the output tuple; items whose
+            # product was deleted since they were added have no line
+            lines = cart_view.lines
+            line_cents = [_to_cents(line.price.amount) * line.quantity for line in lines]
+            cart_items = tuple(
+                self._build_item_output(line, cents) for line, cents in zip(lines, line_cents)
+            )
+            subtotal_cents = sum(line_cents)
             
             # Calculate tax and shipping
-            tax = self._calculate_tax(subtotal)
-            shipping = self._calculate_shipping(subtotal)
-            total = subtotal + tax + shipping
+            tax_cents = self._calculate_tax_cents(subtotal_cents)
+            shipping_cents = self._calculate_shipping_cents(subtotal_cents)
+            total_cents = subtotal_cents + tax_cents + shipping_cents
             
             return ViewCartOutputData(
                 success=True,
-                cart_id=cart.id,
+                cart_id=cart_view.cart_id,
                 items=cart_items,
                 total_items=len(cart_items),
-                subtotal=subtotal,
-                tax=tax,
-                shipping=shipping,
-                total=total
+                subtotal=_from_cents(subtotal_cents),
+                tax=_from_cents(tax_cents),
+                shipping=_from_cents(shipping_cents),
+                total=_from_cents(total_cents)
             )
             
         except ValidationException as e:
@@ -137,29 +130,47 @@ class ViewCartUseCase:
                 success=False,
                 error_message=str(e)
             )
-        except Exception as e:
-            return ViewCartOutputData(
-                success=False,
-                error_message=f"An error occurred while viewing cart: {str(e)}"
-            )
 
-    def _calculate_tax(self, subtotal: Decimal) -> Decimal:
+    def _build_item_output(self, line: CartLineView, subtotal_cents: int) -> CartItemOutputData:
+        """Build the output for one cart line with its precomputed subtotal"""
+        # Read each field once; they are used several times below
+        quantity = line.quantity
+        price = line.price
+        stock_quantity = line.stock_quantity
+        
+        # Check stock availability
+        is_available = (
+            line.is_visible and
+            stock_quantity is not None and
+            stock_quantity >= quantity
+        )
+        
+        return CartItemOutputData(
+            cart_item_id=line.cart_item_id,
+            product_id=line.product_id,
+            product_name=line.product_name,
+            product_image=line.product_image,
+            price=price.amount,
+            currency=price.currency,
+            quantity=quantity,
+            subtotal=_from_cents(subtotal_cents),
+            stock_available=stock_quantity,
+            is_available=is_available
+        )
+
+    def _calculate_tax_cents(self, subtotal_cents: int) -> int:
         """
-        Calculate tax amount
-        Business rule: 10% tax on subtotal
+        Calculate tax amount in cents
+        Business rule: 10% tax on subtotal, rounded half to even like Decimal.quantize
         """
-        tax_rate = Decimal('0.10')
-        return (subtotal * tax_rate).quantize(Decimal('0.01'))
+        return _tax_cents(subtotal_cents)
 
-    def _calculate_shipping(self, subtotal: Decimal) -> Decimal:
+    def _calculate_shipping_cents(self, subtotal_cents: int) -> int:
         """
-        Calculate shipping cost
+        Calculate shipping cost in cents
         Business rule: Free shipping for orders over $500, otherwise $20
         """
-        free_shipping_threshold = Decimal('500.00')
-        standard_shipping = Decimal('20.00')
-        
-        if subtotal >= free_shipping_threshold:
-            return Decimal('0.00')
+        if subtotal_cents >= _FREE_SHIPPING_THRESHOLD_CENTS:
+            return 0
         else:
-            return standard_shipping
+            return _STANDARD_SHIPPING_CENTS
@@ -0,0 +1,39 @@
+"""
+Shared field validation for domain entities
+NO framework dependencies!
+"""
+from typing import Optional
+
+
+def validate_min_length(value: str, min_length: int, label: str) -> str:
+    """
+    Strip a text field and check its length
+    
+    Args:
+        value: Raw field value (may be None or empty)
+        min_length: Minimum length after stripping
+        label: Field name used in the error message
+    
+    Returns:
+        The stripped value
+    
+    Raises:
+        ValueError: If the stripped value is shorter than min_length
+    """
+    stripped = value.strip() if value else ""
+    if len(stripped) < min_length:
+        raise ValueError(f"{label} must be at least {min_length} characters")
+    return stripped
+
+
+def normalize_optional_text(value: Optional[str]) -> Optional[str]:
+    """
+    Strip an optional text field; empty values are stored as None
+    
+    Args:
+        value: Raw field value (may be None or empty)
+    
+    Returns:
+        The stripped value, or None if the value is empty
+    """
+    return value.strip() if value else None
@@ -3,7 +3,12 @@ Brand Domain Entity - Product brand information
 NO framework dependencies!
 """
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
+from ._validators import normalize_optional_text, validate_min_length
+
+
+# Bound once: entity constructors stamp times without re-resolving datetime.now
+_now = datetime.now
 
 
 class Brand:
@@ -16,6 +21,8 @@ class Brand:
     - Brands can be hidden without deletion
     """
     
+    __slots__ = ('_id', '_name', '_description', '_logo_url', '_is_active', '_created_at')
+    
     def __init__(self, name: str, description: Optional[str] = None, logo_url: Optional[str] = None):
         """
         Create a new brand
@@ -28,15 +35,14 @@ class Brand:
         Raises:
             ValueError: If validation fails
         """
-        if not name or len(name) < 2:
-            raise ValueError("Brand name must be at least 2 characters")
+        name = validate_min_length(name, 2, "Brand name")
         
         self._id: Optional[int] = None
-        self._name = name.strip()
-        self._description = description.strip() if description else None
+        self._name = name
+        self._description = normalize_optional_text(description)
         self._logo_url = logo_url
         self._is_active = True
-        self._created_at = datetime.now()
+        self._created_at = _now()
     
     @staticmethod
     def reconstruct(
@@ -57,6 +63,25 @@ class Brand:
         brand._created_at = created_at
         return brand
     
+    @staticmethod
+    def reconstruct_many(
+        rows: Iterable[Tuple[int, str, Optional[str], Optional[str], bool, datetime]]
+    ) -> List['Brand']:
+        """
+        Reconstruct many brands from database rows (no validation)
+        
+        Args:
+            rows: (brand_id, name, description, logo_url, is_active, created_at) tuples
+        """
+        new = object.__new__
+        brands = []
+        for row in rows:
+            brand = new(Brand)
+            (brand._id, brand._name, brand._description,
+             brand._logo_url, brand._is_active, brand._created_at) = row
+            brands.append(brand)
+        return brands
+    
     # Getters
     @property
     def id(self) -> Optional[int]:
@@ -82,6 +107,11 @@ class Brand:
     def created_at(self) -> datetime:
         return self._created_at
     
+    @staticmethod
+    def normalize_description(description: Optional[str]) -> Optional[str]:
+        """Normalize a description the way update_details stores it (shared with bulk UPDATEs)"""
+        return normalize_optional_text(description)
+    
     # Business methods
     def update_details(
         self,
@@ -91,12 +121,10 @@ class Brand:
     ):
         """Update brand details"""
         if name:
-            if len(name) < 2:
-                raise ValueError("Brand name must be at least 2 characters")
-            self._name = name.strip()
+            self._name = validate_min_length(name, 2, "Brand name")
         
         if description is not None:
-            self._description = description.strip() if description else None
+            self._description = self.normalize_description(description)
         
         if logo_url is not None:
             self._logo_url = logo_url
@@ -4,11 +4,15 @@ NO framework dependencies!
 """
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, ValuesView
 from ..value_objects import Money
 from ..exceptions import InvalidQuantityException, EmptyCartException, ProductNotFoundException
 
 
+# Bound once: entity constructors stamp times without re-resolving datetime.now
+_now = datetime.now
+
+
 class CartItem:
     """
     Cart item value object (part of Cart aggregate)
@@ -18,6 +22,8 @@ class CartItem:
     - Can update quantity
     """
     
+    __slots__ = ('_product_id', '_quantity', '_cart_item_id', '_cart_id', '_owner')
+    
     def __init__(self, product_id: int, quantity: int, cart_item_id: Optional[int] = None, cart_id: Optional[int] = None):
         """
         Create cart item
@@ -41,6 +47,7 @@ class CartItem:
         self._quantity = quantity
         self._cart_item_id = cart_item_id
         self._cart_id = cart_id
+        self._owner: Optional['Cart'] = None  # Cart whose running quantity total includes this item
     
     @property
     def product_id(self) -> int:
@@ -70,13 +77,13 @@ class CartItem:
         """
         if new_quantity <= 0:
             raise InvalidQuantityException(new_quantity)
-        self._quantity = new_quantity
+        self._set_quantity(new_quantity)
     
     def increase_quantity(self, amount: int = 1):
         """Increase quantity by amount"""
         if amount <= 0:
             raise ValueError("Amount must be positive")
-        self._quantity += amount
+        self._set_quantity(self._quantity + amount)
     
     def decrease_quantity(self, amount: int = 1):
         """
@@ -90,7 +97,14 @@ class CartItem:
         new_quantity = self._quantity - amount
         if new_quantity <= 0:
             raise InvalidQuantityException(new_quantity)
+        self._set_quantity(new_quantity)
+    
+    def _set_quantity(self, new_quantity: int):
+        """Store the new quantity and report the change to the owning cart"""
+        delta = new_quantity - self._quantity
         self._quantity = new_quantity
+        if self._owner is not None:
+            self._owner._quantity_changed(delta)
     
     def __eq__(self, other) -> bool:
         """Check equality based on product_id"""
@@ -117,6 +131,8 @@ class Cart:
     - Must have items to checkout
     """
     
+    __slots__ = ('_id', '_customer_id', '_items', '_total_quantity', '_created_at', '_updated_at', '_dirty')
+    
     def __init__(self, customer_id: int):
         """
         Create a new cart
@@ -133,8 +149,9 @@ class Cart:
         self._id: Optional[int] = None
         self._customer_id = customer_id
         self._items: Dict[int, CartItem] = {}  # product_id -> CartItem
-        self._created_at = datetime.now()
-        self._updated_at = datetime.now()
+        self._total_quantity = 0  # Kept in step with item quantities on every change
+        self._created_at = self._updated_at = _now()
+        self._dirty = False  # Set by mutators; touch_updated_at() stamps the time before a save
     
     @staticmethod
     def reconstruct(
@@ -148,9 +165,14 @@ class Cart:
         cart = object.__new__(Cart)
         cart._id = cart_id
         cart._customer_id = customer_id
+        # Build the item map in one comprehension, then hook items up to the cart
         cart._items = {item.product_id: item for item in items}
+        for item in cart._items.values():
+            item._owner = cart
+        cart._total_quantity = sum(item.quantity for item in cart._items.values())
         cart._created_at = created_at
         cart._updated_at = updated_at
+        cart._dirty = False
         return cart
     
     # Getters
@@ -167,6 +189,11 @@ class Cart:
         """Return list of cart items"""
         return list(self._items.values())
     
+    @property
+    def items_view(self) -> ValuesView[CartItem]:
+        """Return a read-only live view of cart items without copying them"""
+        return self._items.values()
+    
     @property
     def created_at(self) -> datetime:
         return self._created_at
@@ -198,9 +225,9 @@ class Cart:
             self._items[product_id].increase_quantity(quantity)
         else:
             # Add new item
-            self._items[product_id] = CartItem(product_id, quantity)
+            self._attach(CartItem(product_id, quantity))
         
-        self._updated_at = datetime.now()
+        self._dirty = True
     
     def remove_item(self, product_id: int):
         """
@@ -215,8 +242,8 @@ class Cart:
         if product_id not in self._items:
             raise ProductNotFoundException(product_id)
         
-        del self._items[product_id]
-        self._updated_at = datetime.now()
+        self._detach(self._items.pop(product_id))
+        self._dirty = True
     
     def update_item_quantity(self, product_id: int, new_quantity: int):
         """
@@ -234,12 +261,21 @@ class Cart:
             raise ProductNotFoundException(product_id)
         
         self._items[product_id].update_quantity(new_quantity)
-        self._updated_at = datetime.now()
+        self._dirty = True
     
     def clear(self):
         """Clear all items from cart"""
+        for item in self._items.values():
+            item._owner = None
         self._items.clear()
-        self._updated_at = datetime.now()
+        self._total_quantity = 0
+        self._dirty = True
+    
+    def touch_updated_at(self):
+        """Stamp updated_at once for all mutations since the last stamp"""
+        if self._dirty:
+            self._updated_at = _now()
+            self._dirty = False
     
     def is_empty(self) -> bool:
         """Check if cart is empty"""
@@ -251,7 +287,22 @@ class Cart:
     
     def get_total_quantity(self) -> int:
         """Get total quantity of all items"""
-        return sum(item.quantity for item in self._items.values())
+        return self._total_quantity
+    
+    def _attach(self, item: CartItem):
+        """Add an item and count its quantity in the running total"""
+        self._items[item.product_id] = item
+        item._owner = self
+        self._total_quantity += item.quantity
+    
+    def _detach(self, item: CartItem):
+        """Stop counting a removed item in the running total"""
+        item._owner = None
+        self._total_quantity -= item.quantity
+    
+    def _quantity_changed(self, delta: int):
+        """Apply a quantity change reported by one of this cart's items"""
+        self._total_quantity += delta
     
     def has_item(self, product_id: int) -> bool:
         """Check if cart has specific product"""
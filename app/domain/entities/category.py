@@ -3,7 +3,12 @@ Category Domain Entity - Product categorization
 NO framework dependencies!
 """
 from datetime import datetime
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
+from ._validators import normalize_optional_text, validate_min_length
+
+
+# Bound once: entity constructors stamp times without re-resolving datetime.now
+_now = datetime.now
 
 
 class Category:
@@ -16,6 +21,8 @@ class Category:
     - Categories can be hidden without deletion
     """
     
+    __slots__ = ('_id', '_name', '_description', '_created_at')
+    
     def __init__(self, name: str, description: Optional[str] = None):
         """
         Create a new category
@@ -27,13 +34,12 @@ class Category:
         Raises:
             ValueError: If validation fails
         """
-        if not name or len(name) < 2:
-            raise ValueError("Category name must be at least 2 characters")
+        name = validate_min_length(name, 2, "Category name")
         
         self._id: Optional[int] = None
-        self._name = name.strip()
-        self._description = description.strip() if description else None
-        self._created_at = datetime.now()
+        self._name = name
+        self._description = normalize_optional_text(description)
+        self._created_at = _now()
     
     @staticmethod
     def reconstruct(
@@ -50,6 +56,24 @@ class Category:
         category._created_at = created_at
         return category
     
+    @staticmethod
+    def reconstruct_many(
+        rows: Iterable[Tuple[int, str, Optional[str], datetime]]
+    ) -> List['Category']:
+        """
+        Reconstruct many categories from database rows (no validation)
+        
+        Args:
+            rows: (category_id, name, description, created_at) tuples
+        """
+        new = object.__new__
+        categories = []
+        for row in rows:
+            category = new(Category)
+            category._id, category._name, category._description, category._created_at = row
+            categories.append(category)
+        return categories
+    
     # Getters
     @property
     def id(self) -> Optional[int]:
@@ -67,16 +91,19 @@ class Category:
     def created_at(self) -> datetime:
         return self._created_at
     
+    @staticmethod
+    def normalize_description(description: Optional[str]) -> Optional[str]:
+        """Normalize a description the way update_details stores it (shared with bulk UPDATEs)"""
+        return normalize_optional_text(description)
+    
     # Business methods
     def update_details(self, name: Optional[str] = None, description: Optional[str] = None):
         """Update category details"""
         if name:
-            if len(name) < 2:
-                raise ValueError("Category name must be at least 2 characters")
-            self._name = name.strip()
+            self._name = validate_min_length(name, 2, "Category name")
         
         if description is not None:
-            self._description = description.strip() if description else None
+            self._description = self.normalize_description(description)
     
     def __eq__(self, other) -> bool:
         """Check equality based on ID"""
@@ -4,14 +4,22 @@ NO framework dependencies!
 """
 from datetime import datetime
 from decimal import Decimal
-from typing import List, Optional
+from typing import Iterable, List, Optional, Tuple
 from ..enums import OrderStatus, PaymentMethod
-from ..value_objects import Money
+from ..value_objects.money import Money, VND
 from ..exceptions import (
     EmptyOrderException,
     InvalidOrderStatusTransitionException,
     OrderAlreadyShippedException
 )
+from ._validators import validate_min_length
+
+
+# Bound once: entity constructors stamp times without re-resolving datetime.now
+_now = datetime.now
+
+# Shared start value for the Decimal total sums
+_ZERO = Decimal('0')
 
 
 class OrderItem:
@@ -23,6 +31,8 @@ class OrderItem:
     - Price is captured at order time (not reference to product)
     """
     
+    __slots__ = ('_product_id', '_product_name', '_quantity', '_unit_price')
+    
     def __init__(self, product_id: int, product_name: str, quantity: int, unit_price: Money):
         """
         Create order item
@@ -68,7 +78,7 @@ class OrderItem:
     
     def calculate_subtotal(self) -> Money:
         """Calculate subtotal for this item"""
-        return self._unit_price.multiply(Decimal(self._quantity))
+        return self._unit_price.multiply(self._quantity)
     
     def __repr__(self) -> str:
         return f"OrderItem(product_id={self._product_id}, quantity={self._quantity}, unit_price={self._unit_price})"
@@ -86,6 +96,12 @@ class Order:
     - Shipped orders cannot be modified
     """
     
+    __slots__ = (
+        '_id', '_customer_id', '_items', '_payment_method', '_shipping_address',
+        '_phone_number', '_notes', '_status', '_total_amount', '_created_at',
+        '_updated_at', '_version'
+    )
+    
     def __init__(
         self,
         customer_id: int,
@@ -110,26 +126,24 @@ class Order:
             EmptyOrderException: If order has no items
             ValueError: If validation fails
         """
-        if not items or len(items) == 0:
+        if not items:
             raise EmptyOrderException()
         if customer_id <= 0:
             raise ValueError("Invalid customer ID")
-        if not shipping_address or len(shipping_address) < 10:
-            raise ValueError("Shipping address must be at least 10 characters")
-        if not phone_number or len(phone_number) < 10:
-            raise ValueError("Phone number must be at least 10 characters")
+        shipping_address = validate_min_length(shipping_address, 10, "Shipping address")
+        phone_number = validate_min_length(phone_number, 10, "Phone number")
         
         self._id: Optional[int] = None
         self._customer_id = customer_id
-        self._items = items.copy()  # Defensive copy
+        self._items = tuple(items)  # Immutable, so reads need no copy
         self._payment_method = payment_method
-        self._shipping_address = shipping_address.strip()
-        self._phone_number = phone_number.strip()
+        self._shipping_address = shipping_address
+        self._phone_number = phone_number
         self._notes = notes.strip() if notes else ""
         self._status = OrderStatus.PENDING
         self._total_amount = self._calculate_total()
-        self._created_at = datetime.now()
-        self._updated_at = datetime.now()
+        self._created_at = self._updated_at = _now()
+        self._version = 1
     
     @staticmethod
     def reconstruct(
@@ -143,13 +157,14 @@ class Order:
         status: OrderStatus,
         total_amount: Money,
         created_at: datetime,
-        updated_at: datetime
+        updated_at: datetime,
+        version: int = 1
     ) -> 'Order':
         """Reconstruct order from database (no validation)"""
         order = object.__new__(Order)
         order._id = order_id
         order._customer_id = customer_id
-        order._items = items
+        order._items = tuple(items)
         order._payment_method = payment_method
         order._shipping_address = shipping_address
         order._phone_number = phone_number
@@ -158,6 +173,7 @@ class Order:
         order._total_amount = total_amount
         order._created_at = created_at
         order._updated_at = updated_at
+        order._version = version
         return order
     
     # Getters
@@ -170,8 +186,8 @@ class Order:
         return self._customer_id
     
     @property
-    def items(self) -> List[OrderItem]:
-        return self._items.copy()  # Return defensive copy
+    def items(self) -> Tuple[OrderItem, ...]:
+        return self._items
     
     @property
     def payment_method(self) -> PaymentMethod:
@@ -205,13 +221,37 @@ class Order:
     def updated_at(self) -> datetime:
         return self._updated_at
     
+    @property
+    def version(self) -> int:
+        """Row version as read from the database (optimistic concurrency token)"""
+        return self._version
+    
+    def increment_version(self):
+        """Advance the row version after the repository persisted a versioned update"""
+        self._version += 1
+    
     # Business methods
     def _calculate_total(self) -> Money:
         """Calculate total amount from items"""
-        total = Money(Decimal('0'), 'VND')
-        for item in self._items:
-            total = total.add(item.calculate_subtotal())
-        return total
+        total = sum(
+            (item._unit_price.amount * item._quantity for item in self._items),
+            _ZERO
+        )
+        return Money(total, VND)
+    
+    @staticmethod
+    def calculate_totals_bulk(orders: Iterable['Order']) -> Money:
+        """
+        Sum the total amounts of many orders into one Money
+        
+        Args:
+            orders: Orders to total (e.g. all completed orders for a report)
+            
+        Returns:
+            Combined total as Money (zero VND when there are no orders)
+        """
+        total = sum((order.total_amount.amount for order in orders), _ZERO)
+        return Money(total, VND)
     
     def ship(self):
         """
@@ -221,16 +261,13 @@ class Order:
             InvalidOrderStatusTransitionException: If transition is invalid
         """
         if not self._status.can_transition_to(OrderStatus.SHIPPING):
-            allowed = []
-            if self._status == OrderStatus.PENDING:
-                allowed = ["SHIPPING", "CANCELLED"]
             raise InvalidOrderStatusTransitionException(
-                str(self._status),
-                str(OrderStatus.SHIPPING),
-                allowed
+                self._status.value,
+                OrderStatus.SHIPPING.value,
+                ["SHIPPING", "CANCELLED"] if self._status is OrderStatus.PENDING else []
             )
         self._status = OrderStatus.SHIPPING
-        self._updated_at = datetime.now()
+        self._updated_at = _now()
     
     def complete(self):
         """
@@ -240,16 +277,13 @@ class Order:
             InvalidOrderStatusTransitionException: If transition is invalid
         """
         if not self._status.can_transition_to(OrderStatus.COMPLETED):
-            allowed = []
-            if self._status == OrderStatus.SHIPPING:
-                allowed = ["COMPLETED"]
             raise InvalidOrderStatusTransitionException(
-                str(self._status),
-                str(OrderStatus.COMPLETED),
-                allowed
+                self._status.value,
+                OrderStatus.COMPLETED.value,
+                ["COMPLETED"] if self._status is OrderStatus.SHIPPING else []
             )
         self._status = OrderStatus.COMPLETED
-        self._updated_at = datetime.now()
+        self._updated_at = _now()
     
     def cancel(self):
         """
@@ -259,26 +293,24 @@ class Order:
             InvalidOrderStatusTransitionException: If order cannot be cancelled
             OrderAlreadyShippedException: If order is already shipped
         """
-        if self._status == OrderStatus.SHIPPING or self._status == OrderStatus.COMPLETED:
+        if self._status is OrderStatus.SHIPPING or self._status is OrderStatus.COMPLETED:
             raise OrderAlreadyShippedException(self._id or 0)
         
         if not self._status.can_transition_to(OrderStatus.CANCELLED):
-            allowed = []
-            if self._status == OrderStatus.PENDING:
-                allowed = ["SHIPPING", "CANCELLED"]
             raise InvalidOrderStatusTransitionException(
-                str(self._status),
-                str(OrderStatus.CANCELLED),
-                allowed
+                self._status.value,
+                OrderStatus.CANCELLED.value,
+                ["SHIPPING", "CANCELLED"] if self._status is OrderStatus.PENDING else []
             )
         
         self._status = OrderStatus.CANCELLED
-        self._updated_at = datetime.now()
+        self._updated_at = _now()
     
     def update_status(self, new_status: OrderStatus):
         """
         Generic method to update order status
         Used by admin panel for flexible status updates
+        Re-applying the current status is a no-op
         
         Args:
             new_status: New order status
@@ -286,30 +318,33 @@ class Order:
         Raises:
             InvalidOrderStatusTransitionException: If transition is invalid
         """
+        if new_status is self._status:
+            return
+        
         if not self._status.can_transition_to(new_status):
             raise InvalidOrderStatusTransitionException(
-                str(self._status),
-                str(new_status)
+                self._status.value,
+                new_status.value
             )
         
         self._status = new_status
-        self._updated_at = datetime.now()
+        self._updated_at = _now()
     
     def is_pending(self) -> bool:
         """Check if order is pending"""
-        return self._status == OrderStatus.PENDING
+        return self._status is OrderStatus.PENDING
     
     def is_shipping(self) -> bool:
         """Check if order is shipping"""
-        return self._status == OrderStatus.SHIPPING
+        return self._status is OrderStatus.SHIPPING
     
     def is_completed(self) -> bool:
         """Check if order is completed"""
-        return self._status == OrderStatus.COMPLETED
+        return self._status is OrderStatus.COMPLETED
     
     def is_cancelled(self) -> bool:
         """Check if order is cancelled"""
-        return self._status == OrderStatus.CANCELLED
+        return self._status is OrderStatus.CANCELLED
     
     def can_be_cancelled(self) -> bool:
         """Check if order can be cancelled"""
@@ -338,8 +373,8 @@ class Order:
         return self._id is not None and self._id == other._id
     
     def __hash__(self) -> int:
-        """Hash based on ID"""
-        return hash(self._id) if self._id else hash((self._customer_id, self._created_at))
+        """Hash based on ID; unsaved instances fall back to identity"""
+        return hash(self._id) if self._id is not None else object.__hash__(self)
     
     def __repr__(self) -> str:
         """Developer representation"""
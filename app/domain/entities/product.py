@@ -3,10 +3,14 @@ Product Domain Entity - Rich model with business logic
 NO framework dependencies!
 """
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 from ..value_objects import Money
 from ..exceptions import InvalidProductPriceException, InsufficientStockException
+from ._validators import validate_min_length
+
+
+# Bound once: entity constructors stamp times without re-resolving datetime.now
+_now = datetime.now
 
 
 class Product:
@@ -20,6 +24,11 @@ class Product:
     - Stock reservation for orders
     """
     
+    __slots__ = (
+        '_id', '_name', '_description', '_price', '_stock_quantity', '_category_id',
+        '_brand_id', '_image_url', '_is_visible', '_created_at'
+    )
+    
     def __init__(
         self,
         name: str,
@@ -46,8 +55,7 @@ class Product:
             ValueError: If validation fails
             InvalidProductPriceException: If price is invalid
         """
-        if not name or len(name) < 2:
-            raise ValueError("Product name must be at least 2 characters")
+        name = validate_min_length(name, 2, "Product name")
         if not description:
             raise ValueError("Product description cannot be empty")
         if price.amount <= 0:
@@ -60,7 +68,7 @@ class Product:
             raise ValueError("Invalid brand ID")
         
         self._id: Optional[int] = None
-        self._name = name.strip()
+        self._name = name
         self._description = description.strip()
         self._price = price
         self._stock_quantity = stock_quantity
@@ -68,7 +76,7 @@ class Product:
         self._brand_id = brand_id
         self._image_url = image_url
         self._is_visible = True
-        self._created_at = datetime.now()
+        self._created_at = _now()
     
     @staticmethod
     def reconstruct(
@@ -150,9 +158,7 @@ class Product:
     ):
         """Update product details"""
         if name:
-            if len(name) < 2:
-                raise ValueError("Product name must be at least 2 characters")
-            self._name = name.strip()
+            self._name = validate_min_length(name, 2, "Product name")
         
         if description:
             self._description = description.strip()
@@ -239,6 +245,20 @@ class Product:
             raise ValueError("Quantity to restore must be positive")
         self._stock_quantity += quantity
     
+    def set_stock(self, quantity: int):
+        """
+        Set stock quantity to an absolute value (admin stock correction)
+        
+        Args:
+            quantity: New stock quantity
+            
+        Raises:
+            ValueError: If quantity is negative
+        """
+        if quantity < 0:
+            raise ValueError("Stock quantity cannot be negative")
+        self._stock_quantity = quantity
+    
     def is_in_stock(self) -> bool:
         """Check if product is in stock"""
         return self._stock_quantity > 0
@@ -278,7 +298,7 @@ class Product:
         """
         if quantity <= 0:
             raise ValueError("Quantity must be positive")
-        return self._price.multiply(Decimal(quantity))
+        return self._price.multiply(quantity)
     
     def __eq__(self, other) -> bool:
         """Check equality based on ID"""
@@ -287,8 +307,8 @@ class Product:
         return self._id is not None and self._id == other._id
     
     def __hash__(self) -> int:
-        """Hash based on ID"""
-        return hash(self._id) if self._id else hash(self._name)
+        """Hash based on ID; unsaved instances fall back to identity"""
+        return hash(self._id) if self._id is not None else object.__hash__(self)
     
     def __repr__(self) -> str:
         """Developer representation"""
@@ -7,6 +7,11 @@ from typing import Optional
 from ..enums import UserRole
 from ..value_objects import Email, PhoneNumber
 from ..exceptions import InvalidCredentialsException, InsufficientPermissionsException
+from ._validators import validate_min_length
+
+
+# Bound once: entity constructors stamp times without re-resolving datetime.now
+_now = datetime.now
 
 
 class User:
@@ -20,6 +25,11 @@ class User:
     - Users can be deactivated but not deleted
     """
     
+    __slots__ = (
+        '_id', '_username', '_email', '_password_hash', '_full_name', '_phone_number',
+        '_address', '_role', '_is_active', '_created_at', '_version'
+    )
+    
     def __init__(
         self,
         username: str,
@@ -45,23 +55,22 @@ class User:
         Raises:
             ValueError: If any validation fails
         """
-        if not username or len(username) < 3:
-            raise ValueError("Username must be at least 3 characters")
+        username = validate_min_length(username, 3, "Username")
         if not password_hash:
             raise ValueError("Password hash cannot be empty")
-        if not full_name or len(full_name) < 2:
-            raise ValueError("Full name must be at least 2 characters")
+        full_name = validate_min_length(full_name, 2, "Full name")
         
         self._id: Optional[int] = None  # Set by repository on save
-        self._username = username.strip()
+        self._username = username
         self._email = email
         self._password_hash = password_hash
-        self._full_name = full_name.strip()
+        self._full_name = full_name
         self._phone_number = phone_number
         self._address = address.strip() if address else None
         self._role = role
         self._is_active = True
-        self._created_at = datetime.now()
+        self._created_at = _now()
+        self._version = 1
     
     @staticmethod
     def reconstruct(
@@ -74,7 +83,8 @@ class User:
         address: Optional[str],
         role: UserRole,
         is_active: bool,
-        created_at: datetime
+        created_at: datetime,
+        version: int = 1
     ) -> 'User':
         """
         Reconstruct user from database (no validation)
@@ -91,6 +101,7 @@ class User:
         user._role = role
         user._is_active = is_active
         user._created_at = created_at
+        user._version = version
         return user
     
     # Getters
@@ -134,6 +145,15 @@ class User:
     def created_at(self) -> datetime:
         return self._created_at
     
+    @property
+    def version(self) -> int:
+        """Row version as read from the database (optimistic concurrency token)"""
+        return self._version
+    
+    def increment_version(self):
+        """Advance the row version after the repository persisted a versioned update"""
+        self._version += 1
+    
     # Business methods
     def update_profile(
         self,
@@ -143,9 +163,7 @@ class User:
     ):
         """Update user profile information"""
         if full_name:
-            if len(full_name) < 2:
-                raise ValueError("Full name must be at least 2 characters")
-            self._full_name = full_name.strip()
+            self._full_name = validate_min_length(full_name, 2, "Full name")
         
         if phone_number:
             self._phone_number = phone_number
@@ -167,6 +185,23 @@ class User:
             raise ValueError("Password hash cannot be empty")
         self._password_hash = new_password_hash
     
+    def change_username(self, new_username: str):
+        """
+        Change username (uniqueness is checked by the caller)
+        
+        Raises:
+            ValueError: If username is too short
+        """
+        self._username = validate_min_length(new_username, 3, "Username")
+    
+    def change_email(self, new_email: Email):
+        """Change email (uniqueness is checked by the caller)"""
+        self._email = new_email
+    
+    def clear_phone(self):
+        """Remove the user's phone number"""
+        self._phone_number = None
+    
     def deactivate(self):
         """Deactivate user account"""
         if not self._is_active:
@@ -181,23 +216,23 @@ class User:
     
     def promote_to_admin(self):
         """Promote user to admin role"""
-        if self._role == UserRole.ADMIN:
+        if self._role is UserRole.ADMIN:
             raise ValueError("User is already an admin")
         self._role = UserRole.ADMIN
     
     def demote_to_customer(self):
         """Demote user to customer role"""
-        if self._role == UserRole.CUSTOMER:
+        if self._role is UserRole.CUSTOMER:
             raise ValueError("User is already a customer")
         self._role = UserRole.CUSTOMER
     
     def is_admin(self) -> bool:
         """Check if user is admin"""
-        return self._role == UserRole.ADMIN
+        return self._role is UserRole.ADMIN
     
     def is_customer(self) -> bool:
         """Check if user is customer"""
-        return self._role == UserRole.CUSTOMER
+        return self._role is UserRole.CUSTOMER
     
     def can_access_admin_panel(self) -> bool:
         """Check if user can access admin panel"""
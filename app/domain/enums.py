@@ -15,15 +15,15 @@ class UserRole(Enum):
     
     def is_admin(self) -> bool:
         """Check if role is admin"""
-        return self == UserRole.ADMIN
+        return self is UserRole.ADMIN
     
     def is_customer(self) -> bool:
         """Check if role is customer"""
-        return self == UserRole.CUSTOMER
+        return self is UserRole.CUSTOMER
     
     def is_guest(self) -> bool:
         """Check if role is guest"""
-        return self == UserRole.GUEST
+        return self is UserRole.GUEST
 
 
 class OrderStatus(Enum):
@@ -45,19 +45,22 @@ class OrderStatus(Enum):
         - SHIPPING -> COMPLETED
         - Others -> No transition allowed
         """
-        if self == OrderStatus.PENDING:
-            return new_status in [OrderStatus.SHIPPING, OrderStatus.CANCELLED]
-        elif self == OrderStatus.SHIPPING:
-            return new_status == OrderStatus.COMPLETED
-        return False
+        return new_status in _ORDER_STATUS_TRANSITIONS.get(self, frozenset())
     
     def is_terminal(self) -> bool:
         """Check if this is a terminal status (no further transitions)"""
-        return self in [OrderStatus.COMPLETED, OrderStatus.CANCELLED]
+        return self is OrderStatus.COMPLETED or self is OrderStatus.CANCELLED
     
     def is_modifiable(self) -> bool:
         """Check if order can still be modified"""
-        return self == OrderStatus.PENDING
+        return self is OrderStatus.PENDING
+
+
+# Allowed next statuses per order status; statuses not listed are terminal
+_ORDER_STATUS_TRANSITIONS = {
+    OrderStatus.PENDING: frozenset({OrderStatus.SHIPPING, OrderStatus.CANCELLED}),
+    OrderStatus.SHIPPING: frozenset({OrderStatus.COMPLETED}),
+}
 
 
 class PaymentMethod(Enum):
@@ -72,4 +75,4 @@ class PaymentMethod(Enum):
     
     def requires_confirmation(self) -> bool:
         """Check if payment method requires manual confirmation"""
-        return self == PaymentMethod.BANK_TRANSFER
+        return self is PaymentMethod.BANK_TRANSFER
@@ -269,3 +269,16 @@ class BrandHasProductsException(DomainException):
             f"Cannot delete brand '{brand_name}' because it has {product_count} product(s)",
             "BRAND_HAS_PRODUCTS"
         )
+
+
+# Concurrency exceptions
+class ConcurrencyConflictException(DomainException):
+    """Raised when an entity was modified by someone else since it was read"""
+    
+    def __init__(self, entity_name: str, entity_id: int):
+        self.entity_name = entity_name
+        self.entity_id = entity_id
+        super().__init__(
+            f"{entity_name} with ID {entity_id} was modified by another request",
+            "CONCURRENCY_CONFLICT"
+        )
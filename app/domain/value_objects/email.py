@@ -3,12 +3,18 @@ Email Value Object - Immutable representation of email addresses
 """
 import re
 
+# Simple regex pattern for email validation
+_EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+# Bound once so construction calls the C matcher without attribute lookups
+_EMAIL_MATCH = _EMAIL_PATTERN.match
+
 
 class Email:
     """Immutable email value object with validation"""
     
-    # Simple regex pattern for email validation
-    EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+    __slots__ = ('_address', '_local_part', '_domain')
+    
+    EMAIL_PATTERN = _EMAIL_PATTERN
     
     def __init__(self, address: str):
         """
@@ -25,10 +31,12 @@ class Email:
         
         address = address.strip().lower()
         
-        if not self.EMAIL_PATTERN.match(address):
+        if not _EMAIL_MATCH(address):
             raise ValueError(f"Invalid email format: {address}")
         
         self._address = address
+        # Split once; the pattern guarantees exactly one '@'
+        self._local_part, _, self._domain = address.partition('@')
     
     @property
     def address(self) -> str:
@@ -38,12 +46,12 @@ class Email:
     @property
     def domain(self) -> str:
         """Get the domain part of email"""
-        return self._address.split('@')[1]
+        return self._domain
     
     @property
     def local_part(self) -> str:
         """Get the local part of email (before @)"""
-        return self._address.split('@')[0]
+        return self._local_part
     
     def __eq__(self, other) -> bool:
         """Check equality"""
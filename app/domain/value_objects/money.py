@@ -2,15 +2,20 @@
 Money Value Object - Immutable representation of monetary values
 """
 from decimal import Decimal
-from typing import Optional
+from typing import Optional, Union
+
+# Shop currency code, shared instead of repeating the literal
+VND = 'VND'
 
 
 class Money:
     """Immutable money value object with currency support"""
     
-    SUPPORTED_CURRENCIES = ['VND', 'USD']
+    __slots__ = ('_amount', '_currency', '_str')
+    
+    SUPPORTED_CURRENCIES = [VND, 'USD']
     
-    def __init__(self, amount: Decimal, currency: str = 'VND'):
+    def __init__(self, amount: Decimal, currency: str = VND):
         """
         Initialize Money value object
         
@@ -32,6 +37,7 @@ class Money:
         
         self._amount = amount
         self._currency = currency
+        self._str: Optional[str] = None  # Formatted on first __str__, then reused
     
     @property
     def amount(self) -> Decimal:
@@ -79,12 +85,12 @@ class Money:
             raise ValueError("Cannot subtract larger amount from smaller amount")
         return Money(self._amount - other._amount, self._currency)
     
-    def multiply(self, multiplier: Decimal) -> 'Money':
+    def multiply(self, multiplier: Union[Decimal, int]) -> 'Money':
         """
-        Multiply Money by a decimal
+        Multiply Money by a decimal or an integer quantity
         
         Args:
-            multiplier: Decimal multiplier
+            multiplier: Decimal multiplier, or int (used as-is, no Decimal conversion)
             
         Returns:
             New Money object with product
@@ -120,10 +126,15 @@ class Money:
         return self == other or self > other
     
     def __str__(self) -> str:
-        """String representation"""
-        if self._currency == 'VND':
-            return f"{self._amount:,.0f} ₫"
-        return f"{self._currency} {self._amount:,.2f}"
+        """String representation (cached, since Money is immutable)"""
+        text = self._str
+        if text is None:
+            if self._currency == VND:
+                text = f"{self._amount:,.0f} ₫"
+            else:
+                text = f"{self._currency} {self._amount:,.2f}"
+            self._str = text
+        return text
     
     def __repr__(self) -> str:
         """Developer representation"""
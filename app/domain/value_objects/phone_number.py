@@ -3,12 +3,18 @@ PhoneNumber Value Object - Immutable representation of phone numbers
 """
 import re
 
+# Vietnamese phone number pattern (10 digits starting with 0)
+_PHONE_PATTERN = re.compile(r'^0\d{9}$')
+# Bound once so construction calls the C matcher without attribute lookups
+_PHONE_MATCH = _PHONE_PATTERN.match
+
 
 class PhoneNumber:
     """Immutable phone number value object with Vietnamese format validation"""
     
-    # Vietnamese phone number pattern (10 digits starting with 0)
-    PHONE_PATTERN = re.compile(r'^0\d{9}$')
+    __slots__ = ('_number',)
+    
+    PHONE_PATTERN = _PHONE_PATTERN
     
     def __init__(self, number: str):
         """
@@ -23,14 +29,10 @@ class PhoneNumber:
         if not number:
             raise ValueError("Phone number cannot be empty")
         
-        # Strip whitespace but validate contains only digits
+        # Strip whitespace; the pattern only accepts digits
         stripped = number.strip()
         
-        # Check if contains only digits
-        if not stripped.isdigit():
-            raise ValueError(f"Invalid Vietnamese phone number format: {number}. Expected format: 0xxxxxxxxx (10 digits)")
-        
-        if not self.PHONE_PATTERN.match(stripped):
+        if not _PHONE_MATCH(stripped):
             raise ValueError(f"Invalid Vietnamese phone number format: {number}. Expected format: 0xxxxxxxxx (10 digits)")
         
         self._number = stripped
@@ -6,6 +6,7 @@ from .database import (
     init_database,
     get_session,
     create_scoped_session,
+    create_query_executor,
     create_all_tables,
     drop_all_tables,
     get_engine
@@ -17,6 +18,7 @@ __all__ = [
     'init_database',
     'get_session',
     'create_scoped_session',
+    'create_query_executor',
     'create_all_tables',
     'drop_all_tables',
     'get_engine',
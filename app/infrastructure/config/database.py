@@ -2,6 +2,7 @@
 Infrastructure Layer - Database Configuration
 Manages database connection and session lifecycle
 """
+from concurrent.futures import ThreadPoolExecutor
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, scoped_session, declarative_base
 import os
@@ -81,6 +82,54 @@ def create_scoped_session():
     return scoped_session(_session_factory)
 
 
+class ScopedSessionExecutor(ThreadPoolExecutor):
+    """
+    Thread pool for running independent read queries in parallel
+    
+    Repositories built on a scoped session get a separate session (and pooled
+    connection) in each worker thread; it is released when the task finishes.
+    """
+    
+    def __init__(self, session: scoped_session, max_workers: int = 4):
+        """
+        Args:
+            session: Scoped session shared by the repositories
+            max_workers: Maximum worker threads
+        """
+        super().__init__(max_workers=max_workers, thread_name_prefix='db-query')
+        self._scoped_session = session
+    
+    def submit(self, fn, /, *args, **kwargs):
+        """Submit task and remove the worker's thread-local session afterwards"""
+        def run():
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                self._scoped_session.remove()
+        return super().submit(run)
+
+
+def create_query_executor(session: scoped_session, max_workers: int = 4):
+    """
+    Create executor for parallel read queries
+    
+    Returns None for SQLite: an in-memory database is private to one
+    connection, so queries from other threads would not see its tables.
+    
+    Args:
+        session: Scoped session shared by the repositories
+        max_workers: Maximum worker threads
+        
+    Returns:
+        ScopedSessionExecutor or None when queries must stay on the caller thread
+    """
+    if _engine is None:
+        raise RuntimeError("Database not initialized. Call init_database() first.")
+    if _engine.dialect.name == 'sqlite':
+        return None
+    return ScopedSessionExecutor(session, max_workers=max_workers)
+
+
 def create_all_tables():
     """
     Create all tables defined in models
@@ -36,6 +36,9 @@ class OrderModel(Base):
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.now, index=True)
     
+    # Optimistic concurrency token, bumped by every versioned UPDATE
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+    
     # Relationships
     user = relationship('UserModel', back_populates='orders')
     items = relationship('OrderItemModel', back_populates='order', cascade='all, delete-orphan')
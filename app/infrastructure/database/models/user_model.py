@@ -37,6 +37,9 @@ class UserModel(Base):
     # Timestamps
     created_at = Column(DateTime, nullable=False, default=datetime.now)
     
+    # Optimistic concurrency token, bumped by every versioned UPDATE
+    version = Column(Integer, nullable=False, default=1, server_default='1')
+    
     # Relationships
     role = relationship('RoleModel', back_populates='users')
     carts = relationship('CartModel', back_populates='user', cascade='all, delete-orphan')
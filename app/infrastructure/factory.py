@@ -103,7 +103,7 @@ def register_blueprints(app):
     Register Flask blueprints with dependency injection
     Clean Architecture: Wire use cases to controllers here
     """
-    from .config.database import get_session, create_scoped_session
+    from .config.database import get_session, create_scoped_session, create_query_executor
     
     # Import repository adapters
     from ..adapters.repositories import (
@@ -112,7 +112,10 @@ def register_blueprints(app):
         BrandRepositoryAdapter,
         CategoryRepositoryAdapter,
         CartRepositoryAdapter,
-        OrderRepositoryAdapter
+        OrderRepositoryAdapter,
+        CachingCategoryRepository,
+        CachingBrandRepository,
+        SqlAlchemyUnitOfWork
     )
     
     # Import use cases
@@ -157,16 +160,20 @@ def register_blueprints(app):
     # Instantiate repositories with scoped session
     user_repository = UserRepositoryAdapter(session)
     product_repository = ProductRepositoryAdapter(session)
-    brand_repository = BrandRepositoryAdapter(session)
-    category_repository = CategoryRepositoryAdapter(session)
+    # Category/brand lookups are read-mostly: cache them across requests
+    brand_repository = CachingBrandRepository(BrandRepositoryAdapter(session))
+    category_repository = CachingCategoryRepository(CategoryRepositoryAdapter(session))
     cart_repository = CartRepositoryAdapter()
     order_repository = OrderRepositoryAdapter()
     
+    # Thread pool for independent read queries (None on SQLite)
+    query_executor = create_query_executor(session)
+    
     # Instantiate use cases with dependencies
     register_user_use_case = RegisterUserUseCase(user_repository)
     login_user_use_case = LoginUserUseCase(user_repository)
     get_user_use_case = GetUserUseCase(user_repository)
-    list_users_use_case = ListUsersUseCase(user_repository)
+    list_users_use_case = ListUsersUseCase(user_repository, executor=query_executor)
     search_users_use_case = SearchUsersUseCase(user_repository)
     create_user_use_case = CreateUserByAdminUseCase(user_repository, PasswordHashingService)
     update_user_use_case = UpdateUserByAdminUseCase(user_repository)
@@ -183,24 +190,25 @@ def register_blueprints(app):
         brand_repository=brand_repository
     )
     view_cart_use_case = ViewCartUseCase(
-        cart_repository=cart_repository,
-        product_repository=product_repository
+        cart_repository=cart_repository
     )
     add_to_cart_use_case = AddToCartUseCase(
         cart_repository=cart_repository,
         product_repository=product_repository
     )
     update_cart_item_use_case = UpdateCartItemUseCase(
-        cart_repository=cart_repository,
-        product_repository=product_repository
+        cart_repository=cart_repository
     )
     remove_cart_item_use_case = RemoveCartItemUseCase(
         cart_repository=cart_repository
     )
+    # Placing an order writes stock, order and cart in one transaction,
+    # so its repositories share the scoped session with the unit of work
     place_order_use_case = PlaceOrderUseCase(
-        order_repository=order_repository,
-        cart_repository=cart_repository,
-        product_repository=product_repository
+        order_repository=OrderRepositoryAdapter(session),
+        cart_repository=CartRepositoryAdapter(session),
+        product_repository=product_repository,
+        unit_of_work=SqlAlchemyUnitOfWork(session)
     )
     get_my_orders_use_case = GetMyOrdersUseCase(
         order_repository=order_repository
@@ -220,11 +228,7 @@ def register_blueprints(app):
         category_repository=category_repository,
         brand_repository=brand_repository
     )
-    update_product_use_case = UpdateProductUseCase(
-        product_repository=product_repository,
-        category_repository=category_repository,
-        brand_repository=brand_repository
-    )
+    update_product_use_case = UpdateProductUseCase(product_repository)
     delete_product_use_case = DeleteProductUseCase(product_repository)
     create_category_use_case = CreateCategoryUseCase(category_repository)
     update_category_use_case = UpdateCategoryUseCase(category_repository)
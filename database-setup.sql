@@ -53,6 +53,7 @@ CREATE TABLE users (
     role_id INT NOT NULL DEFAULT 2,
     is_active BIT NOT NULL DEFAULT 1,
     created_at DATETIME2 NOT NULL DEFAULT GETDATE(),
+    version INT NOT NULL DEFAULT 1,
     FOREIGN KEY (role_id) REFERENCES roles(role_id),
     CHECK (role_id IN (1, 2))
 );
@@ -159,6 +160,7 @@ CREATE TABLE orders (
     notes NVARCHAR(MAX),
     total_amount DECIMAL(18,2) NOT NULL,
     created_at DATETIME2 NOT NULL DEFAULT GETDATE(),
+    version INT NOT NULL DEFAULT 1,
     FOREIGN KEY (user_id) REFERENCES users(user_id),
     CHECK (order_status IN ('CHO_XAC_NHAN', 'DANG_GIAO', 'HOAN_THANH', 'DA_HUY')),
     CHECK (payment_method IN ('COD', 'BANK_TRANSFER', 'CREDIT_CARD')),
@@ -0,0 +1,32 @@
+"""Add optimistic concurrency version to users and orders
+
+Revision ID: 3c9d2e7a41f0
+Revises: b5f55162f272
+Create Date: 2026-10-17 09:12:41.318204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c9d2e7a41f0'
+down_revision = 'b5f55162f272'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('version', sa.Integer(), nullable=False, server_default='1'))
+
+
+def downgrade():
+    with op.batch_alter_table('orders', schema=None) as batch_op:
+        batch_op.drop_column('version', mssql_drop_default=True)
+
+    with op.batch_alter_table('users', schema=None) as batch_op:
+        batch_op.drop_column('version', mssql_drop_default=True)
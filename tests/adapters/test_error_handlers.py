@@ -0,0 +1,60 @@
+"""
+Tests for Error Handlers (Decorators)
+Coverage target: 100% for app/adapters/api/error_handlers.py
+"""
+import pytest
+from flask import Flask
+from app.adapters.api.error_handlers import use_case_error_boundary
+
+
+@pytest.fixture
+def boundary_app():
+    """Minimal Flask app with routes behind the error boundary"""
+    app = Flask(__name__)
+    
+    @app.route('/ok')
+    @use_case_error_boundary
+    def ok_view():
+        return {'success': True}, 200
+    
+    @app.route('/boom')
+    @use_case_error_boundary
+    def failing_view():
+        raise RuntimeError("connection string leaked")
+    
+    return app
+
+
+class TestUseCaseErrorBoundary:
+    """Test @use_case_error_boundary decorator"""
+    
+    def test_passes_through_successful_response(self, boundary_app):
+        """TC1: Responses from the route are returned unchanged"""
+        response = boundary_app.test_client().get('/ok')
+        
+        assert response.status_code == 200
+        assert response.get_json() == {'success': True}
+    
+    def test_unexpected_error_returns_generic_500(self, boundary_app):
+        """TC2: Unexpected errors become a 500 without exception details"""
+        response = boundary_app.test_client().get('/boom')
+        
+        assert response.status_code == 500
+        data = response.get_json()
+        assert data['success'] is False
+        assert 'leaked' not in data['error']
+    
+    def test_unexpected_error_is_logged(self, boundary_app, caplog):
+        """TC3: The traceback is logged once"""
+        with caplog.at_level('ERROR'):
+            boundary_app.test_client().get('/boom')
+        
+        assert any(record.exc_info for record in caplog.records)
+    
+    def test_preserves_view_name(self):
+        """TC4: Decorated function keeps its name for Flask endpoints"""
+        @use_case_error_boundary
+        def my_view():
+            pass
+        
+        assert my_view.__name__ == 'my_view'
@@ -356,6 +356,20 @@ class TestAdminProductManagement:
         data = response.get_json()
         assert data['success'] is False
     
+    def test_update_product_missing_stock_quantity(self, client, logged_in_admin, sample_product):
+        """TC5b: Omitting an integer field is a validation error, not a server error"""
+        response = client.put(f'/api/admin/products/{sample_product.product_id}', json={
+            'name': 'Updated Product Name',
+            'description': 'Updated description with at least 10 characters',
+            'price': 1500.00,
+            'category_id': sample_product.category_id,
+            'brand_id': sample_product.brand_id
+        })
+        assert response.status_code == 400
+        data = response.get_json()
+        assert data['success'] is False
+        assert 'tồn kho' in data['error']
+    
     def test_update_product_unauthorized(self, client, logged_in_regular_user, sample_product):
         """TC6: Regular user cannot update products"""
         response = client.put(f'/api/admin/products/{sample_product.product_id}', json={
@@ -374,6 +374,18 @@ class TestLoginEndpoint:
         data = json.loads(response.data)
         assert data['success'] is False
     
+    def test_login_null_username_fails(self, client):
+        """TC9b: Login with a null username should fail like an unknown user"""
+        response = client.post(
+            '/api/auth/login',
+            data=json.dumps({'username': None, 'password': 'x'}),
+            content_type='application/json'
+        )
+        
+        assert response.status_code == 401
+        data = json.loads(response.data)
+        assert data['success'] is False
+    
     def test_login_case_sensitive_username(self, client, registered_user):
         """TC10: Username should be case-sensitive"""
         response = client.post(
@@ -108,13 +108,11 @@ class TestListProductsUseCase:
         assert output.products[0].price == 48000000.0
     
     def test_list_products_filter_out_of_stock(self, use_case, product_repository, category_repository, brand_repository):
-        """Test 2: Sản phẩm hết hàng bị lọc ra"""
+        """Test 2: Sản phẩm hết hàng bị lọc ra (lọc ở repository)"""
         # Arrange
         product1 = self.create_mock_product(1, "In Stock", 10000000, stock=5)
-        product2 = self.create_mock_product(2, "Out of Stock", 20000000, stock=0)
-        product2.is_available_for_purchase = Mock(return_value=False)
         
-        product_repository.find_all.return_value = [product1, product2]
+        product_repository.find_all.return_value = [product1]
         category_repository.find_by_id.return_value = self.create_mock_category(1, "Camera")
         brand_repository.find_by_id.return_value = self.create_mock_brand(1, "Canon")
         
@@ -124,6 +122,7 @@ class TestListProductsUseCase:
         output = use_case.execute(input_data)
         
         # Assert
+        product_repository.find_all.assert_called_once_with(available_only=True)
         assert output.success is True
         assert len(output.products) == 1
         assert output.products[0].product_id == 1
@@ -160,7 +159,7 @@ class TestListProductsUseCase:
         
         # Assert
         assert output.success is True
-        product_repository.find_by_category.assert_called_once_with(5)
+        product_repository.find_by_category.assert_called_once_with(5, available_only=True)
         assert output.products[0].category_name == "DSLR"
     
     # ============ FILTER BY BRAND ============
@@ -180,7 +179,7 @@ class TestListProductsUseCase:
         
         # Assert
         assert output.success is True
-        product_repository.find_by_brand.assert_called_once_with(3)
+        product_repository.find_by_brand.assert_called_once_with(3, available_only=True)
         assert output.products[0].brand_name == "Sony"
     
     # ============ SEARCH BY NAME ============
@@ -200,7 +199,7 @@ class TestListProductsUseCase:
         
         # Assert
         assert output.success is True
-        product_repository.search_by_name.assert_called_once_with("Canon")
+        product_repository.search_by_name.assert_called_once_with("Canon", available_only=True)
     
     # ============ PRICE FILTERING ============
     
@@ -389,6 +388,26 @@ class TestListProductsUseCase:
         # Sorted by newest: page 2 starts at product 10 (15,14,13,12,11 on page 1)
         assert output.products[0].product_id == 10
     
+    def test_pagination_page_2_sorted_by_price(self, use_case, product_repository, category_repository, brand_repository):
+        """Test 14b: Trang 2 khi sắp xếp theo giá (chỉ chọn đủ phần tử cho trang)"""
+        # Arrange
+        prices = [50, 10, 40, 20, 30, 60]
+        products = [self.create_mock_product(i, f"Product {i}", price * 1000000) for i, price in enumerate(prices, 1)]
+        product_repository.find_all.return_value = products
+        category_repository.find_by_id.return_value = self.create_mock_category(1, "Camera")
+        brand_repository.find_by_id.return_value = self.create_mock_brand(1, "Canon")
+        
+        input_data = ListProductsInputData(page=2, per_page=2, sort_by='price_asc')
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is True
+        assert output.total_products == 6
+        assert output.total_pages == 3
+        assert [p.price for p in output.products] == [30000000.0, 40000000.0]
+    
     def test_pagination_last_page(self, use_case, product_repository, category_repository, brand_repository):
         """Test 15: Trang cuối cùng"""
         # Arrange
@@ -446,19 +465,15 @@ class TestListProductsUseCase:
     
     # ============ ERROR HANDLING ============
     
-    def test_repository_exception_handled(self, use_case, product_repository):
-        """Test 18: Lỗi từ repository được xử lý"""
+    def test_repository_exception_propagates(self, use_case, product_repository):
+        """Test 18: Lỗi từ repository được chuyển lên tầng adapter"""
         # Arrange
         product_repository.find_all.side_effect = Exception("Database error")
         input_data = ListProductsInputData()
         
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert output.error_message == "Database error"
-        assert len(output.products) == 0
+        # Act & Assert
+        with pytest.raises(Exception, match="Database error"):
+            use_case.execute(input_data)
     
     # ============ OUTPUT DATA STRUCTURE ============
     
@@ -328,6 +328,23 @@ class TestListUsersUseCase:
         assert output.success is True
         assert len(output.users) > 0
     
+    def test_search_query_whitespace_normalized(self, use_case, mock_user_repository):
+        """Search query is trimmed and inner whitespace collapsed before reaching repository"""
+        # Arrange
+        mock_user_repository.find_all_with_filters.return_value = ([], 0)
+        mock_user_repository.count_by_role.return_value = 0
+        mock_user_repository.count_active_users.return_value = 0
+        
+        # Act
+        use_case.execute(ListUsersInputData(search_query='  john    doe '))
+        use_case.execute(ListUsersInputData(search_query='   '))
+        
+        # Assert
+        first_filters = mock_user_repository.find_all_with_filters.call_args_list[0][1]['filters']
+        blank_filters = mock_user_repository.find_all_with_filters.call_args_list[1][1]['filters']
+        assert first_filters['search_query'] == 'john doe'
+        assert 'search_query' not in blank_filters
+        
     # ==================== TC1.14-1.16: Sort tests ====================
     
     def test_sort_by_name_asc_alphabetical(self, use_case, mock_user_repository, sample_users):
@@ -475,18 +492,37 @@ class TestListUsersUseCase:
     
     # ==================== Error handling ====================
     
-    def test_repository_exception_handled_gracefully(self, use_case, mock_user_repository):
-        """Test repository exception is handled and returns error output"""
+    def test_repository_exception_propagates(self, use_case, mock_user_repository):
+        """Test unexpected repository errors are left to the adapter layer"""
         # Arrange
         mock_user_repository.find_all_with_filters.side_effect = Exception("Database connection error")
         
         input_data = ListUsersInputData()
         
-        # Act
-        output = use_case.execute(input_data)
+        # Act & Assert
+        with pytest.raises(Exception, match="Database connection error"):
+            use_case.execute(input_data)
+    
+    # ==================== Concurrent statistics ====================
+    
+    def test_statistics_queried_through_executor(self, mock_user_repository, sample_users):
+        """Statistics run on the injected executor and are merged into the output"""
+        # Arrange
+        from concurrent.futures import ThreadPoolExecutor
+        mock_user_repository.find_all_with_filters.return_value = (sample_users, len(sample_users))
+        mock_user_repository.count_by_role.side_effect = lambda role: 1 if role == 'ADMIN' else 4
+        mock_user_repository.count_active_users.return_value = 3
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            use_case = ListUsersUseCase(user_repository=mock_user_repository, executor=executor)
+            
+            # Act
+            output = use_case.execute(ListUsersInputData())
         
         # Assert
-        assert output.success is False
-        assert output.error_message is not None
-        assert 'error' in output.error_message.lower()
-        assert len(output.users) == 0
+        assert output.success is True
+        assert len(output.users) == 5
+        assert output.total_admins == 1
+        assert output.total_customers == 4
+        assert output.active_users == 3
+        assert output.inactive_users == 2
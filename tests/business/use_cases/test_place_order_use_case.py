@@ -4,7 +4,7 @@ Test mọi trường hợp đặt hàng - usecase phức tạp nhất với nhi
 """
 
 import pytest
-from unittest.mock import Mock
+from unittest.mock import Mock, MagicMock
 from decimal import Decimal
 
 from app.business.use_cases.place_order_use_case import (
@@ -96,8 +96,9 @@ class TestPlaceOrderUseCase:
         cart.cart_id = cart_id
         cart.user_id = user_id
         
-        # Ensure items is iterable - configure Mock to return list on access
-        cart.configure_mock(items=items)
+        # Use case iterates the live items view and asks the cart if it is empty
+        cart.configure_mock(items_view=items)
+        cart.is_empty.return_value = not items
         
         # Calculate total from items
         total = Decimal('0')
@@ -130,15 +131,14 @@ class TestPlaceOrderUseCase:
         # Create cart item with embedded product
         cart_item = self.create_mock_cart_item(1, 1, 10, 2, product=product)
         
-        # Create cart with items as actual list 
-        cart = Mock(cart_id=1, user_id=user_id)
-        cart.items = [cart_item]  # MUST be actual list, not Mock
+        # Create cart with items as actual list
+        cart = self.create_mock_cart(1, user_id, [cart_item])
         
-        # Mock find_by_user_id to return our cart
-        cart_repository.find_by_user_id.side_effect = lambda uid: cart if uid == user_id else None
+        # Mock the eager cart lookup to return our cart
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: cart if uid == user_id else None
         
-        # Mock product_repository.find_by_id to return same product for all calls
-        product_repository.find_by_id.return_value = product
+        # Mock the batched product lookup to return the cart's product
+        product_repository.find_by_ids.return_value = [product]
         
         # Mock saved order (order_repository.save will be called with real Order entity)
         mock_saved_order = Mock()
@@ -166,7 +166,7 @@ class TestPlaceOrderUseCase:
         assert output.error_message == ""
         
         # Verify stock was reduced
-        product_repository.save.assert_called()
+        product_repository.save_many.assert_called_once()
         
         # Verify cart was cleared
         cart_repository.clear_cart.assert_called_once_with(user_id)
@@ -182,17 +182,10 @@ class TestPlaceOrderUseCase:
         cart_item2 = self.create_mock_cart_item(2, 1, 20, 1, product=product2)
         cart_item3 = self.create_mock_cart_item(3, 1, 30, 3, product=product3)
         
-        cart = Mock(cart_id=1, user_id=1)
-        cart.items = [cart_item1, cart_item2, cart_item3]
-        cart_repository.find_by_user_id.side_effect = lambda uid: cart if uid == 1 else None
+        cart = self.create_mock_cart(1, 1, [cart_item1, cart_item2, cart_item3])
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: cart if uid == 1 else None
         
-        def find_by_id_side_effect(product_id):
-            if product_id == 10: return product1
-            elif product_id == 20: return product2
-            elif product_id == 30: return product3
-            return None
-        
-        product_repository.find_by_id.side_effect = find_by_id_side_effect
+        product_repository.find_by_ids.return_value = [product1, product2, product3]
         
         mock_saved_order = Mock()
         mock_saved_order.id = 1
@@ -216,7 +209,43 @@ class TestPlaceOrderUseCase:
         assert output.order_id == 1
         
         # Verify stock was reduced for all products
-        assert product_repository.save.call_count == 3
+        product_repository.save_many.assert_called_once()
+        assert len(product_repository.save_many.call_args[0][0]) == 3
+    
+    def test_place_order_loads_products_in_one_batch(self, use_case, cart_repository, product_repository, order_repository):
+        """Test 2b: Tải tất cả sản phẩm trong giỏ bằng một truy vấn"""
+        # Arrange
+        product1 = self.create_mock_product(10, "Camera A", 5000000, 10)
+        product2 = self.create_mock_product(20, "Lens B", 3000000, 5)
+        
+        cart = self.create_mock_cart(1, 1, [
+            self.create_mock_cart_item(1, 1, 10, 2, product=product1),
+            self.create_mock_cart_item(2, 1, 20, 1, product=product2)
+        ])
+        cart_repository.find_by_user_id_with_items.return_value = cart
+        
+        product_repository.find_by_ids.return_value = [product1, product2]
+        
+        mock_saved_order = Mock()
+        mock_saved_order.id = 1
+        mock_saved_order.total_amount = Mock(amount=13000000)
+        order_repository.save.return_value = mock_saved_order
+        
+        input_data = PlaceOrderInputData(
+            user_id=1,
+            shipping_address="123 Test Street, District 1, HCMC",
+            phone_number="0901234567",
+            payment_method="CASH"
+        )
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is True
+        product_repository.find_by_ids.assert_called_once_with([10, 20])
+        product_repository.find_by_id.assert_not_called()
+        product_repository.save_many.assert_called_once_with([product1, product2])
     
     def test_place_order_with_exact_stock_success(self, use_case, cart_repository, product_repository, order_repository):
         """Test 3: Đặt hàng với số lượng bằng đúng stock"""
@@ -224,11 +253,10 @@ class TestPlaceOrderUseCase:
         product = self.create_mock_product(10, "Camera A", 5000000, 5)  # Stock exactly 5
         cart_item = self.create_mock_cart_item(1, 1, 10, 5, product=product)  # Order exactly 5
         
-        cart = Mock(cart_id=1, user_id=1)
-        cart.items = [cart_item]
-        cart_repository.find_by_user_id.side_effect = lambda uid: cart if uid == 1 else None
+        cart = self.create_mock_cart(1, 1, [cart_item])
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: cart if uid == 1 else None
         
-        product_repository.find_by_id.return_value = product
+        product_repository.find_by_ids.return_value = [product]
         
         mock_saved_order = Mock()
         mock_saved_order.id = 1
@@ -258,11 +286,10 @@ class TestPlaceOrderUseCase:
         product = self.create_mock_product(10, "Camera", 5000000, 10)
         cart_item = self.create_mock_cart_item(1, 1, 10, 1, product=product)
         
-        cart = Mock(cart_id=1, user_id=1)
-        cart.items = [cart_item]
-        cart_repository.find_by_user_id.side_effect = lambda uid: cart if uid == 1 else None
+        cart = self.create_mock_cart(1, 1, [cart_item])
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: cart if uid == 1 else None
         
-        product_repository.find_by_id.return_value = product
+        product_repository.find_by_ids.return_value = [product]
         
         mock_saved_order = Mock()
         mock_saved_order.id = 1
@@ -291,7 +318,7 @@ class TestPlaceOrderUseCase:
     def test_place_order_with_no_cart_fails(self, use_case, cart_repository, product_repository, order_repository):
         """Test 5: Đặt hàng khi user chưa có giỏ hàng"""
         # Arrange
-        cart_repository.find_by_user_id.side_effect = lambda uid: None
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: None
         
         input_data = PlaceOrderInputData(
             user_id=1,
@@ -311,9 +338,8 @@ class TestPlaceOrderUseCase:
     def test_place_order_with_empty_cart_fails(self, use_case, cart_repository, product_repository, order_repository):
         """Test 6: Đặt hàng với giỏ hàng trống"""
         # Arrange
-        cart = Mock(cart_id=1, user_id=1)
-        cart.items = []  # Empty items list
-        cart_repository.find_by_user_id.side_effect = lambda uid: cart if uid == 1 else None
+        cart = self.create_mock_cart(1, 1, [])  # Empty items list
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: cart if uid == 1 else None
         
         input_data = PlaceOrderInputData(
             user_id=1,
@@ -338,11 +364,10 @@ class TestPlaceOrderUseCase:
         product = self.create_mock_product(10, "Camera A", 5000000, 3)  # Only 3 available
         cart_item = self.create_mock_cart_item(1, 1, 10, 5, product=product)  # Want 5
         
-        cart = Mock(cart_id=1, user_id=1)
-        cart.items = [cart_item]
-        cart_repository.find_by_user_id.side_effect = lambda uid: cart if uid == 1 else None
+        cart = self.create_mock_cart(1, 1, [cart_item])
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: cart if uid == 1 else None
         
-        product_repository.find_by_id.return_value = product
+        product_repository.find_by_ids.return_value = [product]
         
         input_data = PlaceOrderInputData(
             user_id=1,
@@ -359,7 +384,7 @@ class TestPlaceOrderUseCase:
         # InsufficientStockException format: "Product {id}: requested {qty}, but only {available} available"
         assert "requested" in output.error_message and "available" in output.error_message
         order_repository.save.assert_not_called()
-        product_repository.save.assert_not_called()
+        product_repository.save_many.assert_not_called()
     
     def test_place_order_with_out_of_stock_product_fails(self, use_case, cart_repository, product_repository, order_repository):
         """Test 8: Đặt hàng khi sản phẩm hết hàng (stock = 0)"""
@@ -367,11 +392,10 @@ class TestPlaceOrderUseCase:
         product = self.create_mock_product(10, "Camera A", 5000000, 0)  # Out of stock
         cart_item = self.create_mock_cart_item(1, 1, 10, 1, product=product)
         
-        cart = Mock(cart_id=1, user_id=1)
-        cart.items = [cart_item]
-        cart_repository.find_by_user_id.side_effect = lambda uid: cart if uid == 1 else None
+        cart = self.create_mock_cart(1, 1, [cart_item])
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: cart if uid == 1 else None
         
-        product_repository.find_by_id.return_value = product
+        product_repository.find_by_ids.return_value = [product]
         
         input_data = PlaceOrderInputData(
             user_id=1,
@@ -397,16 +421,10 @@ class TestPlaceOrderUseCase:
         cart_item1 = self.create_mock_cart_item(1, 1, 10, 2, product=product1)  # OK
         cart_item2 = self.create_mock_cart_item(2, 1, 20, 10, product=product2)  # Insufficient
         
-        cart = Mock(cart_id=1, user_id=1)
-        cart.items = [cart_item1, cart_item2]
-        cart_repository.find_by_user_id.side_effect = lambda uid: cart if uid == 1 else None
+        cart = self.create_mock_cart(1, 1, [cart_item1, cart_item2])
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: cart if uid == 1 else None
         
-        def find_by_id_side_effect(product_id):
-            if product_id == 10: return product1
-            elif product_id == 20: return product2
-            return None
-        
-        product_repository.find_by_id.side_effect = find_by_id_side_effect
+        product_repository.find_by_ids.return_value = [product1, product2]
         
         input_data = PlaceOrderInputData(
             user_id=1,
@@ -432,11 +450,10 @@ class TestPlaceOrderUseCase:
         product = self.create_mock_product(10, "Camera A", 5000000, 10, is_visible=False)
         cart_item = self.create_mock_cart_item(1, 1, 10, 2, product=product)
         
-        cart = Mock(cart_id=1, user_id=1)
-        cart.items = [cart_item]
-        cart_repository.find_by_user_id.side_effect = lambda uid: cart if uid == 1 else None
+        cart = self.create_mock_cart(1, 1, [cart_item])
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: cart if uid == 1 else None
         
-        product_repository.find_by_id.return_value = product
+        product_repository.find_by_ids.return_value = [product]
         
         input_data = PlaceOrderInputData(
             user_id=1,
@@ -455,7 +472,7 @@ class TestPlaceOrderUseCase:
     def test_place_order_with_deleted_product_fails(self, use_case, cart_repository, product_repository, order_repository):
         """Test 11: Đặt hàng với sản phẩm đã bị xóa"""
         # Arrange
-        # Create cart item with product, but product_repository will return None
+        # Create cart item with product, but product_repository will not return it
         from app.domain.value_objects.money import Money
         mock_product = Mock()
         mock_product.id = 999
@@ -464,11 +481,10 @@ class TestPlaceOrderUseCase:
         
         cart_item = self.create_mock_cart_item(1, 1, 999, 1, product=mock_product)
         
-        cart = Mock(cart_id=1, user_id=1)
-        cart.items = [cart_item]
-        cart_repository.find_by_user_id.side_effect = lambda uid: cart if uid == 1 else None
+        cart = self.create_mock_cart(1, 1, [cart_item])
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: cart if uid == 1 else None
         
-        product_repository.find_by_id.return_value = None  # Product not found
+        product_repository.find_by_ids.return_value = []  # Product not found
         
         input_data = PlaceOrderInputData(
             user_id=1,
@@ -666,10 +682,10 @@ class TestPlaceOrderUseCase:
     
     # ============ REPOSITORY EXCEPTIONS ============
     
-    def test_repository_exception_handled(self, use_case, cart_repository, product_repository, order_repository):
-        """Test 22: Lỗi từ repository được xử lý"""
+    def test_repository_exception_propagates(self, use_case, cart_repository, product_repository, order_repository):
+        """Test 22: Lỗi không mong đợi từ repository được để cho tầng adapter xử lý"""
         # Arrange
-        cart_repository.find_by_user_id.side_effect = Exception("Database connection error")
+        cart_repository.find_by_user_id_with_items.side_effect = Exception("Database connection error")
         
         input_data = PlaceOrderInputData(
             user_id=1,
@@ -678,24 +694,20 @@ class TestPlaceOrderUseCase:
             payment_method="CASH"
         )
         
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "An error occurred" in output.error_message
+        # Act & Assert
+        with pytest.raises(Exception, match="Database connection error"):
+            use_case.execute(input_data)
     
-    def test_order_save_exception_handled(self, use_case, cart_repository, product_repository, order_repository):
-        """Test 23: Lỗi khi save order được xử lý"""
+    def test_order_save_exception_propagates(self, use_case, cart_repository, product_repository, order_repository):
+        """Test 23: Lỗi khi save order được để cho tầng adapter xử lý"""
         # Arrange
         product = self.create_mock_product(10, "Camera", 5000000, 10)
         cart_item = self.create_mock_cart_item(1, 1, 10, 1, product=product)
         
-        cart = Mock(cart_id=1, user_id=1)
-        cart.items = [cart_item]
-        cart_repository.find_by_user_id.side_effect = lambda uid: cart if uid == 1 else None
+        cart = self.create_mock_cart(1, 1, [cart_item])
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: cart if uid == 1 else None
         
-        product_repository.find_by_id.return_value = product
+        product_repository.find_by_ids.return_value = [product]
         
         order_repository.save.side_effect = Exception("Failed to save order")
         
@@ -706,12 +718,87 @@ class TestPlaceOrderUseCase:
             payment_method="CASH"
         )
         
+        # Act & Assert
+        with pytest.raises(Exception, match="Failed to save order"):
+            use_case.execute(input_data)
+    
+    # ============ UNIT OF WORK ============
+    
+    def _arrange_single_item_order(self, cart_repository, product_repository, order_repository):
+        """Helper: giỏ hàng 1 sản phẩm, đủ hàng"""
+        product = self.create_mock_product(10, "Camera", 5000000, 10)
+        cart_item = self.create_mock_cart_item(1, 1, 10, 1, product=product)
+        
+        cart = self.create_mock_cart(1, 1, [cart_item])
+        cart_repository.find_by_user_id_with_items.return_value = cart
+        product_repository.find_by_ids.return_value = [product]
+        
+        saved_order = Mock()
+        saved_order.id = 1
+        saved_order.total_amount.amount = Decimal('5000000')
+        order_repository.save.return_value = saved_order
+        
+        return PlaceOrderInputData(
+            user_id=1,
+            shipping_address="123 Test Street, District 1",
+            phone_number="0901234567",
+            payment_method="CASH"
+        )
+    
+    def test_place_order_commits_writes_in_one_unit_of_work(self, cart_repository, product_repository, order_repository):
+        """Test 23b: Cập nhật tồn kho, lưu đơn và xóa giỏ trong cùng một transaction"""
+        # Arrange
+        input_data = self._arrange_single_item_order(cart_repository, product_repository, order_repository)
+        unit_of_work = MagicMock()
+        calls = Mock()
+        calls.attach_mock(unit_of_work.__enter__, 'enter')
+        calls.attach_mock(product_repository.save_many, 'save_many')
+        calls.attach_mock(order_repository.save, 'save_order')
+        calls.attach_mock(cart_repository.clear_cart, 'clear_cart')
+        calls.attach_mock(unit_of_work.commit, 'commit')
+        calls.attach_mock(unit_of_work.__exit__, 'exit')
+        use_case = PlaceOrderUseCase(order_repository, cart_repository, product_repository, unit_of_work)
+        
         # Act
         output = use_case.execute(input_data)
         
         # Assert
-        assert output.success is False
-        assert "An error occurred" in output.error_message
+        assert output.success is True
+        assert [name for name, _, _ in calls.mock_calls] == [
+            'enter', 'save_many', 'save_order', 'clear_cart', 'commit', 'exit'
+        ]
+    
+    def test_place_order_failure_does_not_commit_unit_of_work(self, cart_repository, product_repository, order_repository):
+        """Test 23c: Lỗi khi lưu đơn thì transaction không được commit"""
+        # Arrange
+        input_data = self._arrange_single_item_order(cart_repository, product_repository, order_repository)
+        order_repository.save.side_effect = Exception("Failed to save order")
+        unit_of_work = MagicMock()
+        unit_of_work.__exit__.return_value = False
+        use_case = PlaceOrderUseCase(order_repository, cart_repository, product_repository, unit_of_work)
+        
+        # Act & Assert
+        with pytest.raises(Exception, match="Failed to save order"):
+            use_case.execute(input_data)
+        
+        unit_of_work.commit.assert_not_called()
+        unit_of_work.__exit__.assert_called_once()
+        cart_repository.clear_cart.assert_not_called()
+    
+    # ============ CART LOADING ============
+    
+    def test_place_order_loads_cart_with_items_in_one_lookup(self, use_case, cart_repository, product_repository, order_repository):
+        """Test 23d: Giỏ hàng và các item được lấy bằng một truy vấn"""
+        # Arrange
+        input_data = self._arrange_single_item_order(cart_repository, product_repository, order_repository)
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is True
+        cart_repository.find_by_user_id_with_items.assert_called_once_with(1)
+        cart_repository.find_by_user_id.assert_not_called()
     
     # ============ OUTPUT DATA STRUCTURE ============
     
@@ -721,11 +808,10 @@ class TestPlaceOrderUseCase:
         product = self.create_mock_product(10, "Camera", 5000000, 10)
         cart_item = self.create_mock_cart_item(1, 1, 10, 1, product=product)
         
-        cart = Mock(cart_id=1, user_id=1)
-        cart.items = [cart_item]
-        cart_repository.find_by_user_id.side_effect = lambda uid: cart if uid == 1 else None
+        cart = self.create_mock_cart(1, 1, [cart_item])
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: cart if uid == 1 else None
         
-        product_repository.find_by_id.return_value = product
+        product_repository.find_by_ids.return_value = [product]
         
         mock_saved_order = Mock()
         mock_saved_order.id = 123
@@ -755,13 +841,14 @@ class TestPlaceOrderUseCase:
         assert output.success is True
         assert output.order_id == 123
         assert output.total_amount > 0
+        assert output.total_amount == output.order_total
         assert len(output.message) > 0
         assert output.error_message == ""
     
     def test_output_data_structure_on_failure(self, use_case, cart_repository, product_repository, order_repository):
         """Test 25: Cấu trúc output data khi thất bại"""
         # Arrange
-        cart_repository.find_by_user_id.side_effect = lambda uid: None
+        cart_repository.find_by_user_id_with_items.side_effect = lambda uid: None
         
         input_data = PlaceOrderInputData(
             user_id=1,
@@ -55,6 +55,25 @@ class TestRegisterUserUseCase:
         assert output.error_message is None
         user_repository.save.assert_called_once()
     
+    def test_register_user_skips_existence_pre_checks(self, use_case, user_repository):
+        """Test 1b: Chỉ gọi save, dựa vào unique constraint để phát hiện trùng"""
+        # Arrange
+        user_repository.save.return_value = Mock(id=1)
+        
+        input_data = RegisterUserInputData(
+            username="testuser",
+            email="test@example.com",
+            password_hash=generate_password_hash("Password123!"),
+            full_name="Test User"
+        )
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is True
+        assert [name for name, _, _ in user_repository.mock_calls] == ['save']
+    
     def test_register_user_with_minimum_fields_success(self, use_case, user_repository):
         """Test 2: Đăng ký thành công với thông tin tối thiểu (không có phone, address)"""
         # Arrange
@@ -374,8 +393,8 @@ class TestRegisterUserUseCase:
     
     # ============ REPOSITORY ERROR CASES ============
     
-    def test_register_user_repository_generic_error(self, use_case, user_repository):
-        """Test 18: Lỗi không xác định từ repository"""
+    def test_register_user_repository_generic_error_propagates(self, use_case, user_repository):
+        """Test 18: Lỗi không xác định từ repository được để cho tầng adapter xử lý"""
         # Arrange
         user_repository.save.side_effect = Exception("Database connection failed")
         
@@ -386,13 +405,9 @@ class TestRegisterUserUseCase:
             full_name="Test User"
         )
         
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert output.error_message is not None
-        assert output.user_id is None
+        # Act & Assert
+        with pytest.raises(Exception, match="Database connection failed"):
+            use_case.execute(input_data)
     
     # ============ EDGE CASES ============
     
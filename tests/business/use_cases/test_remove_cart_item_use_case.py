@@ -39,13 +39,6 @@ class TestRemoveCartItemUseCase:
         item.quantity = quantity
         return item
     
-    def create_mock_cart(self, cart_id, user_id):
-        """Helper tạo mock cart"""
-        cart = Mock()
-        cart.id = cart_id  # Changed from cart.cart_id to cart.id
-        cart.user_id = user_id
-        return cart
-    
     # ============ SUCCESS CASES ============
     
     def test_remove_cart_item_success(self, use_case, cart_repository):
@@ -55,10 +48,7 @@ class TestRemoveCartItemUseCase:
         cart_item_id = 5
         
         cart_item = self.create_mock_cart_item(cart_item_id, 1, 10, 2)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, user_id)
-        cart_repository.find_by_user_id.return_value = cart
+        cart_repository.find_cart_item_for_user.return_value = cart_item
         
         input_data = RemoveCartItemInputData(user_id=user_id, cart_item_id=cart_item_id)
         
@@ -72,14 +62,27 @@ class TestRemoveCartItemUseCase:
         
         cart_repository.remove_cart_item.assert_called_once_with(cart_item_id)
     
+    def test_remove_cart_item_uses_single_ownership_lookup(self, use_case, cart_repository):
+        """Test 1b: Chỉ một truy vấn để tìm item thuộc giỏ của user"""
+        # Arrange
+        cart_item = self.create_mock_cart_item(5, 1, 10, 2)
+        cart_repository.find_cart_item_for_user.return_value = cart_item
+        
+        input_data = RemoveCartItemInputData(user_id=1, cart_item_id=5)
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is True
+        cart_repository.find_cart_item_for_user.assert_called_once_with(1, 5)
+        cart_repository.find_cart_item_by_id.assert_not_called()
+    
     def test_remove_last_item_from_cart_success(self, use_case, cart_repository):
         """Test 2: Xóa item cuối cùng trong giỏ"""
         # Arrange
         cart_item = self.create_mock_cart_item(1, 1, 10, 1)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = cart
+        cart_repository.find_cart_item_for_user.return_value = cart_item
         
         input_data = RemoveCartItemInputData(user_id=1, cart_item_id=1)
         
@@ -94,10 +97,7 @@ class TestRemoveCartItemUseCase:
         """Test 3: Xóa 1 item trong giỏ có nhiều items"""
         # Arrange
         cart_item = self.create_mock_cart_item(2, 1, 20, 3)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = cart
+        cart_repository.find_cart_item_for_user.return_value = cart_item
         
         input_data = RemoveCartItemInputData(user_id=1, cart_item_id=2)
         
@@ -113,6 +113,7 @@ class TestRemoveCartItemUseCase:
     def test_remove_nonexistent_cart_item_fails(self, use_case, cart_repository):
         """Test 4: Xóa cart item không tồn tại"""
         # Arrange
+        cart_repository.find_cart_item_for_user.return_value = None
         cart_repository.find_cart_item_by_id.return_value = None
         
         input_data = RemoveCartItemInputData(user_id=1, cart_item_id=999)
@@ -131,11 +132,10 @@ class TestRemoveCartItemUseCase:
         """Test 5: Xóa cart item không thuộc về user"""
         # Arrange
         cart_item = self.create_mock_cart_item(1, 10, 5, 2)  # belongs to cart_id=10
-        cart_repository.find_cart_item_by_id.return_value = cart_item
         
-        # User's cart is cart_id=1, but item belongs to cart_id=10
-        user_cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = user_cart
+        # Item exists, but not in the user's cart (cart_id=1)
+        cart_repository.find_cart_item_for_user.return_value = None
+        cart_repository.find_cart_item_by_id.return_value = cart_item
         
         input_data = RemoveCartItemInputData(user_id=1, cart_item_id=1)
         
@@ -151,10 +151,10 @@ class TestRemoveCartItemUseCase:
         """Test 6: User không có cart"""
         # Arrange
         cart_item = self.create_mock_cart_item(1, 1, 5, 2)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
         
-        # User has no cart
-        cart_repository.find_by_user_id.return_value = None
+        # User has no cart, so the item is never found in it
+        cart_repository.find_cart_item_for_user.return_value = None
+        cart_repository.find_cart_item_by_id.return_value = cart_item
         
         input_data = RemoveCartItemInputData(user_id=1, cart_item_id=1)
         
@@ -170,11 +170,10 @@ class TestRemoveCartItemUseCase:
         """Test 7: Xóa item từ giỏ của user khác"""
         # Arrange
         cart_item = self.create_mock_cart_item(1, 5, 10, 2)  # belongs to cart_id=5
-        cart_repository.find_cart_item_by_id.return_value = cart_item
         
         # User 1's cart is cart_id=1, but item belongs to cart_id=5 (user 2's cart)
-        user_cart = self.create_mock_cart(1, 1)  # user_id=1, cart_id=1
-        cart_repository.find_by_user_id.return_value = user_cart
+        cart_repository.find_cart_item_for_user.return_value = None
+        cart_repository.find_cart_item_by_id.return_value = cart_item
         
         input_data = RemoveCartItemInputData(user_id=1, cart_item_id=1)
         
@@ -198,7 +197,7 @@ class TestRemoveCartItemUseCase:
         # Assert
         assert output.success is False
         assert "Invalid user ID" in output.error_message
-        cart_repository.find_cart_item_by_id.assert_not_called()
+        cart_repository.find_cart_item_for_user.assert_not_called()
     
     def test_remove_with_negative_user_id_fails(self, use_case, cart_repository):
         """Test 9: User ID âm"""
@@ -223,7 +222,7 @@ class TestRemoveCartItemUseCase:
         # Assert
         assert output.success is False
         assert "Invalid cart item ID" in output.error_message
-        cart_repository.find_cart_item_by_id.assert_not_called()
+        cart_repository.find_cart_item_for_user.assert_not_called()
     
     def test_remove_with_negative_cart_item_id_fails(self, use_case, cart_repository):
         """Test 11: Cart item ID âm"""
@@ -239,19 +238,16 @@ class TestRemoveCartItemUseCase:
     
     # ============ REPOSITORY EXCEPTIONS ============
     
-    def test_repository_exception_handled(self, use_case, cart_repository):
-        """Test 12: Lỗi từ repository được xử lý"""
+    def test_repository_exception_propagates(self, use_case, cart_repository):
+        """Test 12: Lỗi không mong đợi từ repository được để cho tầng adapter xử lý"""
         # Arrange
-        cart_repository.find_cart_item_by_id.side_effect = Exception("Database connection error")
+        cart_repository.find_cart_item_for_user.side_effect = Exception("Database connection error")
         
         input_data = RemoveCartItemInputData(user_id=1, cart_item_id=1)
         
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "An error occurred while removing cart item" in output.error_message
+        # Act & Assert
+        with pytest.raises(Exception, match="Database connection error"):
+            use_case.execute(input_data)
     
     # ============ OUTPUT DATA STRUCTURE ============
     
@@ -259,10 +255,7 @@ class TestRemoveCartItemUseCase:
         """Test 13: Cấu trúc output data khi thành công"""
         # Arrange
         cart_item = self.create_mock_cart_item(1, 1, 10, 2)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = cart
+        cart_repository.find_cart_item_for_user.return_value = cart_item
         
         input_data = RemoveCartItemInputData(user_id=1, cart_item_id=1)
         
@@ -282,6 +275,7 @@ class TestRemoveCartItemUseCase:
     def test_output_data_structure_on_failure(self, use_case, cart_repository):
         """Test 14: Cấu trúc output data khi thất bại"""
         # Arrange
+        cart_repository.find_cart_item_for_user.return_value = None
         cart_repository.find_cart_item_by_id.return_value = None
         
         input_data = RemoveCartItemInputData(user_id=1, cart_item_id=999)
@@ -214,7 +214,8 @@ class TestSearchUsersUseCase:
         assert output.success is True
         assert len(output.results) == 1
         # Query được normalized to lowercase
-        mock_user_repository.search_by_query.assert_called_once_with(query="JOHN", limit=50)
+        mock_user_repository.search_by_query.assert_called_once_with(query="john", limit=50)
+        assert output.search_query == "JOHN"
     
     def test_search_case_insensitive_lowercase_query(self, use_case, mock_user_repository, sample_users):
         """TC2.10: Case-insensitive search - lowercase query"""
@@ -322,6 +323,19 @@ class TestSearchUsersUseCase:
             }
             assert 'password_hash' not in result_dict
     
+    def test_search_results_use_slots(self, use_case, mock_user_repository, sample_users):
+        """TC2.14b: Result DTOs are slotted - no per-instance __dict__"""
+        # Arrange
+        mock_user_repository.search_by_query.return_value = sample_users
+        
+        # Act
+        output = use_case.execute(SearchUsersInputData(search_query="john"))
+        
+        # Assert
+        assert output.results
+        for result in output.results:
+            assert not hasattr(result, '__dict__')
+    
     def test_search_multiple_words_in_full_name(self, use_case, mock_user_repository, sample_users):
         """TC2.15: Search multiple words in full_name"""
         # Arrange
@@ -337,18 +351,13 @@ class TestSearchUsersUseCase:
         assert len(output.results) == 1
         assert "Junior" in output.results[0].full_name
     
-    def test_repository_exception_handled_gracefully(self, use_case, mock_user_repository):
-        """TC2.16: Repository exception - graceful error handling"""
+    def test_repository_exception_propagates(self, use_case, mock_user_repository):
+        """TC2.16: Repository exception - left to the adapter layer"""
         # Arrange
         mock_user_repository.search_by_query.side_effect = Exception("Database connection failed")
         
         input_data = SearchUsersInputData(search_query="john")
         
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert len(output.results) == 0
-        assert output.total_results == 0
-        assert "Error searching users" in output.error_message
+        # Act & Assert
+        with pytest.raises(Exception, match="Database connection failed"):
+            use_case.execute(input_data)
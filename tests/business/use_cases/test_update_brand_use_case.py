@@ -47,7 +47,6 @@ class TestUpdateBrandUseCase:
         brand.name = name
         brand.description = description
         brand.logo_url = logo_url
-        brand.update_details = Mock()
         return brand
     
     # ============ SUCCESS CASES ============
@@ -55,11 +54,9 @@ class TestUpdateBrandUseCase:
     def test_update_brand_success(self, use_case, brand_repository):
         """Test successfully updating a brand"""
         # Arrange
-        existing_brand = self.create_mock_brand(1, "Canon", "Old description")
-        
-        brand_repository.find_by_id.side_effect = lambda bid: existing_brand if bid == 1 else None
-        brand_repository.find_by_name.side_effect = lambda name: None
-        brand_repository.save.return_value = existing_brand
+        brand_repository.update_details_atomic.return_value = self.create_mock_brand(
+            1, "Canon Inc.", "Updated camera manufacturer", "/images/brands/canon-new.png"
+        )
         
         input_data = UpdateBrandInputData(
             brand_id=1,
@@ -74,23 +71,20 @@ class TestUpdateBrandUseCase:
         # Assert
         assert output.success is True
         assert output.brand_id == 1
+        assert output.brand_name == "Canon Inc."
         assert "successfully" in output.message.lower()
         
-        existing_brand.update_details.assert_called_once_with(
+        brand_repository.update_details_atomic.assert_called_once_with(
+            brand_id=1,
             name="Canon Inc.",
             description="Updated camera manufacturer",
             logo_url="/images/brands/canon-new.png"
         )
-        brand_repository.save.assert_called_once()
     
     def test_update_brand_name_only(self, use_case, brand_repository):
         """Test updating only brand name"""
         # Arrange
-        existing_brand = self.create_mock_brand(1, "Sony", "Description")
-        
-        brand_repository.find_by_id.side_effect = lambda bid: existing_brand if bid == 1 else None
-        brand_repository.find_by_name.side_effect = lambda name: None
-        brand_repository.save.return_value = existing_brand
+        brand_repository.update_details_atomic.return_value = self.create_mock_brand(1, "Sony Corporation")
         
         input_data = UpdateBrandInputData(
             brand_id=1,
@@ -102,15 +96,14 @@ class TestUpdateBrandUseCase:
         
         # Assert
         assert output.success is True
+        brand_repository.update_details_atomic.assert_called_once_with(
+            brand_id=1, name="Sony Corporation", description="", logo_url=""
+        )
     
     def test_update_brand_keep_same_name(self, use_case, brand_repository):
         """Test updating brand keeping the same name"""
         # Arrange
-        existing_brand = self.create_mock_brand(1, "Canon", "Old description")
-        
-        brand_repository.find_by_id.side_effect = lambda bid: existing_brand if bid == 1 else None
-        # find_by_name should not be called when name doesn't change
-        brand_repository.save.return_value = existing_brand
+        brand_repository.update_details_atomic.return_value = self.create_mock_brand(1, "Canon", "New description")
         
         input_data = UpdateBrandInputData(
             brand_id=1,
@@ -123,15 +116,33 @@ class TestUpdateBrandUseCase:
         
         # Assert
         assert output.success is True
-        brand_repository.find_by_name.assert_not_called()
+        assert output.brand_name == "Canon"
+    
+    def test_update_brand_name_is_stripped(self, use_case, brand_repository):
+        """Test surrounding whitespace is removed before validation and saving"""
+        # Arrange
+        brand_repository.update_details_atomic.return_value = self.create_mock_brand(1, "C" * 100)
+        
+        input_data = UpdateBrandInputData(
+            brand_id=1,
+            name="  " + "C" * 100 + "  "
+        )
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is True
+        brand_repository.update_details_atomic.assert_called_once_with(
+            brand_id=1, name="C" * 100, description="", logo_url=""
+        )
     
     def test_update_brand_description_and_logo(self, use_case, brand_repository):
         """Test updating description and logo"""
         # Arrange
-        existing_brand = self.create_mock_brand(2, "Nikon")
-        
-        brand_repository.find_by_id.side_effect = lambda bid: existing_brand if bid == 2 else None
-        brand_repository.save.return_value = existing_brand
+        brand_repository.update_details_atomic.return_value = self.create_mock_brand(
+            2, "Nikon", "Optical excellence since 1917", "/images/nikon-logo.png"
+        )
         
         input_data = UpdateBrandInputData(
             brand_id=2,
@@ -145,6 +156,7 @@ class TestUpdateBrandUseCase:
         
         # Assert
         assert output.success is True
+        assert output.brand_id == 2
     
     # ============ VALIDATION CASES - BRAND_ID ============
     
@@ -161,7 +173,7 @@ class TestUpdateBrandUseCase:
             use_case.execute(input_data)
         
         assert "brand id" in str(exc_info.value).lower()
-        brand_repository.find_by_id.assert_not_called()
+        brand_repository.update_details_atomic.assert_not_called()
     
     def test_update_brand_with_negative_brand_id_fails(self, use_case, brand_repository):
         """Test updating with negative brand ID"""
@@ -176,7 +188,7 @@ class TestUpdateBrandUseCase:
             use_case.execute(input_data)
         
         assert "brand id" in str(exc_info.value).lower()
-        brand_repository.find_by_id.assert_not_called()
+        brand_repository.update_details_atomic.assert_not_called()
     
     # ============ VALIDATION CASES - NAME ============
     
@@ -230,7 +242,7 @@ class TestUpdateBrandUseCase:
     def test_update_nonexistent_brand_fails(self, use_case, brand_repository):
         """Test updating non-existent brand"""
         # Arrange
-        brand_repository.find_by_id.side_effect = lambda bid: None
+        brand_repository.update_details_atomic.side_effect = BrandNotFoundException(999)
         
         input_data = UpdateBrandInputData(
             brand_id=999,
@@ -242,18 +254,13 @@ class TestUpdateBrandUseCase:
             use_case.execute(input_data)
         
         assert "999" in str(exc_info.value)
-        brand_repository.save.assert_not_called()
     
     # ============ DUPLICATE CASES ============
     
     def test_update_brand_with_duplicate_name_fails(self, use_case, brand_repository):
         """Test updating brand with name that exists for another brand"""
         # Arrange
-        existing_brand = self.create_mock_brand(1, "Canon")
-        other_brand = self.create_mock_brand(2, "Sony")
-        
-        brand_repository.find_by_id.side_effect = lambda bid: existing_brand if bid == 1 else None
-        brand_repository.find_by_name.side_effect = lambda name: other_brand if name == "Sony" else None
+        brand_repository.update_details_atomic.side_effect = BrandAlreadyExistsException("Sony")
         
         input_data = UpdateBrandInputData(
             brand_id=1,
@@ -266,16 +273,11 @@ class TestUpdateBrandUseCase:
         
         assert "Sony" in str(exc_info.value)
         assert "already exists" in str(exc_info.value).lower()
-        brand_repository.save.assert_not_called()
     
     def test_update_brand_same_name_different_case(self, use_case, brand_repository):
         """Test updating to name with different case (if repository is case-sensitive)"""
         # Arrange
-        existing_brand = self.create_mock_brand(1, "Canon")
-        
-        brand_repository.find_by_id.side_effect = lambda bid: existing_brand if bid == 1 else None
-        brand_repository.find_by_name.side_effect = lambda name: None  # "CANON" not found
-        brand_repository.save.return_value = existing_brand
+        brand_repository.update_details_atomic.return_value = self.create_mock_brand(1, "CANON")
         
         input_data = UpdateBrandInputData(
             brand_id=1,
@@ -287,52 +289,14 @@ class TestUpdateBrandUseCase:
         
         # Assert
         assert output.success is True
+        assert output.brand_name == "CANON"
     
     # ============ REPOSITORY EXCEPTION CASES ============
     
-    def test_repository_exception_find_by_id(self, use_case, brand_repository):
-        """Test repository exception during find_by_id"""
+    def test_repository_exception_update(self, use_case, brand_repository):
+        """Test repository exception during the atomic update"""
         # Arrange
-        brand_repository.find_by_id.side_effect = Exception("Database connection error")
-        
-        input_data = UpdateBrandInputData(
-            brand_id=1,
-            name="Brand"
-        )
-        
-        # Act & Assert
-        with pytest.raises(Exception) as exc_info:
-            use_case.execute(input_data)
-        
-        assert "Database connection error" in str(exc_info.value)
-    
-    def test_repository_exception_find_by_name(self, use_case, brand_repository):
-        """Test repository exception during find_by_name"""
-        # Arrange
-        existing_brand = self.create_mock_brand(1, "Canon")
-        
-        brand_repository.find_by_id.side_effect = lambda bid: existing_brand if bid == 1 else None
-        brand_repository.find_by_name.side_effect = Exception("Database query error")
-        
-        input_data = UpdateBrandInputData(
-            brand_id=1,
-            name="New Name"
-        )
-        
-        # Act & Assert
-        with pytest.raises(Exception) as exc_info:
-            use_case.execute(input_data)
-        
-        assert "Database query error" in str(exc_info.value)
-    
-    def test_repository_exception_save(self, use_case, brand_repository):
-        """Test repository exception during save"""
-        # Arrange
-        existing_brand = self.create_mock_brand(1, "Canon")
-        
-        brand_repository.find_by_id.side_effect = lambda bid: existing_brand if bid == 1 else None
-        brand_repository.find_by_name.side_effect = lambda name: None
-        brand_repository.save.side_effect = Exception("Database save error")
+        brand_repository.update_details_atomic.side_effect = Exception("Database connection error")
         
         input_data = UpdateBrandInputData(
             brand_id=1,
@@ -343,18 +307,14 @@ class TestUpdateBrandUseCase:
         with pytest.raises(Exception) as exc_info:
             use_case.execute(input_data)
         
-        assert "Database save error" in str(exc_info.value)
+        assert "Database connection error" in str(exc_info.value)
     
     # ============ OUTPUT STRUCTURE VALIDATION ============
     
     def test_output_data_structure(self, use_case, brand_repository):
         """Test output data structure"""
         # Arrange
-        existing_brand = self.create_mock_brand(1, "Canon")
-        
-        brand_repository.find_by_id.side_effect = lambda bid: existing_brand if bid == 1 else None
-        brand_repository.find_by_name.side_effect = lambda name: None
-        brand_repository.save.return_value = existing_brand
+        brand_repository.update_details_atomic.return_value = self.create_mock_brand(1, "Canon Inc.")
         
         input_data = UpdateBrandInputData(
             brand_id=1,
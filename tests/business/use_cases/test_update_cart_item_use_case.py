@@ -5,8 +5,8 @@ Test mọi trường hợp cập nhật số lượng sản phẩm trong giỏ -
 
 import pytest
 from unittest.mock import Mock
-from decimal import Decimal
 
+from app.business.ports.cart_repository import CartItemUpdateStatus, CartItemUpdateResult
 from app.business.use_cases.update_cart_item_use_case import (
     UpdateCartItemUseCase,
     UpdateCartItemInputData,
@@ -28,23 +28,9 @@ class TestUpdateCartItemUseCase:
         return Mock()
     
     @pytest.fixture
-    def product_repository(self):
-        """Mock product repository"""
-        return Mock()
-    
-    @pytest.fixture
-    def use_case(self, cart_repository, product_repository):
+    def use_case(self, cart_repository):
         """Khởi tạo use case"""
-        return UpdateCartItemUseCase(cart_repository, product_repository)
-    
-    def create_mock_product(self, product_id, name, price, stock=10):
-        """Helper tạo mock product"""
-        product = Mock()
-        product.product_id = product_id
-        product.name = name
-        product.price = Decimal(str(price))
-        product.stock_quantity = stock
-        return product
+        return UpdateCartItemUseCase(cart_repository)
     
     def create_mock_cart_item(self, cart_item_id, cart_id, product_id, quantity):
         """Helper tạo mock cart item"""
@@ -55,34 +41,25 @@ class TestUpdateCartItemUseCase:
         item.quantity = quantity
         return item
     
-    def create_mock_cart(self, cart_id, user_id):
-        """Helper tạo mock cart"""
-        cart = Mock()
-        cart.id = cart_id  # Changed from cart.cart_id to cart.id
-        cart.user_id = user_id
-        return cart
+    def stub_update_result(self, cart_repository, status, cart_item=None, available_stock=None):
+        """Helper: kết quả của câu lệnh UPDATE có điều kiện"""
+        cart_repository.try_update_quantity.return_value = CartItemUpdateResult(
+            status,
+            cart_item=cart_item,
+            available_stock=available_stock
+        )
     
     # ============ SUCCESS CASES - INCREASE QUANTITY ============
     
-    def test_update_increase_quantity_success(self, use_case, cart_repository, product_repository):
+    def test_update_increase_quantity_success(self, use_case, cart_repository):
         """Test 1: Tăng số lượng thành công"""
         # Arrange
         user_id = 1
         cart_item_id = 5
-        current_quantity = 2
         new_quantity = 5
         
-        cart_item = self.create_mock_cart_item(cart_item_id, 1, 10, current_quantity)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, user_id)
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Camera", 10000000, stock=20)
-        product_repository.find_by_id.return_value = product
-        
         updated_item = self.create_mock_cart_item(cart_item_id, 1, 10, new_quantity)
-        cart_repository.update_cart_item_quantity.return_value = updated_item
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.OK, cart_item=updated_item)
         
         input_data = UpdateCartItemInputData(
             user_id=user_id,
@@ -100,22 +77,13 @@ class TestUpdateCartItemUseCase:
         assert "Quantity updated to 5" in output.message
         assert output.error_message == ""
         
-        cart_repository.update_cart_item_quantity.assert_called_once_with(cart_item_id, new_quantity)
+        cart_repository.try_update_quantity.assert_called_once_with(user_id, cart_item_id, new_quantity)
     
-    def test_update_increase_to_max_stock_success(self, use_case, cart_repository, product_repository):
+    def test_update_increase_to_max_stock_success(self, use_case, cart_repository):
         """Test 2: Tăng lên đúng bằng tồn kho"""
         # Arrange
-        cart_item = self.create_mock_cart_item(1, 1, 10, 5)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Product", 1000000, stock=10)
-        product_repository.find_by_id.return_value = product
-        
         updated_item = self.create_mock_cart_item(1, 1, 10, 10)
-        cart_repository.update_cart_item_quantity.return_value = updated_item
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.OK, cart_item=updated_item)
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=10)
         
@@ -128,20 +96,11 @@ class TestUpdateCartItemUseCase:
     
     # ============ SUCCESS CASES - DECREASE QUANTITY ============
     
-    def test_update_decrease_quantity_success(self, use_case, cart_repository, product_repository):
+    def test_update_decrease_quantity_success(self, use_case, cart_repository):
         """Test 3: Giảm số lượng thành công"""
         # Arrange
-        cart_item = self.create_mock_cart_item(1, 1, 10, 10)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Product", 1000000, stock=20)
-        product_repository.find_by_id.return_value = product
-        
         updated_item = self.create_mock_cart_item(1, 1, 10, 3)
-        cart_repository.update_cart_item_quantity.return_value = updated_item
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.OK, cart_item=updated_item)
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=3)
         
@@ -152,20 +111,11 @@ class TestUpdateCartItemUseCase:
         assert output.success is True
         assert output.new_quantity == 3
     
-    def test_update_set_to_one_success(self, use_case, cart_repository, product_repository):
+    def test_update_set_to_one_success(self, use_case, cart_repository):
         """Test 4: Giảm xuống còn 1"""
         # Arrange
-        cart_item = self.create_mock_cart_item(1, 1, 10, 5)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Product", 1000000, stock=10)
-        product_repository.find_by_id.return_value = product
-        
         updated_item = self.create_mock_cart_item(1, 1, 10, 1)
-        cart_repository.update_cart_item_quantity.return_value = updated_item
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.OK, cart_item=updated_item)
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=1)
         
@@ -178,10 +128,10 @@ class TestUpdateCartItemUseCase:
     
     # ============ CART ITEM NOT FOUND ============
     
-    def test_update_nonexistent_cart_item_fails(self, use_case, cart_repository, product_repository):
+    def test_update_nonexistent_cart_item_fails(self, use_case, cart_repository):
         """Test 5: Cập nhật cart item không tồn tại"""
         # Arrange
-        cart_repository.find_cart_item_by_id.return_value = None
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.NOT_FOUND)
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=999, new_quantity=5)
         
@@ -191,19 +141,14 @@ class TestUpdateCartItemUseCase:
         # Assert
         assert output.success is False
         assert "Cart item with ID 999 not found" in output.error_message
-        cart_repository.update_cart_item_quantity.assert_not_called()
     
     # ============ CART OWNERSHIP VALIDATION ============
     
-    def test_update_cart_item_not_belonging_to_user_fails(self, use_case, cart_repository, product_repository):
+    def test_update_cart_item_not_belonging_to_user_fails(self, use_case, cart_repository):
         """Test 6: Cập nhật cart item không thuộc về user"""
         # Arrange
-        cart_item = self.create_mock_cart_item(1, 10, 5, 2)  # belongs to cart_id=10
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        # User's cart is cart_id=1, but item belongs to cart_id=10
-        user_cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = user_cart
+        # Item belongs to another user's cart
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.NOT_YOURS)
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=5)
         
@@ -213,16 +158,12 @@ class TestUpdateCartItemUseCase:
         # Assert
         assert output.success is False
         assert "This cart item does not belong to you" in output.error_message
-        cart_repository.update_cart_item_quantity.assert_not_called()
     
-    def test_update_cart_item_user_has_no_cart_fails(self, use_case, cart_repository, product_repository):
+    def test_update_cart_item_user_has_no_cart_fails(self, use_case, cart_repository):
         """Test 7: User không có cart"""
         # Arrange
-        cart_item = self.create_mock_cart_item(1, 1, 5, 2)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        # User has no cart
-        cart_repository.find_by_user_id.return_value = None
+        # User has no cart, so the item cannot be in it
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.NOT_YOURS)
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=5)
         
@@ -235,17 +176,10 @@ class TestUpdateCartItemUseCase:
     
     # ============ INSUFFICIENT STOCK ============
     
-    def test_update_quantity_exceeds_stock_fails(self, use_case, cart_repository, product_repository):
+    def test_update_quantity_exceeds_stock_fails(self, use_case, cart_repository):
         """Test 8: Số lượng mới vượt quá tồn kho"""
         # Arrange
-        cart_item = self.create_mock_cart_item(1, 1, 10, 2)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Limited Stock", 1000000, stock=5)
-        product_repository.find_by_id.return_value = product
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.INSUFFICIENT_STOCK, available_stock=5)
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=10)
         
@@ -255,19 +189,11 @@ class TestUpdateCartItemUseCase:
         # Assert
         assert output.success is False
         assert "Only 5 items available in stock" in output.error_message
-        cart_repository.update_cart_item_quantity.assert_not_called()
     
-    def test_update_to_zero_stock_product_fails(self, use_case, cart_repository, product_repository):
+    def test_update_to_zero_stock_product_fails(self, use_case, cart_repository):
         """Test 9: Cập nhật cho sản phẩm hết hàng"""
         # Arrange
-        cart_item = self.create_mock_cart_item(1, 1, 10, 1)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Out of Stock", 1000000, stock=0)
-        product_repository.find_by_id.return_value = product
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.INSUFFICIENT_STOCK, available_stock=0)
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=1)
         
@@ -280,16 +206,10 @@ class TestUpdateCartItemUseCase:
     
     # ============ PRODUCT NOT FOUND ============
     
-    def test_update_deleted_product_fails(self, use_case, cart_repository, product_repository):
+    def test_update_deleted_product_fails(self, use_case, cart_repository):
         """Test 10: Sản phẩm đã bị xóa"""
         # Arrange
-        cart_item = self.create_mock_cart_item(1, 1, 999, 2)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product_repository.find_by_id.return_value = None
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.PRODUCT_UNAVAILABLE)
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=5)
         
@@ -302,7 +222,7 @@ class TestUpdateCartItemUseCase:
     
     # ============ INPUT VALIDATION ============
     
-    def test_update_with_invalid_user_id_fails(self, use_case, cart_repository, product_repository):
+    def test_update_with_invalid_user_id_fails(self, use_case, cart_repository):
         """Test 11: User ID không hợp lệ (0)"""
         # Arrange
         input_data = UpdateCartItemInputData(user_id=0, cart_item_id=1, new_quantity=5)
@@ -313,9 +233,9 @@ class TestUpdateCartItemUseCase:
         # Assert
         assert output.success is False
         assert "Invalid user ID" in output.error_message
-        cart_repository.find_cart_item_by_id.assert_not_called()
+        cart_repository.try_update_quantity.assert_not_called()
     
-    def test_update_with_negative_user_id_fails(self, use_case, cart_repository, product_repository):
+    def test_update_with_negative_user_id_fails(self, use_case, cart_repository):
         """Test 12: User ID âm"""
         # Arrange
         input_data = UpdateCartItemInputData(user_id=-1, cart_item_id=1, new_quantity=5)
@@ -327,7 +247,7 @@ class TestUpdateCartItemUseCase:
         assert output.success is False
         assert "Invalid user ID" in output.error_message
     
-    def test_update_with_invalid_cart_item_id_fails(self, use_case, cart_repository, product_repository):
+    def test_update_with_invalid_cart_item_id_fails(self, use_case, cart_repository):
         """Test 13: Cart item ID không hợp lệ"""
         # Arrange
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=0, new_quantity=5)
@@ -338,9 +258,9 @@ class TestUpdateCartItemUseCase:
         # Assert
         assert output.success is False
         assert "Invalid cart item ID" in output.error_message
-        cart_repository.find_cart_item_by_id.assert_not_called()
+        cart_repository.try_update_quantity.assert_not_called()
     
-    def test_update_with_zero_quantity_fails(self, use_case, cart_repository, product_repository):
+    def test_update_with_zero_quantity_fails(self, use_case, cart_repository):
         """Test 14: Số lượng = 0 (nên dùng remove thay vì update)"""
         # Arrange
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=0)
@@ -351,9 +271,9 @@ class TestUpdateCartItemUseCase:
         # Assert
         assert output.success is False
         assert "Quantity must be positive" in output.error_message
-        cart_repository.find_cart_item_by_id.assert_not_called()
+        cart_repository.try_update_quantity.assert_not_called()
     
-    def test_update_with_negative_quantity_fails(self, use_case, cart_repository, product_repository):
+    def test_update_with_negative_quantity_fails(self, use_case, cart_repository):
         """Test 15: Số lượng âm"""
         # Arrange
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=-5)
@@ -365,7 +285,7 @@ class TestUpdateCartItemUseCase:
         assert output.success is False
         assert "Quantity must be positive" in output.error_message
     
-    def test_update_quantity_exceeds_limit_fails(self, use_case, cart_repository, product_repository):
+    def test_update_quantity_exceeds_limit_fails(self, use_case, cart_repository):
         """Test 16: Số lượng > 100 (limit)"""
         # Arrange
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=101)
@@ -377,20 +297,11 @@ class TestUpdateCartItemUseCase:
         assert output.success is False
         assert "Cannot have more than 100 items" in output.error_message
     
-    def test_update_to_exactly_100_success(self, use_case, cart_repository, product_repository):
+    def test_update_to_exactly_100_success(self, use_case, cart_repository):
         """Test 17: Cập nhật lên đúng 100 (boundary)"""
         # Arrange
-        cart_item = self.create_mock_cart_item(1, 1, 10, 50)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Product", 1000000, stock=150)
-        product_repository.find_by_id.return_value = product
-        
         updated_item = self.create_mock_cart_item(1, 1, 10, 100)
-        cart_repository.update_cart_item_quantity.return_value = updated_item
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.OK, cart_item=updated_item)
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=100)
         
@@ -403,36 +314,24 @@ class TestUpdateCartItemUseCase:
     
     # ============ REPOSITORY EXCEPTIONS ============
     
-    def test_repository_exception_handled(self, use_case, cart_repository, product_repository):
-        """Test 18: Lỗi từ repository được xử lý"""
+    def test_repository_exception_propagates(self, use_case, cart_repository):
+        """Test 18: Lỗi không mong đợi từ repository được để cho tầng adapter xử lý"""
         # Arrange
-        cart_repository.find_cart_item_by_id.side_effect = Exception("Database error")
+        cart_repository.try_update_quantity.side_effect = Exception("Database error")
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=5)
         
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "An error occurred while updating cart item" in output.error_message
+        # Act & Assert
+        with pytest.raises(Exception, match="Database error"):
+            use_case.execute(input_data)
     
     # ============ OUTPUT DATA STRUCTURE ============
     
-    def test_output_data_structure_on_success(self, use_case, cart_repository, product_repository):
+    def test_output_data_structure_on_success(self, use_case, cart_repository):
         """Test 19: Cấu trúc output data khi thành công"""
         # Arrange
-        cart_item = self.create_mock_cart_item(1, 1, 10, 2)
-        cart_repository.find_cart_item_by_id.return_value = cart_item
-        
-        cart = self.create_mock_cart(1, 1)
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Product", 1000000, stock=20)
-        product_repository.find_by_id.return_value = product
-        
         updated_item = self.create_mock_cart_item(1, 1, 10, 8)
-        cart_repository.update_cart_item_quantity.return_value = updated_item
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.OK, cart_item=updated_item)
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=1, new_quantity=8)
         
@@ -453,10 +352,10 @@ class TestUpdateCartItemUseCase:
         assert len(output.message) > 0
         assert output.error_message == ""
     
-    def test_output_data_structure_on_failure(self, use_case, cart_repository, product_repository):
+    def test_output_data_structure_on_failure(self, use_case, cart_repository):
         """Test 20: Cấu trúc output data khi thất bại"""
         # Arrange
-        cart_repository.find_cart_item_by_id.return_value = None
+        self.stub_update_result(cart_repository, CartItemUpdateStatus.NOT_FOUND)
         
         input_data = UpdateCartItemInputData(user_id=1, cart_item_id=999, new_quantity=5)
         
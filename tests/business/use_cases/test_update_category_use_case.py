@@ -37,35 +37,33 @@ class TestUpdateCategoryUseCase:
         category.id = category_id
         category.name = name
         category.description = description
-        category.update_details = Mock()
         return category
     
     def test_update_category_success(self, use_case, category_repository):
-        existing = self.create_mock_category(1, "Cameras", "Old")
-        category_repository.find_by_id.side_effect = lambda cid: existing if cid == 1 else None
-        category_repository.find_by_name.return_value = None
-        category_repository.save.return_value = existing
+        category_repository.update_details_atomic.return_value = self.create_mock_category(1, "DSLR Cameras", "Updated")
         
         output = use_case.execute(UpdateCategoryInputData(1, "DSLR Cameras", "Updated"))
         
         assert output.success is True
         assert output.category_id == 1
-        existing.update_details.assert_called_once()
+        assert output.category_name == "DSLR Cameras"
+        category_repository.update_details_atomic.assert_called_once_with(
+            category_id=1, name="DSLR Cameras", description="Updated"
+        )
     
     def test_update_category_keep_same_name(self, use_case, category_repository):
-        existing = self.create_mock_category(1, "Cameras")
-        category_repository.find_by_id.return_value = existing
-        category_repository.save.return_value = existing
+        category_repository.update_details_atomic.return_value = self.create_mock_category(1, "Cameras", "New desc")
         
         output = use_case.execute(UpdateCategoryInputData(1, "Cameras", "New desc"))
         
         assert output.success is True
-        category_repository.find_by_name.assert_not_called()
+        assert output.category_name == "Cameras"
     
-    def test_invalid_category_id_zero(self, use_case):
+    def test_invalid_category_id_zero(self, use_case, category_repository):
         with pytest.raises(ValidationException) as exc:
             use_case.execute(UpdateCategoryInputData(0, "Name"))
         assert "category id" in str(exc.value).lower()
+        category_repository.update_details_atomic.assert_not_called()
     
     def test_invalid_category_id_negative(self, use_case):
         with pytest.raises(ValidationException):
@@ -86,32 +84,25 @@ class TestUpdateCategoryUseCase:
             use_case.execute(UpdateCategoryInputData(1, "A" * 101))
     
     def test_nonexistent_category_fails(self, use_case, category_repository):
-        category_repository.find_by_id.return_value = None
+        category_repository.update_details_atomic.side_effect = CategoryNotFoundException(999)
         
         with pytest.raises(CategoryNotFoundException):
             use_case.execute(UpdateCategoryInputData(999, "Name"))
     
     def test_duplicate_name_fails(self, use_case, category_repository):
-        existing = self.create_mock_category(1, "Cameras")
-        other = self.create_mock_category(2, "Lenses")
-        
-        category_repository.find_by_id.return_value = existing
-        category_repository.find_by_name.return_value = other
+        category_repository.update_details_atomic.side_effect = CategoryAlreadyExistsException("Lenses")
         
         with pytest.raises(CategoryAlreadyExistsException):
             use_case.execute(UpdateCategoryInputData(1, "Lenses"))
     
-    def test_repository_exception_find(self, use_case, category_repository):
-        category_repository.find_by_id.side_effect = Exception("DB error")
+    def test_repository_exception_update(self, use_case, category_repository):
+        category_repository.update_details_atomic.side_effect = Exception("DB error")
         
         with pytest.raises(Exception):
             use_case.execute(UpdateCategoryInputData(1, "Name"))
     
     def test_output_structure(self, use_case, category_repository):
-        existing = self.create_mock_category(1, "Cameras")
-        category_repository.find_by_id.return_value = existing
-        category_repository.find_by_name.return_value = None
-        category_repository.save.return_value = existing
+        category_repository.update_details_atomic.return_value = self.create_mock_category(1, "New Name")
         
         output = use_case.execute(UpdateCategoryInputData(1, "New Name"))
         
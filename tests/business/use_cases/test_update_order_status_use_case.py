@@ -27,7 +27,8 @@ from app.domain.value_objects.money import Money
 from app.domain.exceptions import (
     OrderNotFoundException,
     InvalidOrderStatusTransitionException,
-    ValidationException
+    ValidationException,
+    ConcurrencyConflictException
 )
 
 
@@ -190,6 +191,23 @@ class TestUpdateOrderStatusUseCase:
         assert order.status == OrderStatus.PENDING  # Status unchanged
         order_repository.save.assert_not_called()
     
+    def test_invalid_transition_lists_allowed_statuses_in_enum_order(self, use_case, order_repository):
+        """Test the error lists allowed targets deterministically despite frozenset storage"""
+        # Arrange
+        order_id = 10
+        order = self.create_mock_order(order_id, OrderStatus.PENDING)
+        
+        order_repository.find_by_id.side_effect = lambda oid: order if oid == order_id else None
+        
+        input_data = UpdateOrderStatusInputData(order_id=order_id, new_status="HOAN_THANH")
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert isinstance(UpdateOrderStatusUseCase.VALID_TRANSITIONS[OrderStatus.PENDING], frozenset)
+        assert "Allowed transitions: DANG_GIAO, DA_HUY" in output.message
+    
     def test_update_shipping_to_cancelled_fails(self, use_case, order_repository):
         """Test cannot cancel shipping order"""
         # Arrange
@@ -226,6 +244,26 @@ class TestUpdateOrderStatusUseCase:
         assert order.status == OrderStatus.SHIPPING
         order_repository.save.assert_not_called()
     
+    def test_update_to_current_status_is_noop(self, use_case, order_repository):
+        """Test re-sending the current status succeeds without saving"""
+        # Arrange
+        order_id = 10
+        order = self.create_mock_order(order_id, OrderStatus.SHIPPING)
+        
+        order_repository.find_by_id.side_effect = lambda oid: order if oid == order_id else None
+        
+        input_data = UpdateOrderStatusInputData(order_id=order_id, new_status="DANG_GIAO")
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is True
+        assert output.old_status == "DANG_GIAO"
+        assert output.new_status == "DANG_GIAO"
+        assert "already" in output.message
+        order_repository.save.assert_not_called()
+    
     # ============ TERMINAL STATE CASES ============
     
     def test_update_completed_to_any_status_fails(self, use_case, order_repository):
@@ -272,54 +310,27 @@ class TestUpdateOrderStatusUseCase:
     
     def test_update_with_invalid_order_id_zero_fails(self, use_case, order_repository):
         """Test with invalid order ID (zero)"""
-        # Arrange
-        input_data = UpdateOrderStatusInputData(order_id=0, new_status="DANG_GIAO")
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "invalid order id" in output.message.lower()
-        order_repository.find_by_id.assert_not_called()
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)invalid order id"):
+            UpdateOrderStatusInputData(order_id=0, new_status="DANG_GIAO")
     
     def test_update_with_negative_order_id_fails(self, use_case, order_repository):
         """Test with negative order ID"""
-        # Arrange
-        input_data = UpdateOrderStatusInputData(order_id=-1, new_status="DANG_GIAO")
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "invalid order id" in output.message.lower()
-        order_repository.find_by_id.assert_not_called()
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)invalid order id"):
+            UpdateOrderStatusInputData(order_id=-1, new_status="DANG_GIAO")
     
     def test_update_with_empty_status_fails(self, use_case, order_repository):
         """Test with empty status"""
-        # Arrange
-        input_data = UpdateOrderStatusInputData(order_id=10, new_status="")
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "required" in output.message.lower()
-        order_repository.find_by_id.assert_not_called()
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)required"):
+            UpdateOrderStatusInputData(order_id=10, new_status="")
     
     def test_update_with_none_status_fails(self, use_case, order_repository):
         """Test with None status"""
-        # Arrange
-        input_data = UpdateOrderStatusInputData(order_id=10, new_status=None)
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        order_repository.find_by_id.assert_not_called()
+        # Act & Assert
+        with pytest.raises(ValueError):
+            UpdateOrderStatusInputData(order_id=10, new_status=None)
     
     def test_update_with_invalid_status_value_fails(self, use_case, order_repository):
         """Test with invalid status value"""
@@ -394,6 +405,72 @@ class TestUpdateOrderStatusUseCase:
         assert output.success is False
         assert "error" in output.message.lower()
     
+    # ============ CONCURRENCY CASES ============
+    
+    def test_version_conflict_rereads_and_retries(self, use_case, order_repository):
+        """Test a stale save is retried against a fresh read of the order"""
+        # Arrange
+        order_id = 10
+        orders = [
+            self.create_mock_order(order_id, OrderStatus.PENDING),
+            self.create_mock_order(order_id, OrderStatus.PENDING)
+        ]
+        
+        order_repository.find_by_id.side_effect = orders
+        order_repository.save.side_effect = [ConcurrencyConflictException('Order', order_id), None]
+        
+        input_data = UpdateOrderStatusInputData(order_id=order_id, new_status="DANG_GIAO")
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is True
+        assert order_repository.find_by_id.call_count == 2
+        order_repository.save.assert_called_with(orders[1])
+    
+    def test_version_conflict_rechecks_transition(self, use_case, order_repository):
+        """Test the retry validates the transition against the concurrently saved status"""
+        # Arrange
+        order_id = 10
+        orders = [
+            self.create_mock_order(order_id, OrderStatus.PENDING),
+            self.create_mock_order(order_id, OrderStatus.SHIPPING)
+        ]
+        
+        order_repository.find_by_id.side_effect = orders
+        order_repository.save.side_effect = ConcurrencyConflictException('Order', order_id)
+        
+        input_data = UpdateOrderStatusInputData(order_id=order_id, new_status="DA_HUY")
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is False
+        assert "Cannot transition" in output.message
+        assert order_repository.save.call_count == 1
+    
+    def test_version_conflict_gives_up_after_max_attempts(self, use_case, order_repository):
+        """Test persistent conflicts fail the update instead of retrying forever"""
+        # Arrange
+        order_id = 10
+        
+        order_repository.find_by_id.side_effect = (
+            lambda oid: self.create_mock_order(oid, OrderStatus.PENDING)
+        )
+        order_repository.save.side_effect = ConcurrencyConflictException('Order', order_id)
+        
+        input_data = UpdateOrderStatusInputData(order_id=order_id, new_status="DANG_GIAO")
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is False
+        assert "modified by another request" in output.message
+        assert order_repository.save.call_count == UpdateOrderStatusUseCase.MAX_SAVE_ATTEMPTS
+    
     # ============ OUTPUT STRUCTURE VALIDATION ============
     
     def test_output_data_structure_on_success(self, use_case, order_repository):
@@ -440,3 +517,11 @@ class TestUpdateOrderStatusUseCase:
         assert hasattr(output, 'message')
         assert isinstance(output.message, str)
         assert len(output.message) > 0
+    
+    def test_dtos_are_slotted(self):
+        """Test input/output DTOs carry no per-instance __dict__"""
+        input_data = UpdateOrderStatusInputData(order_id=1, new_status="DANG_GIAO")
+        output = UpdateOrderStatusOutputData(success=True, order_id=1)
+        
+        assert not hasattr(input_data, '__dict__')
+        assert not hasattr(output, '__dict__')
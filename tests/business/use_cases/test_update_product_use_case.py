@@ -16,6 +16,7 @@ import pytest
 from unittest.mock import Mock
 from decimal import Decimal
 
+from app.business.ports import ProductUpdateContext
 from app.business.use_cases.update_product_use_case import (
     UpdateProductUseCase,
     UpdateProductInputData,
@@ -42,19 +43,9 @@ class TestUpdateProductUseCase:
         return Mock()
     
     @pytest.fixture
-    def category_repository(self):
-        """Mock category repository"""
-        return Mock()
-    
-    @pytest.fixture
-    def brand_repository(self):
-        """Mock brand repository"""
-        return Mock()
-    
-    @pytest.fixture
-    def use_case(self, product_repository, category_repository, brand_repository):
+    def use_case(self, product_repository):
         """Create use case instance"""
-        return UpdateProductUseCase(product_repository, category_repository, brand_repository)
+        return UpdateProductUseCase(product_repository)
     
     # ============ HELPER METHODS ============
     
@@ -70,39 +61,19 @@ class TestUpdateProductUseCase:
         product.brand_id = brand_id
         product.is_visible = is_visible
         product.update_details = Mock()
-        product.add_stock = Mock()
-        product.reduce_stock = Mock()
+        product.set_stock = Mock()
         product.show = Mock()
         product.hide = Mock()
         return product
     
-    def create_mock_category(self, category_id, name):
-        """Create mock category"""
-        category = Mock()
-        category.id = category_id
-        category.name = name
-        return category
-    
-    def create_mock_brand(self, brand_id, name):
-        """Create mock brand"""
-        brand = Mock()
-        brand.id = brand_id
-        brand.name = name
-        return brand
-    
     # ============ SUCCESS CASES ============
     
-    def test_update_product_success(self, use_case, product_repository, category_repository, brand_repository):
+    def test_update_product_success(self, use_case, product_repository):
         """Test successfully updating a product"""
         # Arrange
         existing_product = self.create_mock_product(10, "Old Name", "Old description", 1000000, 5, 1, 1)
-        category = self.create_mock_category(1, "Cameras")
-        brand = self.create_mock_brand(1, "Canon")
         
-        product_repository.find_by_id.side_effect = lambda pid: existing_product if pid == 10 else None
-        category_repository.find_by_id.side_effect = lambda cid: category if cid == 1 else None
-        brand_repository.find_by_id.side_effect = lambda bid: brand if bid == 1 else None
-        product_repository.find_by_name.side_effect = lambda name: None
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product)
         product_repository.save.return_value = existing_product
         
         input_data = UpdateProductInputData(
@@ -129,17 +100,40 @@ class TestUpdateProductUseCase:
         existing_product.update_details.assert_called_once()
         product_repository.save.assert_called_once()
     
-    def test_update_product_name_only(self, use_case, product_repository, category_repository, brand_repository):
+    def test_update_product_checks_references_in_one_call(self, use_case, product_repository):
+        """Test product, category, brand and name checks come from one repository call"""
+        # Arrange
+        existing_product = self.create_mock_product(10, "Old Name", "Description text here", 1000000, 5, 1, 1)
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product)
+        product_repository.save.return_value = existing_product
+        
+        input_data = UpdateProductInputData(
+            product_id=10,
+            name="New Name",
+            description="Description text here",
+            price=1000000,
+            stock_quantity=5,
+            category_id=2,
+            brand_id=3
+        )
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is True
+        product_repository.fetch_update_context.assert_called_once_with(
+            10, category_id=2, brand_id=3, name="New Name"
+        )
+        product_repository.find_by_id.assert_not_called()
+        product_repository.find_by_name.assert_not_called()
+    
+    def test_update_product_name_only(self, use_case, product_repository):
         """Test updating only product name"""
         # Arrange
         existing_product = self.create_mock_product(10, "Old Name", "Description text here", 1000000, 5, 1, 1)
-        category = self.create_mock_category(1, "Cameras")
-        brand = self.create_mock_brand(1, "Canon")
         
-        product_repository.find_by_id.side_effect = lambda pid: existing_product if pid == 10 else None
-        category_repository.find_by_id.side_effect = lambda cid: category if cid == 1 else None
-        brand_repository.find_by_id.side_effect = lambda bid: brand if bid == 1 else None
-        product_repository.find_by_name.side_effect = lambda name: None
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product)
         product_repository.save.return_value = existing_product
         
         input_data = UpdateProductInputData(
@@ -158,17 +152,12 @@ class TestUpdateProductUseCase:
         # Assert
         assert output.success is True
     
-    def test_update_product_increase_stock(self, use_case, product_repository, category_repository, brand_repository):
+    def test_update_product_increase_stock(self, use_case, product_repository):
         """Test updating product with increased stock"""
         # Arrange
         existing_product = self.create_mock_product(10, "Product", "Description text here", 1000000, 5, 1, 1)
-        category = self.create_mock_category(1, "Cameras")
-        brand = self.create_mock_brand(1, "Canon")
         
-        product_repository.find_by_id.side_effect = lambda pid: existing_product if pid == 10 else None
-        category_repository.find_by_id.side_effect = lambda cid: category if cid == 1 else None
-        brand_repository.find_by_id.side_effect = lambda bid: brand if bid == 1 else None
-        product_repository.find_by_name.side_effect = lambda name: None
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product)
         product_repository.save.return_value = existing_product
         
         input_data = UpdateProductInputData(
@@ -186,19 +175,14 @@ class TestUpdateProductUseCase:
         
         # Assert
         assert output.success is True
-        existing_product.add_stock.assert_called_once_with(10)
+        existing_product.set_stock.assert_called_once_with(15)
     
-    def test_update_product_decrease_stock(self, use_case, product_repository, category_repository, brand_repository):
+    def test_update_product_decrease_stock(self, use_case, product_repository):
         """Test updating product with decreased stock"""
         # Arrange
         existing_product = self.create_mock_product(10, "Product", "Description text here", 1000000, 15, 1, 1)
-        category = self.create_mock_category(1, "Cameras")
-        brand = self.create_mock_brand(1, "Canon")
         
-        product_repository.find_by_id.side_effect = lambda pid: existing_product if pid == 10 else None
-        category_repository.find_by_id.side_effect = lambda cid: category if cid == 1 else None
-        brand_repository.find_by_id.side_effect = lambda bid: brand if bid == 1 else None
-        product_repository.find_by_name.side_effect = lambda name: None
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product)
         product_repository.save.return_value = existing_product
         
         input_data = UpdateProductInputData(
@@ -216,19 +200,14 @@ class TestUpdateProductUseCase:
         
         # Assert
         assert output.success is True
-        existing_product.reduce_stock.assert_called_once_with(10)
+        existing_product.set_stock.assert_called_once_with(5)
     
-    def test_update_product_hide(self, use_case, product_repository, category_repository, brand_repository):
+    def test_update_product_hide(self, use_case, product_repository):
         """Test hiding a visible product"""
         # Arrange
         existing_product = self.create_mock_product(10, "Product", "Description text here", 1000000, 5, 1, 1, is_visible=True)
-        category = self.create_mock_category(1, "Cameras")
-        brand = self.create_mock_brand(1, "Canon")
         
-        product_repository.find_by_id.side_effect = lambda pid: existing_product if pid == 10 else None
-        category_repository.find_by_id.side_effect = lambda cid: category if cid == 1 else None
-        brand_repository.find_by_id.side_effect = lambda bid: brand if bid == 1 else None
-        product_repository.find_by_name.side_effect = lambda name: None
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product)
         product_repository.save.return_value = existing_product
         
         input_data = UpdateProductInputData(
@@ -249,17 +228,12 @@ class TestUpdateProductUseCase:
         assert output.success is True
         existing_product.hide.assert_called_once()
     
-    def test_update_product_show(self, use_case, product_repository, category_repository, brand_repository):
+    def test_update_product_show(self, use_case, product_repository):
         """Test showing a hidden product"""
         # Arrange
         existing_product = self.create_mock_product(10, "Product", "Description text here", 1000000, 5, 1, 1, is_visible=False)
-        category = self.create_mock_category(1, "Cameras")
-        brand = self.create_mock_brand(1, "Canon")
         
-        product_repository.find_by_id.side_effect = lambda pid: existing_product if pid == 10 else None
-        category_repository.find_by_id.side_effect = lambda cid: category if cid == 1 else None
-        brand_repository.find_by_id.side_effect = lambda bid: brand if bid == 1 else None
-        product_repository.find_by_name.side_effect = lambda name: None
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product)
         product_repository.save.return_value = existing_product
         
         input_data = UpdateProductInputData(
@@ -284,242 +258,259 @@ class TestUpdateProductUseCase:
     
     def test_update_product_with_invalid_product_id_zero_fails(self, use_case, product_repository):
         """Test updating with invalid product ID (zero)"""
-        # Arrange
-        input_data = UpdateProductInputData(
-            product_id=0,
-            name="Product",
-            description="Description text here",
-            price=1000000,
-            stock_quantity=5,
-            category_id=1,
-            brand_id=1
-        )
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "id" in output.message.lower()
-        product_repository.find_by_id.assert_not_called()
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)id"):
+            UpdateProductInputData(
+                product_id=0,
+                name="Product",
+                description="Description text here",
+                price=1000000,
+                stock_quantity=5,
+                category_id=1,
+                brand_id=1
+            )
     
     def test_update_product_with_negative_product_id_fails(self, use_case, product_repository):
         """Test updating with negative product ID"""
-        # Arrange
-        input_data = UpdateProductInputData(
-            product_id=-1,
-            name="Product",
-            description="Description text here",
-            price=1000000,
-            stock_quantity=5,
-            category_id=1,
-            brand_id=1
-        )
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "id" in output.message.lower()
-        product_repository.find_by_id.assert_not_called()
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)id"):
+            UpdateProductInputData(
+                product_id=-1,
+                name="Product",
+                description="Description text here",
+                price=1000000,
+                stock_quantity=5,
+                category_id=1,
+                brand_id=1
+            )
     
     # ============ VALIDATION CASES - NAME ============
     
     def test_update_product_with_empty_name_fails(self, use_case, product_repository):
         """Test updating with empty name"""
-        # Arrange
-        input_data = UpdateProductInputData(
-            product_id=10,
-            name="",
-            description="Description text here",
-            price=1000000,
-            stock_quantity=5,
-            category_id=1,
-            brand_id=1
-        )
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "tên" in output.message.lower()
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)tên"):
+            UpdateProductInputData(
+                product_id=10,
+                name="",
+                description="Description text here",
+                price=1000000,
+                stock_quantity=5,
+                category_id=1,
+                brand_id=1
+            )
     
     def test_update_product_with_short_name_fails(self, use_case, product_repository):
         """Test updating with name too short"""
-        # Arrange
-        input_data = UpdateProductInputData(
-            product_id=10,
-            name="AB",
-            description="Description text here",
-            price=1000000,
-            stock_quantity=5,
-            category_id=1,
-            brand_id=1
-        )
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "tên" in output.message.lower() and "3" in output.message
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)tên"):
+            UpdateProductInputData(
+                product_id=10,
+                name="AB",
+                description="Description text here",
+                price=1000000,
+                stock_quantity=5,
+                category_id=1,
+                brand_id=1
+            )
     
     # ============ VALIDATION CASES - DESCRIPTION ============
     
     def test_update_product_with_empty_description_fails(self, use_case, product_repository):
         """Test updating with empty description"""
-        # Arrange
-        input_data = UpdateProductInputData(
-            product_id=10,
-            name="Product Name",
-            description="",
-            price=1000000,
-            stock_quantity=5,
-            category_id=1,
-            brand_id=1
-        )
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "mô tả" in output.message.lower()
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)mô tả"):
+            UpdateProductInputData(
+                product_id=10,
+                name="Product Name",
+                description="",
+                price=1000000,
+                stock_quantity=5,
+                category_id=1,
+                brand_id=1
+            )
     
     def test_update_product_with_short_description_fails(self, use_case, product_repository):
         """Test updating with description too short"""
-        # Arrange
-        input_data = UpdateProductInputData(
-            product_id=10,
-            name="Product Name",
-            description="Short",
-            price=1000000,
-            stock_quantity=5,
-            category_id=1,
-            brand_id=1
-        )
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "mô tả" in output.message.lower() and "10" in output.message
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)mô tả"):
+            UpdateProductInputData(
+                product_id=10,
+                name="Product Name",
+                description="Short",
+                price=1000000,
+                stock_quantity=5,
+                category_id=1,
+                brand_id=1
+            )
     
     # ============ VALIDATION CASES - PRICE ============
     
     def test_update_product_with_zero_price_fails(self, use_case, product_repository):
         """Test updating with zero price"""
-        # Arrange
-        input_data = UpdateProductInputData(
-            product_id=10,
-            name="Product Name",
-            description="Description text here",
-            price=0,
-            stock_quantity=5,
-            category_id=1,
-            brand_id=1
-        )
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "giá" in output.message.lower()
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)giá"):
+            UpdateProductInputData(
+                product_id=10,
+                name="Product Name",
+                description="Description text here",
+                price=0,
+                stock_quantity=5,
+                category_id=1,
+                brand_id=1
+            )
     
     def test_update_product_with_negative_price_fails(self, use_case, product_repository):
         """Test updating with negative price"""
-        # Arrange
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)giá"):
+            UpdateProductInputData(
+                product_id=10,
+                name="Product Name",
+                description="Description text here",
+                price=-1000000,
+                stock_quantity=5,
+                category_id=1,
+                brand_id=1
+            )
+    
+    @pytest.mark.parametrize("price", ["NaN", "Infinity", "-Infinity", float("nan"), float("inf")])
+    def test_update_product_with_non_finite_price_fails(self, price):
+        """Test updating with NaN or infinite price"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Giá sản phẩm không hợp lệ"):
+            UpdateProductInputData(
+                product_id=10,
+                name="Product Name",
+                description="Description text here",
+                price=price,
+                stock_quantity=5,
+                category_id=1,
+                brand_id=1
+            )
+    
+    def test_update_product_with_non_numeric_price_fails(self):
+        """Test updating with a price that is not a number"""
+        # Act & Assert
+        with pytest.raises(ValueError, match="Giá sản phẩm phải là số"):
+            UpdateProductInputData(
+                product_id=10,
+                name="Product Name",
+                description="Description text here",
+                price="abc",
+                stock_quantity=5,
+                category_id=1,
+                brand_id=1
+            )
+    
+    def test_update_product_input_converts_price_to_decimal_once(self):
+        """Test the DTO normalizes float/str/Decimal prices to Decimal"""
+        def build(price):
+            return UpdateProductInputData(
+                product_id=10,
+                name="Product Name",
+                description="Description text here",
+                price=price,
+                stock_quantity=5,
+                category_id=1,
+                brand_id=1
+            )
+        
+        assert build(19.9).price == Decimal("19.9")
+        assert build("1500000").price == Decimal("1500000")
+        exact = Decimal("2500000.50")
+        assert build(exact).price is exact
+    
+    def test_update_product_input_strips_name_and_description(self):
+        """Test the DTO strips text once so validation and persistence agree"""
         input_data = UpdateProductInputData(
             product_id=10,
-            name="Product Name",
-            description="Description text here",
-            price=-1000000,
+            name="  Product Name  ",
+            description="  Description text here  ",
+            price=1000000,
             stock_quantity=5,
             category_id=1,
             brand_id=1
         )
         
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "giá" in output.message.lower()
+        assert input_data.name == "Product Name"
+        assert input_data.description == "Description text here"
+        assert not hasattr(input_data, '__dict__')
     
     # ============ VALIDATION CASES - STOCK ============
     
     def test_update_product_with_negative_stock_fails(self, use_case, product_repository):
         """Test updating with negative stock"""
-        # Arrange
-        input_data = UpdateProductInputData(
-            product_id=10,
-            name="Product Name",
-            description="Description text here",
-            price=1000000,
-            stock_quantity=-5,
-            category_id=1,
-            brand_id=1
-        )
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "tồn kho" in output.message.lower()
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)tồn kho"):
+            UpdateProductInputData(
+                product_id=10,
+                name="Product Name",
+                description="Description text here",
+                price=1000000,
+                stock_quantity=-5,
+                category_id=1,
+                brand_id=1
+            )
     
     # ============ VALIDATION CASES - CATEGORY/BRAND ============
     
     def test_update_product_with_invalid_category_id_fails(self, use_case, product_repository):
         """Test updating with invalid category ID"""
-        # Arrange
-        input_data = UpdateProductInputData(
-            product_id=10,
-            name="Product Name",
-            description="Description text here",
-            price=1000000,
-            stock_quantity=5,
-            category_id=0,
-            brand_id=1
-        )
-        
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "danh mục" in output.message.lower()
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)danh mục"):
+            UpdateProductInputData(
+                product_id=10,
+                name="Product Name",
+                description="Description text here",
+                price=1000000,
+                stock_quantity=5,
+                category_id=0,
+                brand_id=1
+            )
     
     def test_update_product_with_invalid_brand_id_fails(self, use_case, product_repository):
         """Test updating with invalid brand ID"""
-        # Arrange
-        input_data = UpdateProductInputData(
+        # Act & Assert
+        with pytest.raises(ValueError, match="(?i)thương hiệu"):
+            UpdateProductInputData(
+                product_id=10,
+                name="Product Name",
+                description="Description text here",
+                price=1000000,
+                stock_quantity=5,
+                category_id=1,
+                brand_id=0
+            )
+    
+    @pytest.mark.parametrize("field, message", [
+        ("stock_quantity", "(?i)tồn kho"),
+        ("category_id", "(?i)danh mục"),
+        ("brand_id", "(?i)thương hiệu"),
+    ])
+    def test_update_product_with_missing_int_field_fails(self, field, message):
+        """Test a missing (null) integer field raises ValueError, not TypeError"""
+        fields = dict(
             product_id=10,
             name="Product Name",
             description="Description text here",
             price=1000000,
             stock_quantity=5,
             category_id=1,
-            brand_id=0
+            brand_id=1
         )
+        fields[field] = None
         
-        # Act
-        output = use_case.execute(input_data)
-        
-        # Assert
-        assert output.success is False
-        assert "thương hiệu" in output.message.lower()
+        # Act & Assert
+        with pytest.raises(ValueError, match=message):
+            UpdateProductInputData(**fields)
     
     # ============ NOT FOUND CASES ============
     
     def test_update_nonexistent_product_fails(self, use_case, product_repository):
         """Test updating non-existent product"""
         # Arrange
-        product_repository.find_by_id.side_effect = lambda pid: None
+        product_repository.fetch_update_context.return_value = None
         
         input_data = UpdateProductInputData(
             product_id=999,
@@ -538,13 +529,12 @@ class TestUpdateProductUseCase:
         assert output.success is False
         assert "not found" in output.message.lower() or "không tìm thấy" in output.message.lower()
     
-    def test_update_product_with_nonexistent_category_fails(self, use_case, product_repository, category_repository, brand_repository):
+    def test_update_product_with_nonexistent_category_fails(self, use_case, product_repository):
         """Test updating with non-existent category"""
         # Arrange
         existing_product = self.create_mock_product(10, "Product", "Description text here", 1000000, 5, 1, 1)
         
-        product_repository.find_by_id.side_effect = lambda pid: existing_product if pid == 10 else None
-        category_repository.find_by_id.side_effect = lambda cid: None
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product, category_exists=False)
         
         input_data = UpdateProductInputData(
             product_id=10,
@@ -563,15 +553,12 @@ class TestUpdateProductUseCase:
         assert output.success is False
         assert "not found" in output.message.lower() or "không tìm thấy" in output.message.lower()
     
-    def test_update_product_with_nonexistent_brand_fails(self, use_case, product_repository, category_repository, brand_repository):
+    def test_update_product_with_nonexistent_brand_fails(self, use_case, product_repository):
         """Test updating with non-existent brand"""
         # Arrange
         existing_product = self.create_mock_product(10, "Product", "Description text here", 1000000, 5, 1, 1)
-        category = self.create_mock_category(1, "Cameras")
         
-        product_repository.find_by_id.side_effect = lambda pid: existing_product if pid == 10 else None
-        category_repository.find_by_id.side_effect = lambda cid: category if cid == 1 else None
-        brand_repository.find_by_id.side_effect = lambda bid: None
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product, brand_exists=False)
         
         input_data = UpdateProductInputData(
             product_id=10,
@@ -592,18 +579,12 @@ class TestUpdateProductUseCase:
     
     # ============ DUPLICATE CASES ============
     
-    def test_update_product_with_duplicate_name_fails(self, use_case, product_repository, category_repository, brand_repository):
+    def test_update_product_with_duplicate_name_fails(self, use_case, product_repository):
         """Test updating product with name that exists for another product"""
         # Arrange
         existing_product = self.create_mock_product(10, "Old Name", "Description text here", 1000000, 5, 1, 1)
-        other_product = self.create_mock_product(20, "Existing Name", "Other description", 2000000, 3, 1, 1)
-        category = self.create_mock_category(1, "Cameras")
-        brand = self.create_mock_brand(1, "Canon")
         
-        product_repository.find_by_id.side_effect = lambda pid: existing_product if pid == 10 else None
-        category_repository.find_by_id.side_effect = lambda cid: category if cid == 1 else None
-        brand_repository.find_by_id.side_effect = lambda bid: brand if bid == 1 else None
-        product_repository.find_by_name.side_effect = lambda name: other_product if name == "Existing Name" else None
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product, name_taken=True)
         
         input_data = UpdateProductInputData(
             product_id=10,
@@ -622,17 +603,12 @@ class TestUpdateProductUseCase:
         assert output.success is False
         assert "đã tồn tại" in output.message.lower()
     
-    def test_update_product_keep_same_name_success(self, use_case, product_repository, category_repository, brand_repository):
+    def test_update_product_keep_same_name_success(self, use_case, product_repository):
         """Test updating product keeping the same name (should succeed)"""
         # Arrange
         existing_product = self.create_mock_product(10, "Product Name", "Description text here", 1000000, 5, 1, 1)
-        category = self.create_mock_category(1, "Cameras")
-        brand = self.create_mock_brand(1, "Canon")
         
-        product_repository.find_by_id.side_effect = lambda pid: existing_product if pid == 10 else None
-        category_repository.find_by_id.side_effect = lambda cid: category if cid == 1 else None
-        brand_repository.find_by_id.side_effect = lambda bid: brand if bid == 1 else None
-        product_repository.find_by_name.side_effect = lambda name: existing_product if name == "Product Name" else None
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product)
         product_repository.save.return_value = existing_product
         
         input_data = UpdateProductInputData(
@@ -656,7 +632,7 @@ class TestUpdateProductUseCase:
     def test_repository_exception_product_find(self, use_case, product_repository):
         """Test repository exception during product find"""
         # Arrange
-        product_repository.find_by_id.side_effect = Exception("Database connection error")
+        product_repository.fetch_update_context.side_effect = Exception("Database connection error")
         
         input_data = UpdateProductInputData(
             product_id=10,
@@ -675,17 +651,12 @@ class TestUpdateProductUseCase:
         assert output.success is False
         assert "lỗi" in output.message.lower()
     
-    def test_repository_exception_product_save(self, use_case, product_repository, category_repository, brand_repository):
+    def test_repository_exception_product_save(self, use_case, product_repository):
         """Test repository exception during product save"""
         # Arrange
         existing_product = self.create_mock_product(10, "Product", "Description text here", 1000000, 5, 1, 1)
-        category = self.create_mock_category(1, "Cameras")
-        brand = self.create_mock_brand(1, "Canon")
         
-        product_repository.find_by_id.side_effect = lambda pid: existing_product if pid == 10 else None
-        category_repository.find_by_id.side_effect = lambda cid: category if cid == 1 else None
-        brand_repository.find_by_id.side_effect = lambda bid: brand if bid == 1 else None
-        product_repository.find_by_name.side_effect = lambda name: None
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product)
         product_repository.save.side_effect = Exception("Database save error")
         
         input_data = UpdateProductInputData(
@@ -707,17 +678,12 @@ class TestUpdateProductUseCase:
     
     # ============ OUTPUT STRUCTURE VALIDATION ============
     
-    def test_output_data_structure_on_success(self, use_case, product_repository, category_repository, brand_repository):
+    def test_output_data_structure_on_success(self, use_case, product_repository):
         """Test output data structure on success"""
         # Arrange
         existing_product = self.create_mock_product(10, "Product", "Description text here", 1000000, 5, 1, 1)
-        category = self.create_mock_category(1, "Cameras")
-        brand = self.create_mock_brand(1, "Canon")
         
-        product_repository.find_by_id.side_effect = lambda pid: existing_product if pid == 10 else None
-        category_repository.find_by_id.side_effect = lambda cid: category if cid == 1 else None
-        brand_repository.find_by_id.side_effect = lambda bid: brand if bid == 1 else None
-        product_repository.find_by_name.side_effect = lambda name: None
+        product_repository.fetch_update_context.return_value = ProductUpdateContext(product=existing_product)
         product_repository.save.return_value = existing_product
         
         input_data = UpdateProductInputData(
@@ -747,8 +713,9 @@ class TestUpdateProductUseCase:
     def test_output_data_structure_on_failure(self, use_case, product_repository):
         """Test output data structure on failure"""
         # Arrange
+        product_repository.fetch_update_context.return_value = None
         input_data = UpdateProductInputData(
-            product_id=0,
+            product_id=999,
             name="Product",
             description="Description",
             price=1000000,
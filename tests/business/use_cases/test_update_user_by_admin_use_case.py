@@ -15,9 +15,11 @@ Requirements from todo.txt:
 Test Coverage: 28 tests (TC4.1 - TC4.28)
 """
 import pytest
+from dataclasses import fields
 from datetime import datetime
 from unittest.mock import Mock, MagicMock
 
+from app.business.ports import UserUpdateContext
 from app.business.use_cases.update_user_by_admin_use_case import (
     UpdateUserByAdminUseCase,
     UpdateUserInputData,
@@ -28,7 +30,8 @@ from app.domain.value_objects import Email, PhoneNumber
 from app.domain.enums import UserRole
 from app.domain.exceptions import (
     UserNotFoundException,
-    UserAlreadyExistsException
+    UserAlreadyExistsException,
+    ConcurrencyConflictException
 )
 
 
@@ -154,6 +157,14 @@ class TestUpdateUserInputDataValidation:
                 email="invalid-email"
             )
     
+    def test_repeated_email_reuses_validated_value(self):
+        """Rebuilding a DTO with the same email reuses the validated Email"""
+        first = UpdateUserInputData(user_id=2, admin_user_id=1, email="repeat@example.com")
+        second = UpdateUserInputData(user_id=2, admin_user_id=1, email=" repeat@example.com ")
+        
+        assert first.email is second.email
+        assert second.email.address == "repeat@example.com"
+    
     def test_tc4_19_invalid_phone_format(self):
         """TC4.19: Invalid phone format - validation error"""
         with pytest.raises(ValueError, match="Invalid Vietnamese phone number"):
@@ -163,6 +174,15 @@ class TestUpdateUserInputDataValidation:
                 phone_number="123"  # Invalid Vietnamese format
             )
     
+    def test_input_and_output_are_slotted(self):
+        """Input/output DTOs carry no per-instance __dict__"""
+        input_data = UpdateUserInputData(user_id=2, admin_user_id=1, phone_number="")
+        output = UpdateUserOutputData(success=True, user_id=2, username="user", message="ok")
+        
+        assert not hasattr(input_data, '__dict__')
+        assert not hasattr(output, '__dict__')
+        assert input_data._phone_provided is True
+    
     def test_valid_input_all_fields(self):
         """Valid input with all fields provided"""
         input_data = UpdateUserInputData(
@@ -199,9 +219,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.1: Update user with all fields - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
-        mock_user_repository.exists_by_username.return_value = False
-        mock_user_repository.exists_by_email.return_value = False
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         # Mock save to return the user passed to it (which may be reconstructed)
         mock_user_repository.save.side_effect = lambda user: user
         
@@ -227,7 +245,7 @@ class TestUpdateUserByAdminUseCase:
         assert output.user_id == 2
         assert output.username == "newusername"
         assert "successfully" in output.message.lower()
-        assert "password_hash" not in output.__dict__
+        assert "password_hash" not in [f.name for f in fields(output)]
         mock_user_repository.save.assert_called_once()
     
     def test_tc4_2_update_only_username_success(
@@ -237,8 +255,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.2: Update only username - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
-        mock_user_repository.exists_by_username.return_value = False
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         # Mock save to return the user passed to it
         mock_user_repository.save.side_effect = lambda user: user
         
@@ -265,8 +282,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.3: Update only email - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
-        mock_user_repository.exists_by_email.return_value = False
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         mock_user_repository.save.return_value = sample_target_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -290,7 +306,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.4: Update only full_name - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         mock_user_repository.save.return_value = sample_target_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -315,7 +331,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.5: Update only phone_number - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         mock_user_repository.save.return_value = sample_target_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -340,7 +356,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.6: Update only address - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         mock_user_repository.save.return_value = sample_target_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -365,7 +381,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.7: Update role (CUSTOMER → ADMIN) - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         mock_user_repository.save.return_value = sample_target_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -390,7 +406,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.8: Update role (ADMIN → CUSTOMER) - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = another_admin_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=another_admin_user)
         mock_user_repository.save.return_value = another_admin_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -415,7 +431,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.9: Update is_active (true → false) - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         mock_user_repository.save.return_value = sample_target_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -441,7 +457,7 @@ class TestUpdateUserByAdminUseCase:
         """TC4.10: Update is_active (false → true) - success"""
         # Arrange
         sample_target_user.deactivate()  # Start with inactive user
-        mock_user_repository.find_by_id.return_value = sample_target_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         mock_user_repository.save.return_value = sample_target_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -459,12 +475,81 @@ class TestUpdateUserByAdminUseCase:
         assert output.success is True
         assert sample_target_user.is_active is True
     
+    def test_update_loads_user_and_conflicts_in_one_call(
+        self,
+        mock_user_repository,
+        sample_target_user
+    ):
+        """User and username/email conflicts come from one repository call"""
+        # Arrange
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
+        mock_user_repository.save.side_effect = lambda user: user
+        
+        use_case = UpdateUserByAdminUseCase(mock_user_repository)
+        
+        input_data = UpdateUserInputData(
+            user_id=2,
+            admin_user_id=1,
+            username="newusername",
+            email="new@example.com"
+        )
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is True
+        mock_user_repository.fetch_for_update.assert_called_once_with(
+            2,
+            candidate_username="newusername",
+            candidate_email=input_data.email
+        )
+        mock_user_repository.find_by_id.assert_not_called()
+        mock_user_repository.exists_by_username.assert_not_called()
+        mock_user_repository.exists_by_email.assert_not_called()
+    
+    def test_update_without_fields_skips_save(self, mock_user_repository, sample_target_user):
+        """A payload with no updatable fields only checks that the user exists"""
+        # Arrange
+        use_case = UpdateUserByAdminUseCase(mock_user_repository)
+        mock_user_repository.find_by_id.return_value = sample_target_user
+        
+        input_data = UpdateUserInputData(user_id=2, admin_user_id=1)
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is True
+        assert output.user_id == 2
+        assert output.username == "customer1"
+        mock_user_repository.find_by_id.assert_called_once_with(2)
+        mock_user_repository.fetch_for_update.assert_not_called()
+        mock_user_repository.save.assert_not_called()
+    
+    def test_update_without_fields_unknown_user_fails(self, mock_user_repository):
+        """A payload with no updatable fields still reports an unknown user ID"""
+        # Arrange
+        use_case = UpdateUserByAdminUseCase(mock_user_repository)
+        mock_user_repository.find_by_id.return_value = None
+        
+        input_data = UpdateUserInputData(user_id=999, admin_user_id=1)
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is False
+        assert output.user_id is None
+        assert "not found" in output.message.lower()
+        mock_user_repository.save.assert_not_called()
+    
     # ========== ERROR CASES (TC4.11 - TC4.28) ==========
     
     def test_tc4_11_user_not_found_error(self, mock_user_repository):
         """TC4.11: User ID not found - error"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = None
+        mock_user_repository.fetch_for_update.return_value = None
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
         
@@ -488,8 +573,10 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.13: Username already taken by another user - error"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
-        mock_user_repository.exists_by_username.return_value = True
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(
+            user=sample_target_user,
+            username_taken=True
+        )
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
         
@@ -513,8 +600,10 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.14: Email already taken by another user - error"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
-        mock_user_repository.exists_by_email.return_value = True
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(
+            user=sample_target_user,
+            email_taken=True
+        )
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
         
@@ -538,7 +627,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.15: Username same as current (no uniqueness check needed) - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         mock_user_repository.save.return_value = sample_target_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -554,7 +643,6 @@ class TestUpdateUserByAdminUseCase:
         
         # Assert
         assert output.success is True
-        # exists_by_username should NOT be called if username unchanged
     
     def test_tc4_16_email_same_as_current_success(
         self,
@@ -563,7 +651,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.16: Email same as current (no uniqueness check needed) - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         mock_user_repository.save.return_value = sample_target_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -587,7 +675,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.20: Admin tries to deactivate self - error"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_admin_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_admin_user)
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
         
@@ -611,7 +699,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.21: Admin tries to demote self - error"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_admin_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_admin_user)
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
         
@@ -635,7 +723,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.22: Admin updates another admin - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = another_admin_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=another_admin_user)
         mock_user_repository.save.return_value = another_admin_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -659,7 +747,7 @@ class TestUpdateUserByAdminUseCase:
     ):
         """TC4.23: Admin updates customer - success"""
         # Arrange
-        mock_user_repository.find_by_id.return_value = sample_target_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         mock_user_repository.save.return_value = sample_target_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -696,7 +784,7 @@ class TestUpdateUserByAdminUseCase:
             is_active=sample_target_user.is_active,
             created_at=sample_target_user.created_at
         )
-        mock_user_repository.find_by_id.return_value = user_copy
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=user_copy)
         # Mock save to return the user passed to it (reconstructed with None phone)
         mock_user_repository.save.side_effect = lambda user: user
         
@@ -736,7 +824,7 @@ class TestUpdateUserByAdminUseCase:
             is_active=sample_target_user.is_active,
             created_at=sample_target_user.created_at
         )
-        mock_user_repository.find_by_id.return_value = user_copy
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=user_copy)
         # Mock save to return the user passed to it
         mock_user_repository.save.side_effect = lambda user: user
         
@@ -764,7 +852,7 @@ class TestUpdateUserByAdminUseCase:
         """TC4.28: Verify password_hash never updated via this use case"""
         # Arrange
         original_password_hash = sample_target_user.password_hash
-        mock_user_repository.find_by_id.return_value = sample_target_user
+        mock_user_repository.fetch_for_update.return_value = UserUpdateContext(user=sample_target_user)
         mock_user_repository.save.return_value = sample_target_user
         
         use_case = UpdateUserByAdminUseCase(mock_user_repository)
@@ -781,4 +869,86 @@ class TestUpdateUserByAdminUseCase:
         # Assert
         assert output.success is True
         assert sample_target_user.password_hash == original_password_hash
-        assert "password_hash" not in output.__dict__
+        assert "password_hash" not in [f.name for f in fields(output)]
+    
+    # ========== OPTIMISTIC CONCURRENCY ==========
+    
+    def _fresh_target_user(self, user_id, version=1):
+        """Re-read of the target user, as the repository returns on every fetch"""
+        return User.reconstruct(
+            user_id=user_id,
+            username="customer1",
+            email=Email("customer1@example.com"),
+            password_hash="hashed_password",
+            full_name="John Doe",
+            phone_number=None,
+            address=None,
+            role=UserRole.CUSTOMER,
+            is_active=True,
+            created_at=datetime(2024, 1, 1),
+            version=version
+        )
+    
+    def test_version_conflict_rereads_and_retries(self, mock_user_repository):
+        """A stale save is retried against a fresh read of the user"""
+        # Arrange
+        versions = iter([1, 2])
+        mock_user_repository.fetch_for_update.side_effect = (
+            lambda user_id, **candidates: UserUpdateContext(
+                user=self._fresh_target_user(user_id, next(versions))
+            )
+        )
+        saved_versions = []
+        def save(user):
+            saved_versions.append(user.version)
+            if len(saved_versions) == 1:
+                raise ConcurrencyConflictException('User', 2)
+            return user
+        mock_user_repository.save.side_effect = save
+        
+        use_case = UpdateUserByAdminUseCase(mock_user_repository)
+        
+        input_data = UpdateUserInputData(user_id=2, admin_user_id=1, full_name="New Name")
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is True
+        assert saved_versions == [1, 2]
+        assert mock_user_repository.fetch_for_update.call_count == 2
+        saved_user = mock_user_repository.save.call_args[0][0]
+        assert saved_user.full_name == "New Name"
+    
+    def test_version_conflict_gives_up_after_max_attempts(self, mock_user_repository):
+        """Persistent conflicts fail the update instead of retrying forever"""
+        # Arrange
+        mock_user_repository.fetch_for_update.side_effect = (
+            lambda user_id, **candidates: UserUpdateContext(user=self._fresh_target_user(user_id))
+        )
+        mock_user_repository.save.side_effect = ConcurrencyConflictException('User', 2)
+        
+        use_case = UpdateUserByAdminUseCase(mock_user_repository)
+        
+        input_data = UpdateUserInputData(user_id=2, admin_user_id=1, full_name="New Name")
+        
+        # Act
+        output = use_case.execute(input_data)
+        
+        # Assert
+        assert output.success is False
+        assert "modified by another request" in output.message
+        assert mock_user_repository.save.call_count == UpdateUserByAdminUseCase.MAX_SAVE_ATTEMPTS
+    
+    def test_unexpected_repository_error_propagates(self, mock_user_repository):
+        """Unexpected repository errors are left to the adapter layer"""
+        # Arrange
+        mock_user_repository.fetch_for_update.side_effect = Exception("Database connection error")
+        
+        use_case = UpdateUserByAdminUseCase(mock_user_repository)
+        
+        input_data = UpdateUserInputData(user_id=2, admin_user_id=1, full_name="New Name")
+        
+        # Act & Assert
+        with pytest.raises(Exception, match="Database connection error"):
+            use_case.execute(input_data)
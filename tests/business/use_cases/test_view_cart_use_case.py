@@ -7,12 +7,12 @@ import pytest
 from unittest.mock import Mock
 from decimal import Decimal
 
+from app.business.ports.cart_repository import CartLineView, CartView
 from app.business.use_cases.view_cart_use_case import (
     ViewCartUseCase,
     ViewCartOutputData,
     CartItemOutputData
 )
-from app.domain.exceptions import ValidationException
 from app.domain.value_objects.money import Money
 
 
@@ -25,52 +25,39 @@ class TestViewCartUseCase:
         return Mock()
     
     @pytest.fixture
-    def product_repository(self):
-        """Mock product repository"""
-        return Mock()
-    
-    @pytest.fixture
-    def use_case(self, cart_repository, product_repository):
+    def use_case(self, cart_repository):
         """Khởi tạo use case"""
-        return ViewCartUseCase(cart_repository, product_repository)
-    
-    def create_mock_product(self, product_id, name, price, stock=10, is_visible=True, image_url=None):
-        """Helper tạo mock product"""
-        product = Mock()
-        product.id = product_id
-        product.product_id = product_id
-        product.name = name
-        product.price = Money(Decimal(str(price)))  # Use Money value object
-        product.stock_quantity = stock
-        product.is_visible = is_visible
-        product.image_url = image_url
-        return product
-    
-    def create_mock_cart_item(self, cart_item_id, cart_id, product_id, quantity):
-        """Helper tạo mock cart item"""
-        item = Mock()
-        item.cart_item_id = cart_item_id
-        item.cart_id = cart_id
-        item.product_id = product_id
-        item.quantity = quantity
-        return item
-    
-    def create_mock_cart(self, cart_id, user_id, items=None):
-        """Helper tạo mock cart"""
-        cart = Mock()
-        cart.id = cart_id  # Cart entity uses .id
-        cart.cart_id = cart_id
-        cart.user_id = user_id
-        cart.items = items or []
-        return cart
+        return ViewCartUseCase(cart_repository)
+    
+    def create_line(self, cart_item_id, product_id, name, price, quantity,
+                    stock=10, is_visible=True, image_url=None):
+        """Helper tạo một dòng giỏ hàng của read model"""
+        return CartLineView(
+            cart_item_id=cart_item_id,
+            quantity=quantity,
+            product_id=product_id,
+            product_name=name,
+            product_image=image_url,
+            price=Money(Decimal(str(price))),
+            stock_quantity=stock,
+            is_visible=is_visible
+        )
+    
+    def create_cart_view(self, lines, cart_id=1, item_count=None):
+        """Helper tạo read model giỏ hàng; item_count mặc định bằng số dòng"""
+        return CartView(
+            cart_id=cart_id,
+            item_count=len(lines) if item_count is None else item_count,
+            lines=tuple(lines)
+        )
     
     # ============ EMPTY CART ============
     
-    def test_view_empty_cart_no_cart_exists(self, use_case, cart_repository, product_repository):
+    def test_view_empty_cart_no_cart_exists(self, use_case, cart_repository):
         """Test 1: Xem giỏ hàng khi chưa có cart"""
         # Arrange
         user_id = 1
-        cart_repository.find_by_user_id.return_value = None
+        cart_repository.find_cart_view.return_value = None
         
         # Act
         output = use_case.execute(user_id)
@@ -86,12 +73,11 @@ class TestViewCartUseCase:
         assert output.total == Decimal('0.00')
         assert output.error_message == ""
     
-    def test_view_empty_cart_cart_exists_no_items(self, use_case, cart_repository, product_repository):
+    def test_view_empty_cart_cart_exists_no_items(self, use_case, cart_repository):
         """Test 2: Xem giỏ hàng có cart nhưng không có items"""
         # Arrange
         user_id = 1
-        empty_cart = self.create_mock_cart(1, user_id, items=[])
-        cart_repository.find_by_user_id.return_value = empty_cart
+        cart_repository.find_cart_view.return_value = self.create_cart_view([])
         
         # Act
         output = use_case.execute(user_id)
@@ -105,16 +91,13 @@ class TestViewCartUseCase:
     
     # ============ CART WITH SINGLE ITEM ============
     
-    def test_view_cart_with_single_item(self, use_case, cart_repository, product_repository):
+    def test_view_cart_with_single_item(self, use_case, cart_repository):
         """Test 3: Xem giỏ có 1 sản phẩm"""
         # Arrange
         user_id = 1
-        cart_item = self.create_mock_cart_item(1, 1, 10, 2)
-        cart = self.create_mock_cart(1, user_id, [cart_item])
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Camera", 10000000, stock=20, image_url="/img/camera.jpg")
-        product_repository.find_by_id.return_value = product
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Camera", 10000000, 2, stock=20, image_url="/img/camera.jpg")
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -146,25 +129,15 @@ class TestViewCartUseCase:
     
     # ============ CART WITH MULTIPLE ITEMS ============
     
-    def test_view_cart_with_multiple_items(self, use_case, cart_repository, product_repository):
+    def test_view_cart_with_multiple_items(self, use_case, cart_repository):
         """Test 4: Xem giỏ có nhiều sản phẩm"""
         # Arrange
         user_id = 1
-        cart_item1 = self.create_mock_cart_item(1, 1, 10, 2)
-        cart_item2 = self.create_mock_cart_item(2, 1, 20, 1)
-        cart_item3 = self.create_mock_cart_item(3, 1, 30, 3)
-        cart = self.create_mock_cart(1, user_id, [cart_item1, cart_item2, cart_item3])
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product1 = self.create_mock_product(10, "Camera", 5000000, stock=10)
-        product2 = self.create_mock_product(20, "Lens", 3000000, stock=5)
-        product3 = self.create_mock_product(30, "Tripod", 500000, stock=20)
-        
-        def mock_find_by_id(product_id):
-            products = {10: product1, 20: product2, 30: product3}
-            return products.get(product_id)
-        
-        product_repository.find_by_id.side_effect = mock_find_by_id
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Camera", 5000000, 2, stock=10),
+            self.create_line(2, 20, "Lens", 3000000, 1, stock=5),
+            self.create_line(3, 30, "Tripod", 500000, 3, stock=20)
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -183,18 +156,34 @@ class TestViewCartUseCase:
         # Total = 14.5M + 1.45M = 15,950,000
         assert output.total == Decimal('15950000.00')
     
+    def test_view_cart_uses_single_read_model_query(self, use_case, cart_repository):
+        """Test 4b: Giỏ hàng và sản phẩm được tải bằng một truy vấn"""
+        # Arrange
+        user_id = 1
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Camera", 5000000, 2),
+            self.create_line(2, 20, "Lens", 3000000, 1)
+        ])
+        
+        # Act
+        output = use_case.execute(user_id)
+        
+        # Assert
+        assert output.success is True
+        assert [item.product_name for item in output.items] == ["Camera", "Lens"]
+        assert output.subtotal == Decimal('13000000')
+        cart_repository.find_cart_view.assert_called_once_with(user_id)
+        assert [call[0] for call in cart_repository.method_calls] == ['find_cart_view']
+    
     # ============ PRODUCT AVAILABILITY ============
     
-    def test_view_cart_item_out_of_stock(self, use_case, cart_repository, product_repository):
+    def test_view_cart_item_out_of_stock(self, use_case, cart_repository):
         """Test 5: Item trong giỏ hết hàng"""
         # Arrange
         user_id = 1
-        cart_item = self.create_mock_cart_item(1, 1, 10, 5)
-        cart = self.create_mock_cart(1, user_id, [cart_item])
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Out of Stock Product", 1000000, stock=0)
-        product_repository.find_by_id.return_value = product
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Out of Stock Product", 1000000, 5, stock=0)
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -205,16 +194,13 @@ class TestViewCartUseCase:
         assert item.stock_available == 0
         assert item.is_available is False  # Not available because stock < quantity
     
-    def test_view_cart_item_insufficient_stock(self, use_case, cart_repository, product_repository):
+    def test_view_cart_item_insufficient_stock(self, use_case, cart_repository):
         """Test 6: Stock không đủ cho quantity trong giỏ"""
         # Arrange
         user_id = 1
-        cart_item = self.create_mock_cart_item(1, 1, 10, 10)
-        cart = self.create_mock_cart(1, user_id, [cart_item])
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Low Stock Product", 1000000, stock=5)
-        product_repository.find_by_id.return_value = product
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Low Stock Product", 1000000, 10, stock=5)
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -224,16 +210,13 @@ class TestViewCartUseCase:
         assert item.stock_available == 5
         assert item.is_available is False  # Not available: stock (5) < quantity (10)
     
-    def test_view_cart_item_exact_stock(self, use_case, cart_repository, product_repository):
+    def test_view_cart_item_exact_stock(self, use_case, cart_repository):
         """Test 7: Stock đúng bằng quantity trong giỏ"""
         # Arrange
         user_id = 1
-        cart_item = self.create_mock_cart_item(1, 1, 10, 8)
-        cart = self.create_mock_cart(1, user_id, [cart_item])
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Exact Stock Product", 1000000, stock=8)
-        product_repository.find_by_id.return_value = product
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Exact Stock Product", 1000000, 8, stock=8)
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -243,16 +226,13 @@ class TestViewCartUseCase:
         assert item.stock_available == 8
         assert item.is_available is True  # Available: stock (8) >= quantity (8)
     
-    def test_view_cart_item_hidden_product(self, use_case, cart_repository, product_repository):
+    def test_view_cart_item_hidden_product(self, use_case, cart_repository):
         """Test 8: Sản phẩm trong giỏ bị ẩn"""
         # Arrange
         user_id = 1
-        cart_item = self.create_mock_cart_item(1, 1, 10, 2)
-        cart = self.create_mock_cart(1, user_id, [cart_item])
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Hidden Product", 1000000, stock=20, is_visible=False)
-        product_repository.find_by_id.return_value = product
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Hidden Product", 1000000, 2, stock=20, is_visible=False)
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -261,25 +241,15 @@ class TestViewCartUseCase:
         item = output.items[0]
         assert item.is_available is False  # Not available because product is hidden
     
-    def test_view_cart_with_mixed_availability(self, use_case, cart_repository, product_repository):
+    def test_view_cart_with_mixed_availability(self, use_case, cart_repository):
         """Test 9: Giỏ có cả items available và unavailable"""
         # Arrange
         user_id = 1
-        cart_item1 = self.create_mock_cart_item(1, 1, 10, 2)  # Available
-        cart_item2 = self.create_mock_cart_item(2, 1, 20, 5)  # Out of stock
-        cart_item3 = self.create_mock_cart_item(3, 1, 30, 3)  # Hidden
-        cart = self.create_mock_cart(1, user_id, [cart_item1, cart_item2, cart_item3])
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product1 = self.create_mock_product(10, "Available", 1000000, stock=20, is_visible=True)
-        product2 = self.create_mock_product(20, "Out of Stock", 2000000, stock=0, is_visible=True)
-        product3 = self.create_mock_product(30, "Hidden", 500000, stock=10, is_visible=False)
-        
-        def mock_find_by_id(product_id):
-            products = {10: product1, 20: product2, 30: product3}
-            return products.get(product_id)
-        
-        product_repository.find_by_id.side_effect = mock_find_by_id
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Available", 1000000, 2, stock=20),
+            self.create_line(2, 20, "Out of Stock", 2000000, 5, stock=0),
+            self.create_line(3, 30, "Hidden", 500000, 3, stock=10, is_visible=False)
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -292,17 +262,14 @@ class TestViewCartUseCase:
     
     # ============ SHIPPING CALCULATION ============
     
-    def test_view_cart_with_free_shipping(self, use_case, cart_repository, product_repository):
+    def test_view_cart_with_free_shipping(self, use_case, cart_repository):
         """Test 10: Miễn phí ship khi subtotal >= 500"""
         # Arrange
         user_id = 1
-        cart_item = self.create_mock_cart_item(1, 1, 10, 1)
-        cart = self.create_mock_cart(1, user_id, [cart_item])
-        cart_repository.find_by_user_id.return_value = cart
-        
         # Product price = 600 (>= 500 for free shipping)
-        product = self.create_mock_product(10, "Expensive Camera", 600, stock=10)
-        product_repository.find_by_id.return_value = product
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Expensive Camera", 600, 1)
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -313,17 +280,14 @@ class TestViewCartUseCase:
         assert output.tax == Decimal('60.00')  # 10% of 600
         assert output.total == Decimal('660.00')  # 600 + 60 + 0
     
-    def test_view_cart_with_standard_shipping(self, use_case, cart_repository, product_repository):
+    def test_view_cart_with_standard_shipping(self, use_case, cart_repository):
         """Test 11: Ship phí 20 khi subtotal < 500"""
         # Arrange
         user_id = 1
-        cart_item = self.create_mock_cart_item(1, 1, 10, 1)
-        cart = self.create_mock_cart(1, user_id, [cart_item])
-        cart_repository.find_by_user_id.return_value = cart
-        
         # Product price = 400 (< 500, standard shipping applies)
-        product = self.create_mock_product(10, "Cheap Lens", 400, stock=10)
-        product_repository.find_by_id.return_value = product
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Cheap Lens", 400, 1)
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -334,17 +298,14 @@ class TestViewCartUseCase:
         assert output.tax == Decimal('40.00')  # 10% of 400
         assert output.total == Decimal('460.00')  # 400 + 40 + 20
     
-    def test_view_cart_at_free_shipping_threshold(self, use_case, cart_repository, product_repository):
+    def test_view_cart_at_free_shipping_threshold(self, use_case, cart_repository):
         """Test 12: Subtotal đúng bằng threshold (500)"""
         # Arrange
         user_id = 1
-        cart_item = self.create_mock_cart_item(1, 1, 10, 1)
-        cart = self.create_mock_cart(1, user_id, [cart_item])
-        cart_repository.find_by_user_id.return_value = cart
-        
         # Product price = exactly 500
-        product = self.create_mock_product(10, "Product", 500, stock=10)
-        product_repository.find_by_id.return_value = product
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Product", 500, 1)
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -355,16 +316,13 @@ class TestViewCartUseCase:
     
     # ============ TAX CALCULATION ============
     
-    def test_view_cart_tax_calculation_10_percent(self, use_case, cart_repository, product_repository):
+    def test_view_cart_tax_calculation_10_percent(self, use_case, cart_repository):
         """Test 13: Thuế 10% được tính chính xác"""
         # Arrange
         user_id = 1
-        cart_item = self.create_mock_cart_item(1, 1, 10, 1)
-        cart = self.create_mock_cart(1, user_id, [cart_item])
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Product", 1000, stock=10)
-        product_repository.find_by_id.return_value = product
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Product", 1000, 1)
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -373,17 +331,14 @@ class TestViewCartUseCase:
         assert output.subtotal == Decimal('1000')
         assert output.tax == Decimal('100.00')  # Exactly 10%
     
-    def test_view_cart_tax_rounding(self, use_case, cart_repository, product_repository):
+    def test_view_cart_tax_rounding(self, use_case, cart_repository):
         """Test 14: Thuế được làm tròn 2 chữ số thập phân"""
         # Arrange
         user_id = 1
-        cart_item = self.create_mock_cart_item(1, 1, 10, 3)
-        cart = self.create_mock_cart(1, user_id, [cart_item])
-        cart_repository.find_by_user_id.return_value = cart
-        
         # 333 * 3 = 999, tax = 99.9 rounded to 99.90
-        product = self.create_mock_product(10, "Product", 333, stock=10)
-        product_repository.find_by_id.return_value = product
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Product", 333, 3)
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -392,18 +347,35 @@ class TestViewCartUseCase:
         assert output.subtotal == Decimal('999')
         assert output.tax == Decimal('99.90')  # Rounded to 2 decimal places
     
+    @pytest.mark.parametrize("price, expected_tax", [
+        ("0.05", Decimal('0.00')),  # 0.005 rounds half to even: down
+        ("0.15", Decimal('0.02')),  # 0.015 rounds half to even: up
+        ("0.17", Decimal('0.02'))
+    ])
+    def test_view_cart_tax_rounds_half_to_even(self, use_case, cart_repository, price, expected_tax):
+        """Test 14b: Thuế tính bằng số nguyên (xu) làm tròn giống Decimal.quantize"""
+        # Arrange
+        user_id = 1
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Product", price, 1)
+        ])
+        
+        # Act
+        output = use_case.execute(user_id)
+        
+        # Assert
+        assert output.subtotal == Decimal(price)
+        assert output.tax == expected_tax
+        assert output.total == Decimal(price) + expected_tax + Decimal('20.00')
+    
     # ============ PRODUCT NOT FOUND ============
     
-    def test_view_cart_with_deleted_product(self, use_case, cart_repository, product_repository):
+    def test_view_cart_with_deleted_product(self, use_case, cart_repository):
         """Test 15: Sản phẩm trong giỏ đã bị xóa"""
         # Arrange
         user_id = 1
-        cart_item = self.create_mock_cart_item(1, 1, 999, 2)
-        cart = self.create_mock_cart(1, user_id, [cart_item])
-        cart_repository.find_by_user_id.return_value = cart
-        
-        # Product not found
-        product_repository.find_by_id.return_value = None
+        # The cart still counts the item, but the join yields no line for it
+        cart_repository.find_cart_view.return_value = self.create_cart_view([], item_count=1)
         
         # Act
         output = use_case.execute(user_id)
@@ -413,10 +385,12 @@ class TestViewCartUseCase:
         assert len(output.items) == 0  # Item not included in output
         assert output.total_items == 0
         assert output.subtotal == Decimal('0.00')
+        assert output.tax == Decimal('0.00')
+        assert output.shipping == Decimal('20.00')
     
     # ============ INPUT VALIDATION ============
     
-    def test_view_cart_with_zero_user_id_fails(self, use_case, cart_repository, product_repository):
+    def test_view_cart_with_zero_user_id_fails(self, use_case, cart_repository):
         """Test 16: User ID = 0"""
         # Arrange
         user_id = 0
@@ -427,9 +401,9 @@ class TestViewCartUseCase:
         # Assert
         assert output.success is False
         assert "Invalid user ID" in output.error_message
-        cart_repository.find_by_user_id.assert_not_called()
+        cart_repository.find_cart_view.assert_not_called()
     
-    def test_view_cart_with_negative_user_id_fails(self, use_case, cart_repository, product_repository):
+    def test_view_cart_with_negative_user_id_fails(self, use_case, cart_repository):
         """Test 17: User ID âm"""
         # Arrange
         user_id = -1
@@ -443,31 +417,25 @@ class TestViewCartUseCase:
     
     # ============ REPOSITORY EXCEPTIONS ============
     
-    def test_view_cart_repository_exception_handled(self, use_case, cart_repository, product_repository):
-        """Test 18: Lỗi từ repository được xử lý"""
+    def test_view_cart_repository_exception_propagates(self, use_case, cart_repository):
+        """Test 18: Lỗi bất ngờ từ repository được để lại cho tầng adapter"""
         # Arrange
         user_id = 1
-        cart_repository.find_by_user_id.side_effect = Exception("Database connection error")
+        cart_repository.find_cart_view.side_effect = Exception("Database connection error")
         
-        # Act
-        output = use_case.execute(user_id)
-        
-        # Assert
-        assert output.success is False
-        assert "An error occurred while viewing cart" in output.error_message
+        # Act & Assert
+        with pytest.raises(Exception, match="Database connection error"):
+            use_case.execute(user_id)
     
     # ============ OUTPUT DATA STRUCTURE ============
     
-    def test_output_data_structure_complete(self, use_case, cart_repository, product_repository):
+    def test_output_data_structure_complete(self, use_case, cart_repository):
         """Test 19: Cấu trúc output data đầy đủ"""
         # Arrange
         user_id = 1
-        cart_item = self.create_mock_cart_item(1, 1, 10, 2)
-        cart = self.create_mock_cart(1, user_id, [cart_item])
-        cart_repository.find_by_user_id.return_value = cart
-        
-        product = self.create_mock_product(10, "Product", 1000000, stock=10)
-        product_repository.find_by_id.return_value = product
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Product", 1000000, 2)
+        ])
         
         # Act
         output = use_case.execute(user_id)
@@ -485,7 +453,7 @@ class TestViewCartUseCase:
         assert hasattr(output, 'error_message')
         
         # Verify item structure
-        assert isinstance(output.items, list)
+        assert isinstance(output.items, tuple)
         if output.items:
             item = output.items[0]
             assert isinstance(item, CartItemOutputData)
@@ -499,3 +467,21 @@ class TestViewCartUseCase:
             assert hasattr(item, 'subtotal')
             assert hasattr(item, 'stock_available')
             assert hasattr(item, 'is_available')
+    
+    def test_output_data_is_frozen_and_hashable(self, use_case, cart_repository):
+        """Test 20: Output data bất biến và hash được để có thể cache"""
+        # Arrange
+        user_id = 1
+        cart_repository.find_cart_view.return_value = self.create_cart_view([
+            self.create_line(1, 10, "Camera", 1000, 2)
+        ])
+        
+        # Act
+        first = use_case.execute(user_id)
+        second = use_case.execute(user_id)
+        
+        # Assert
+        assert hash(first) == hash(second)
+        assert not hasattr(first, '__dict__')
+        with pytest.raises(AttributeError):
+            first.total = Decimal('0.00')
@@ -56,6 +56,11 @@ class TestBrandCreation:
         """Should raise error for empty name"""
         with pytest.raises(ValueError, match="Brand name must be at least 2 characters"):
             Brand(name="")
+    
+    def test_create_brand_invalid_name_only_padding(self):
+        """Should measure the name after stripping whitespace"""
+        with pytest.raises(ValueError, match="Brand name must be at least 2 characters"):
+            Brand(name="  A  ")
 
 
 class TestBrandReconstruction:
@@ -78,6 +83,27 @@ class TestBrandReconstruction:
         assert brand.name == "Canon"
         assert brand.is_active is False
         assert brand.created_at == created_at
+    
+    def test_reconstruct_many_brands(self):
+        """Should reconstruct brands from row tuples in order"""
+        created_at = datetime(2023, 1, 1, 12, 0, 0)
+        
+        brands = Brand.reconstruct_many([
+            (1, "Canon", None, None, True, created_at),
+            (2, "Nikon", "Japanese maker", "https://example.com/nikon.png", False, created_at)
+        ])
+        
+        assert [brand.id for brand in brands] == [1, 2]
+        assert brands[1].name == "Nikon"
+        assert brands[1].logo_url == "https://example.com/nikon.png"
+        assert brands[1].is_active is False
+        assert brands[0].created_at == created_at
+    
+    def test_reconstructed_brand_is_slotted(self):
+        """Should carry no per-instance __dict__"""
+        brand = Brand.reconstruct(1, "Canon", None, None, True, datetime(2023, 1, 1))
+        
+        assert not hasattr(brand, '__dict__')
 
 
 class TestBrandBehavior:
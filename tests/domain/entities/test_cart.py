@@ -135,6 +135,13 @@ class TestCartReconstruction:
         assert len(cart.items) == 2
         assert cart.created_at == created_at
         assert cart.updated_at == updated_at
+    
+    def test_cart_and_items_are_slotted(self):
+        """Should carry no per-instance __dict__ on the cart or its items"""
+        cart = Cart.reconstruct(5, 1, [CartItem(1, 2)], datetime(2023, 1, 1), datetime(2023, 1, 1))
+        
+        assert not hasattr(cart, '__dict__')
+        assert not hasattr(cart.items[0], '__dict__')
 
 
 class TestCartBehavior:
@@ -157,6 +164,17 @@ class TestCartBehavior:
         
         assert len(cart.items) == 2
     
+    def test_items_view_reflects_cart_without_copying(self):
+        """Should expose a live view of items that tracks later changes"""
+        cart = Cart(customer_id=1)
+        cart.add_item(product_id=1, quantity=2)
+        view = cart.items_view
+        
+        cart.add_item(product_id=2, quantity=3)
+        
+        assert [item.product_id for item in view] == [1, 2]
+        assert not isinstance(view, list)
+    
     def test_add_existing_item_increases_quantity(self):
         """Should increase quantity when adding existing item"""
         cart = Cart(customer_id=1)
@@ -259,6 +277,44 @@ class TestCartBehavior:
         
         assert cart.get_total_quantity() == 5
     
+    def test_total_quantity_tracks_every_change(self):
+        """Should keep the total in step with adds, updates, removals and item edits"""
+        item = CartItem(product_id=1, quantity=2)
+        cart = Cart.reconstruct(1, 1, [item], datetime.now(), datetime.now())
+        assert cart.get_total_quantity() == 2
+        
+        cart.add_item(product_id=1, quantity=3)
+        cart.add_item(product_id=2, quantity=4)
+        assert cart.get_total_quantity() == 9
+        
+        cart.update_item_quantity(product_id=2, new_quantity=1)
+        item.decrease_quantity(4)
+        assert cart.get_total_quantity() == 2
+        
+        cart.remove_item(product_id=2)
+        assert cart.get_total_quantity() == 1
+        
+        cart.clear()
+        item.increase_quantity(5)
+        assert cart.get_total_quantity() == 0
+    
+    def test_mutations_stamp_updated_at_once_on_touch(self):
+        """Should stamp updated_at once in touch_updated_at, not on every mutation or read"""
+        stamped_at = datetime(2023, 1, 2, 12, 0, 0)
+        cart = Cart.reconstruct(1, 1, [], datetime(2023, 1, 1), stamped_at)
+        
+        cart.add_item(product_id=1, quantity=2)
+        cart.add_item(product_id=2, quantity=1)
+        cart.remove_item(product_id=2)
+        assert cart.updated_at == stamped_at
+        
+        cart.touch_updated_at()
+        restamped_at = cart.updated_at
+        assert restamped_at > stamped_at
+        
+        cart.touch_updated_at()
+        assert cart.updated_at == restamped_at
+    
     def test_has_item(self):
         """Should check if cart has specific item"""
         cart = Cart(customer_id=1)
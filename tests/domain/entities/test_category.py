@@ -71,6 +71,25 @@ class TestCategoryReconstruction:
         assert category.id == 1
         assert category.name == "DSLR Cameras"
         assert category.created_at == created_at
+    
+    def test_reconstruct_many_categories(self):
+        """Should reconstruct categories from row tuples in order"""
+        created_at = datetime(2023, 1, 1, 12, 0, 0)
+        
+        categories = Category.reconstruct_many([
+            (1, "DSLR Cameras", None, created_at),
+            (2, "Lenses", "Interchangeable lenses", created_at)
+        ])
+        
+        assert [category.id for category in categories] == [1, 2]
+        assert categories[1].description == "Interchangeable lenses"
+        assert categories[0].created_at == created_at
+    
+    def test_reconstructed_category_is_slotted(self):
+        """Should carry no per-instance __dict__"""
+        category = Category.reconstruct(1, "DSLR Cameras", None, datetime(2023, 1, 1))
+        
+        assert not hasattr(category, '__dict__')
 
 
 class TestCategoryBehavior:
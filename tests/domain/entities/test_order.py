@@ -138,6 +138,54 @@ class TestOrderCreation:
         assert order.total_amount.amount == Decimal("3500000")
         assert order.id is None
     
+    def test_order_items_are_isolated_from_input_list(self):
+        """Should keep its items when the caller's list changes later"""
+        items = [OrderItem(1, "Canon EOS 90D", 2, Money(Decimal("1000000")))]
+        
+        order = Order(
+            customer_id=1,
+            items=items,
+            payment_method=PaymentMethod.COD,
+            shipping_address="123 Test Street, City",
+            phone_number="0123456789"
+        )
+        items.append(OrderItem(2, "Nikon D850", 1, Money(Decimal("1500000"))))
+        
+        assert isinstance(order.items, tuple)
+        assert len(order.items) == 1
+        assert order.items is order.items
+    
+    def test_new_order_timestamps_match(self):
+        """Should stamp created_at and updated_at with the same time"""
+        order = Order(
+            customer_id=1,
+            items=[OrderItem(1, "Canon EOS 90D", 1, Money(Decimal("1000000")))],
+            payment_method=PaymentMethod.COD,
+            shipping_address="123 Test Street, City",
+            phone_number="0123456789"
+        )
+        
+        assert order.created_at == order.updated_at
+    
+    def test_calculate_totals_bulk(self):
+        """Should sum the totals of several orders exactly"""
+        orders = [
+            Order(
+                customer_id=1,
+                items=[OrderItem(1, "Canon EOS 90D", quantity, Money(Decimal("1000000.50")))],
+                payment_method=PaymentMethod.COD,
+                shipping_address="123 Test Street, City",
+                phone_number="0123456789"
+            )
+            for quantity in (1, 2, 3)
+        ]
+        
+        total = Order.calculate_totals_bulk(orders)
+        
+        assert total.amount == Decimal("6000003.00")
+        assert total.currency == "VND"
+        assert Order.calculate_totals_bulk([]).amount == Decimal("0")
+    
     def test_create_order_without_notes(self):
         """Should create order without notes"""
         unit_price = Money(Decimal("1000000"))
@@ -265,6 +313,17 @@ class TestOrderReconstruction:
         assert order.status == OrderStatus.COMPLETED
         assert order.created_at == created_at
         assert order.updated_at == updated_at
+    
+    def test_order_and_items_are_slotted(self):
+        """Should carry no per-instance __dict__ on the order or its items"""
+        item = OrderItem(1, "Canon EOS 90D", 1, Money(Decimal("1000000")))
+        order = Order.reconstruct(
+            1, 1, [item], PaymentMethod.COD, "123 Test Street, City", "0123456789", "",
+            OrderStatus.PENDING, Money(Decimal("1000000")), datetime(2023, 1, 1), datetime(2023, 1, 1)
+        )
+        
+        assert not hasattr(order, '__dict__')
+        assert not hasattr(item, '__dict__')
 
 
 class TestOrderBehavior:
@@ -482,6 +541,37 @@ class TestOrderBehavior:
         
         assert pending_order.can_be_cancelled() is True
         assert shipping_order.can_be_cancelled() is False
+    
+    def test_update_status_to_current_status_is_noop(self):
+        """Should leave the order untouched when the status does not change"""
+        order = Order(
+            customer_id=1,
+            items=[OrderItem(1, "Canon EOS 90D", 1, Money(Decimal("1000000")))],
+            payment_method=PaymentMethod.COD,
+            shipping_address="123 Test Street, City",
+            phone_number="0123456789"
+        )
+        updated_at = order.updated_at
+        
+        order.update_status(OrderStatus.PENDING)
+        
+        assert order.status == OrderStatus.PENDING
+        assert order.updated_at == updated_at
+
+
+class TestOrderStatusTransitions:
+    """Test the OrderStatus transition table"""
+    
+    @pytest.mark.parametrize("current, allowed", [
+        (OrderStatus.PENDING, {OrderStatus.SHIPPING, OrderStatus.CANCELLED}),
+        (OrderStatus.SHIPPING, {OrderStatus.COMPLETED}),
+        (OrderStatus.COMPLETED, set()),
+        (OrderStatus.CANCELLED, set()),
+    ])
+    def test_can_transition_to(self, current, allowed):
+        """Should allow exactly the listed transitions from each status"""
+        for new_status in OrderStatus:
+            assert current.can_transition_to(new_status) is (new_status in allowed)
 
 
 class TestOrderEquality:
@@ -559,3 +649,12 @@ class TestOrderEquality:
         )
         
         assert order1 != order2
+    
+    def test_unsaved_orders_hash_by_identity(self):
+        """Should hash unsaved orders by identity so equal-looking ones stay distinct in sets"""
+        items = [OrderItem(1, "Canon EOS 90D", 1, Money(Decimal("1000000")))]
+        order1 = Order(1, items, PaymentMethod.COD, "123 Test Street, City", "0123456789")
+        order2 = Order(1, items, PaymentMethod.COD, "123 Test Street, City", "0123456789")
+        
+        assert hash(order1) == hash(order1)
+        assert len({order1, order2}) == 2
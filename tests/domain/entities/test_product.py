@@ -196,6 +196,15 @@ class TestProductReconstruction:
         assert product.name == "Canon EOS 90D"
         assert product.is_visible is False
         assert product.created_at == created_at
+    
+    def test_reconstructed_product_is_slotted(self):
+        """Should carry no per-instance __dict__"""
+        product = Product.reconstruct(
+            1, "Canon EOS 90D", "Professional DSLR camera", Money(Decimal("1000000")),
+            10, 1, 1, None, True, datetime(2023, 1, 1)
+        )
+        
+        assert not hasattr(product, '__dict__')
 
 
 class TestProductBehavior:
@@ -354,6 +363,40 @@ class TestProductBehavior:
         with pytest.raises(ValueError, match="Quantity to reduce must be positive"):
             product.reduce_stock(-5)
     
+    def test_set_stock(self):
+        """Should set an absolute stock quantity, including below the current one"""
+        price = Money(Decimal("1000000"))
+        
+        product = Product(
+            name="Canon EOS 90D",
+            description="Professional DSLR camera",
+            price=price,
+            stock_quantity=10,
+            category_id=1,
+            brand_id=1
+        )
+        
+        product.set_stock(3)
+        assert product.stock_quantity == 3
+        product.set_stock(0)
+        assert product.stock_quantity == 0
+    
+    def test_set_stock_invalid_negative(self):
+        """Should raise error for negative stock quantity"""
+        price = Money(Decimal("1000000"))
+        
+        product = Product(
+            name="Canon EOS 90D",
+            description="Professional DSLR camera",
+            price=price,
+            stock_quantity=10,
+            category_id=1,
+            brand_id=1
+        )
+        
+        with pytest.raises(ValueError, match="Stock quantity cannot be negative"):
+            product.set_stock(-1)
+    
     def test_is_in_stock(self):
         """Should check if product is in stock"""
         price = Money(Decimal("1000000"))
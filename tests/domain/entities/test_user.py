@@ -143,6 +143,15 @@ class TestUserReconstruction:
         assert user.username == "testuser"
         assert user.is_active is False
         assert user.created_at == created_at
+    
+    def test_reconstructed_user_is_slotted(self):
+        """Should carry no per-instance __dict__"""
+        user = User.reconstruct(
+            1, "testuser", Email("user@example.com"), "hashed_password", "Test User",
+            None, None, UserRole.CUSTOMER, True, datetime(2023, 1, 1)
+        )
+        
+        assert not hasattr(user, '__dict__')
 
 
 class TestUserBehavior:
@@ -183,6 +192,47 @@ class TestUserBehavior:
         with pytest.raises(ValueError, match="Password hash cannot be empty"):
             user.change_password("")
     
+    def test_change_username_and_email(self):
+        """Should change username and email in place"""
+        user = User(
+            username="testuser",
+            email=Email("user@example.com"),
+            password_hash="hashed_password",
+            full_name="Test User"
+        )
+        
+        user.change_username("  renamed  ")
+        user.change_email(Email("renamed@example.com"))
+        
+        assert user.username == "renamed"
+        assert user.email.address == "renamed@example.com"
+    
+    def test_change_username_too_short_raises_error(self):
+        """Should reject usernames shorter than 3 characters"""
+        user = User(
+            username="testuser",
+            email=Email("user@example.com"),
+            password_hash="hashed_password",
+            full_name="Test User"
+        )
+        
+        with pytest.raises(ValueError, match="Username must be at least 3 characters"):
+            user.change_username("ab")
+    
+    def test_clear_phone(self):
+        """Should remove the phone number"""
+        user = User(
+            username="testuser",
+            email=Email("user@example.com"),
+            password_hash="hashed_password",
+            full_name="Test User",
+            phone_number=PhoneNumber("0123456789")
+        )
+        
+        user.clear_phone()
+        
+        assert user.phone_number is None
+    
     def test_promote_to_admin(self):
         """Should promote user to admin role"""
         email = Email("user@example.com")
@@ -396,6 +446,28 @@ class TestUserBehavior:
         with pytest.raises(ValueError, match="Full name must be at least 2 characters"):
             user.update_profile(full_name="A")
 
+    
+    def test_version_tracks_persisted_updates(self):
+        """Should start at the read version and advance only when told by the repository"""
+        user = User.reconstruct(
+            user_id=1,
+            username="testuser",
+            email=Email("user@example.com"),
+            password_hash="hash",
+            full_name="Test User",
+            phone_number=None,
+            address=None,
+            role=UserRole.CUSTOMER,
+            is_active=True,
+            created_at=datetime.now(),
+            version=4
+        )
+        
+        user.update_profile(full_name="Updated User")
+        assert user.version == 4
+        
+        user.increment_version()
+        assert user.version == 5
 
 class TestUserEquality:
     """Test User equality comparison"""
@@ -160,3 +160,7 @@ class TestEmailRepresentation:
         email = Email("user@example.com")
         
         assert "user@example.com" in repr(email)
+    
+    def test_email_is_slotted(self):
+        """Should not carry a per-instance __dict__"""
+        assert not hasattr(Email("user@example.com"), '__dict__')
@@ -180,6 +180,14 @@ class TestMoneyMultiplication:
         assert result.amount == Decimal("3000000")
         assert result.currency == "VND"
     
+    def test_multiply_by_int(self):
+        """Multiply Money by a plain int quantity"""
+        money = Money(Decimal("1000000.50"), "VND")
+        result = money.multiply(3)
+        
+        assert result.amount == Decimal("3000001.50")
+        assert isinstance(result.amount, Decimal)
+    
     def test_multiply_by_decimal(self):
         """TC23: Multiply Money by decimal"""
         money = Money(Decimal("1000000"), "VND")
@@ -336,6 +344,13 @@ class TestMoneyStringRepresentation:
         
         assert "123,456,789" in result
     
+    def test_str_representation_is_reused(self):
+        """Repeated str() returns the same formatted string"""
+        money = Money(Decimal("1500000"), "VND")
+        
+        assert str(money) == "1,500,000 ₫"
+        assert str(money) is str(money)
+    
     def test_repr_representation(self):
         """TC42: Developer representation"""
         money = Money(Decimal("1000000"), "VND")
@@ -415,3 +430,7 @@ class TestMoneyEdgeCases:
         assert money.subtract(zero).amount == money.amount
         # Multiply zero
         assert zero.multiply(Decimal("100")).amount == Decimal("0")
+    
+    def test_money_is_slotted(self):
+        """Money instances do not carry a per-instance __dict__"""
+        assert not hasattr(Money(Decimal("1000000"), "VND"), '__dict__')
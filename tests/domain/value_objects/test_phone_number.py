@@ -166,3 +166,7 @@ class TestPhoneNumberEdgeCases:
         phone = PhoneNumber("0999999999")
         
         assert phone.number == "0999999999"
+    
+    def test_phone_number_is_slotted(self):
+        """Should not carry a per-instance __dict__"""
+        assert not hasattr(PhoneNumber("0912345678"), '__dict__')
@@ -5,6 +5,7 @@ import pytest
 from datetime import datetime
 from app.adapters.repositories.brand_repository_adapter import BrandRepositoryAdapter
 from app.domain.entities.brand import Brand
+from app.domain.exceptions import BrandNotFoundException, BrandAlreadyExistsException
 from app.infrastructure.database.models import BrandModel
 
 
@@ -213,3 +214,34 @@ class TestBrandRepositoryAdapterEdgeCases:
         all_brands = repo.find_all()
         
         assert all_brands == []
+    
+    def test_update_details_atomic(self, db_session):
+        """Should update the brand and return it from a single statement"""
+        repo = BrandRepositoryAdapter(db_session)
+        
+        canon = repo.save(Brand(name="Canon", description="Old"))
+        
+        updated = repo.update_details_atomic(canon.id, "Canon Inc.", "  New  ", "/logo.png")
+        
+        assert updated.id == canon.id
+        assert updated.name == "Canon Inc."
+        assert updated.description == "New"
+        assert updated.logo_url == "/logo.png"
+        assert repo.find_by_id(canon.id).name == "Canon Inc."
+    
+    def test_update_details_atomic_missing_brand(self, db_session):
+        """Should raise BrandNotFoundException when no row matches"""
+        repo = BrandRepositoryAdapter(db_session)
+        
+        with pytest.raises(BrandNotFoundException):
+            repo.update_details_atomic(99999, "Pentax", None, None)
+    
+    def test_update_details_atomic_duplicate_name(self, db_session):
+        """Should translate the unique name violation"""
+        repo = BrandRepositoryAdapter(db_session)
+        
+        canon = repo.save(Brand(name="Canon"))
+        repo.save(Brand(name="Sony"))
+        
+        with pytest.raises(BrandAlreadyExistsException):
+            repo.update_details_atomic(canon.id, "Sony", None, None)
@@ -0,0 +1,141 @@
+"""
+Integration tests for caching category/brand repository decorators
+"""
+import pytest
+from unittest.mock import patch
+from app.adapters.repositories.category_repository_adapter import CategoryRepositoryAdapter
+from app.adapters.repositories.brand_repository_adapter import BrandRepositoryAdapter
+from app.adapters.repositories.caching_repository_adapters import (
+    CachingCategoryRepository,
+    CachingBrandRepository
+)
+from app.adapters.repositories.lookup_cache import TTLCache
+from app.domain.entities.category import Category
+from app.domain.entities.brand import Brand
+
+
+class TestCachingCategoryRepository:
+    """Test CachingCategoryRepository against a real database"""
+
+    def test_find_by_id_hits_database_once(self, db_session):
+        """Repeated lookups should be served from cache"""
+        inner = CategoryRepositoryAdapter(db_session)
+        repo = CachingCategoryRepository(inner)
+        saved = repo.save(Category(name="Mirrorless", description="Mirrorless cameras"))
+
+        with patch.object(inner, 'find_by_id', wraps=inner.find_by_id) as spy:
+            first = repo.find_by_id(saved.id)
+            second = repo.find_by_id(saved.id)
+
+        assert first.name == "Mirrorless"
+        assert second.name == "Mirrorless"
+        assert spy.call_count == 1
+
+    def test_returned_entities_are_not_shared(self, db_session):
+        """Mutating a returned category must not change the cached one"""
+        repo = CachingCategoryRepository(CategoryRepositoryAdapter(db_session))
+        saved = repo.save(Category(name="Lenses"))
+
+        category = repo.find_by_id(saved.id)
+        category.update_details(name="Changed locally")
+
+        assert repo.find_by_id(saved.id).name == "Lenses"
+
+    def test_save_invalidates_cached_entry(self, db_session):
+        """Updating a category through the repository refreshes the cache"""
+        repo = CachingCategoryRepository(CategoryRepositoryAdapter(db_session))
+        saved = repo.save(Category(name="Tripods"))
+        category = repo.find_by_id(saved.id)
+
+        category.update_details(name="Tripods & Stands")
+        repo.save(category)
+
+        assert repo.find_by_id(saved.id).name == "Tripods & Stands"
+
+    def test_delete_invalidates_cached_entry(self, db_session):
+        """Deleted categories are no longer returned"""
+        repo = CachingCategoryRepository(CategoryRepositoryAdapter(db_session))
+        saved = repo.save(Category(name="Flashes"))
+        repo.find_by_id(saved.id)
+
+        assert repo.delete(saved.id) is True
+        assert repo.find_by_id(saved.id) is None
+
+
+class TestCachingBrandRepository:
+    """Test CachingBrandRepository against a real database"""
+
+    def test_find_by_id_hits_database_once(self, db_session):
+        """Repeated lookups should be served from cache"""
+        inner = BrandRepositoryAdapter(db_session)
+        repo = CachingBrandRepository(inner)
+        saved = repo.save(Brand(name="Fujifilm"))
+
+        with patch.object(inner, 'find_by_id', wraps=inner.find_by_id) as spy:
+            repo.find_by_id(saved.id)
+            brand = repo.find_by_id(saved.id)
+
+        assert brand.name == "Fujifilm"
+        assert spy.call_count == 1
+
+    def test_save_invalidates_cached_entry(self, db_session):
+        """Updating a brand through the repository refreshes the cache"""
+        repo = CachingBrandRepository(BrandRepositoryAdapter(db_session))
+        saved = repo.save(Brand(name="Nikon"))
+        brand = repo.find_by_id(saved.id)
+
+        brand.update_details(description="Japanese camera maker")
+        repo.save(brand)
+
+        assert repo.find_by_id(saved.id).description == "Japanese camera maker"
+
+    def test_update_details_atomic_invalidates_cached_entry(self, db_session):
+        """Atomic updates refresh the cache too"""
+        repo = CachingBrandRepository(BrandRepositoryAdapter(db_session))
+        saved = repo.save(Brand(name="Leica"))
+        repo.find_by_id(saved.id)
+
+        repo.update_details_atomic(saved.id, "Leica Camera", None, None)
+
+        assert repo.find_by_id(saved.id).name == "Leica Camera"
+
+    def test_missing_brand_not_cached(self, db_session):
+        """Lookups for unknown IDs return None"""
+        repo = CachingBrandRepository(BrandRepositoryAdapter(db_session))
+
+        assert repo.find_by_id(99999) is None
+
+
+class TestTTLCache:
+    """Test TTLCache expiry and eviction"""
+
+    def test_entries_expire_after_ttl(self):
+        """Entries older than ttl are dropped"""
+        cache = TTLCache(maxsize=4, ttl=10)
+
+        with patch('app.adapters.repositories.lookup_cache.time.monotonic', return_value=100.0):
+            cache.set('a', 1)
+        with patch('app.adapters.repositories.lookup_cache.time.monotonic', return_value=105.0):
+            assert cache.get('a') == 1
+        with patch('app.adapters.repositories.lookup_cache.time.monotonic', return_value=111.0):
+            assert cache.get('a') is None
+
+    def test_least_recently_used_entry_evicted(self):
+        """Cache never grows past maxsize"""
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+
+        assert cache.get('a') == 1
+        assert cache.get('b') is None
+        assert cache.get('c') == 3
+        assert len(cache) == 2
+
+    def test_invalid_settings_rejected(self):
+        """maxsize and ttl must be positive"""
+        with pytest.raises(ValueError):
+            TTLCache(maxsize=0)
+        with pytest.raises(ValueError):
+            TTLCache(ttl=0)
@@ -3,6 +3,8 @@ Integration tests for CartRepositoryAdapter
 Tests the adapter layer with real database operations
 """
 import pytest
+from app.adapters.repositories.unit_of_work import SqlAlchemyUnitOfWork
+from app.business.ports.cart_repository import CartItemUpdateStatus
 from app.domain.entities.cart import Cart, CartItem
 
 
@@ -109,6 +111,109 @@ class TestCartRepositoryIntegration:
         assert len(updated_cart.items) == original_item_count - 1
         assert not any(item.product_id == first_item.product_id for item in updated_cart.items)
         
+    def test_find_by_user_id_with_items_loads_items(self, cart_repository, sample_cart):
+        """Test that find_by_user_id_with_items() returns the cart with its items"""
+        # Act
+        found_cart = cart_repository.find_by_user_id_with_items(sample_cart.customer_id)
+        
+        # Assert
+        assert found_cart is not None
+        assert found_cart.id == sample_cart.id
+        assert sorted(item.product_id for item in found_cart.items) == sorted(
+            item.product_id for item in sample_cart.items
+        )
+        assert cart_repository.find_by_user_id_with_items(99999) is None
+        
+    def test_find_cart_view_joins_product_details(self, cart_repository, sample_cart, sample_product):
+        """Test that find_cart_view() returns cart lines with current product details"""
+        # Act
+        view = cart_repository.find_cart_view(sample_cart.customer_id)
+        
+        # Assert
+        assert view.cart_id == sample_cart.id
+        assert view.item_count == 1
+        line = view.lines[0]
+        assert line.product_id == sample_product.id
+        assert line.product_name == sample_product.name
+        assert line.quantity == 2
+        assert line.price.amount == sample_product.price.amount
+        assert line.stock_quantity == 50
+        assert line.is_visible is True
+        assert cart_repository.find_cart_view(99999) is None
+        
+    def test_find_cart_view_of_empty_cart_has_no_lines(self, cart_repository, sample_user):
+        """Test that an empty cart is returned without lines"""
+        # Arrange
+        cart = cart_repository.save(Cart(customer_id=sample_user.id))
+        
+        # Act
+        view = cart_repository.find_cart_view(sample_user.id)
+        
+        # Assert
+        assert view.cart_id == cart.id
+        assert view.item_count == 0
+        assert view.lines == ()
+        
+    def test_find_cart_item_for_user_returns_owned_item(self, cart_repository, sample_cart):
+        """Test that find_cart_item_for_user() finds an item in the user's own cart"""
+        # Arrange
+        cart_item = cart_repository.find_by_id(sample_cart.id).items[0]
+        
+        # Act
+        found_item = cart_repository.find_cart_item_for_user(
+            sample_cart.customer_id, cart_item.cart_item_id
+        )
+        
+        # Assert
+        assert found_item is not None
+        assert found_item.cart_item_id == cart_item.cart_item_id
+        assert found_item.cart_id == sample_cart.id
+        
+    def test_find_cart_item_for_user_returns_none_for_other_user(self, cart_repository, sample_cart):
+        """Test that find_cart_item_for_user() does not return items from another user's cart"""
+        # Arrange
+        cart_item = cart_repository.find_by_id(sample_cart.id).items[0]
+        
+        # Act
+        result = cart_repository.find_cart_item_for_user(99999, cart_item.cart_item_id)
+        
+        # Assert
+        assert result is None
+        
+    def test_try_update_quantity_updates_owned_item(self, cart_repository, sample_cart):
+        """Test that try_update_quantity() writes the new quantity when allowed"""
+        # Arrange
+        cart_item = cart_repository.find_by_id(sample_cart.id).items[0]
+        
+        # Act
+        result = cart_repository.try_update_quantity(
+            sample_cart.customer_id, cart_item.cart_item_id, 7
+        )
+        
+        # Assert
+        assert result.status == CartItemUpdateStatus.OK
+        assert result.cart_item.quantity == 7
+        assert cart_repository.find_cart_item_by_id(cart_item.cart_item_id).quantity == 7
+        
+    def test_try_update_quantity_reports_failures(self, cart_repository, sample_cart, sample_product):
+        """Test that try_update_quantity() leaves the item alone and says why"""
+        # Arrange
+        cart_item = cart_repository.find_by_id(sample_cart.id).items[0]
+        
+        # Act
+        missing = cart_repository.try_update_quantity(sample_cart.customer_id, 99999, 1)
+        not_yours = cart_repository.try_update_quantity(99999, cart_item.cart_item_id, 1)
+        too_many = cart_repository.try_update_quantity(
+            sample_cart.customer_id, cart_item.cart_item_id, sample_product.stock_quantity + 1
+        )
+        
+        # Assert
+        assert missing.status == CartItemUpdateStatus.NOT_FOUND
+        assert not_yours.status == CartItemUpdateStatus.NOT_YOURS
+        assert too_many.status == CartItemUpdateStatus.INSUFFICIENT_STOCK
+        assert too_many.available_stock == sample_product.stock_quantity
+        assert cart_repository.find_cart_item_by_id(cart_item.cart_item_id).quantity == cart_item.quantity
+        
     def test_clear_cart_removes_all_items(self, cart_repository, sample_cart):
         """Test that clear_cart() removes all items"""
         # Act
@@ -122,6 +227,23 @@ class TestCartRepositoryIntegration:
         assert found_cart is not None
         assert len(found_cart.items) == 0
         
+    def test_clear_cart_inside_unit_of_work_defers_commit(self, cart_repository, sample_cart, db_session):
+        """Test that clear_cart() only flushes while a unit of work owns the session"""
+        # Act
+        with SqlAlchemyUnitOfWork(db_session) as unit_of_work:
+            result = cart_repository.clear_cart(sample_cart.customer_id)
+            
+            # Assert: flushed but left in the open transaction
+            assert result is True
+            assert db_session.in_transaction()
+            assert not db_session.new and not db_session.dirty
+            
+            unit_of_work.commit()
+        
+        found_cart = cart_repository.find_by_customer_id(sample_cart.customer_id)
+        assert len(found_cart.items) == 0
+        assert 'unit_of_work' not in db_session.info
+        
     def test_clear_cart_returns_false_when_cart_not_found(self, cart_repository):
         """Test that clear_cart() returns False when cart doesn't exist"""
         # Act
@@ -5,6 +5,7 @@ import pytest
 from datetime import datetime
 from app.adapters.repositories.category_repository_adapter import CategoryRepositoryAdapter
 from app.domain.entities.category import Category
+from app.domain.exceptions import CategoryNotFoundException, CategoryAlreadyExistsException
 from app.infrastructure.database.models import CategoryModel
 
 
@@ -226,3 +227,33 @@ class TestCategoryRepositoryAdapterEdgeCases:
         
         found_category = repo.find_by_name("DSLR & Mirrorless (Pro)")
         assert found_category is not None
+    
+    def test_update_details_atomic(self, db_session):
+        """Should update the category and return it from a single statement"""
+        repo = CategoryRepositoryAdapter(db_session)
+        
+        cameras = repo.save(Category(name="Cameras", description="Old"))
+        
+        updated = repo.update_details_atomic(cameras.id, "DSLR Cameras", "")
+        
+        assert updated.id == cameras.id
+        assert updated.name == "DSLR Cameras"
+        assert updated.description is None
+        assert repo.find_by_id(cameras.id).name == "DSLR Cameras"
+    
+    def test_update_details_atomic_missing_category(self, db_session):
+        """Should raise CategoryNotFoundException when no row matches"""
+        repo = CategoryRepositoryAdapter(db_session)
+        
+        with pytest.raises(CategoryNotFoundException):
+            repo.update_details_atomic(99999, "Tripods", None)
+    
+    def test_update_details_atomic_duplicate_name(self, db_session):
+        """Should translate the unique name violation"""
+        repo = CategoryRepositoryAdapter(db_session)
+        
+        cameras = repo.save(Category(name="Cameras"))
+        repo.save(Category(name="Lenses"))
+        
+        with pytest.raises(CategoryAlreadyExistsException):
+            repo.update_details_atomic(cameras.id, "Lenses", None)
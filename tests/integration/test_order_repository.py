@@ -7,6 +7,7 @@ from datetime import datetime
 from app.domain.entities.order import Order, OrderItem
 from app.domain.value_objects.money import Money
 from app.domain.enums import OrderStatus, PaymentMethod
+from app.domain.exceptions import ConcurrencyConflictException
 
 
 class TestOrderRepositoryIntegration:
@@ -142,6 +143,20 @@ class TestOrderRepositoryIntegration:
         found_order = order_repository.find_by_id(sample_order.id)
         assert found_order.status == OrderStatus.COMPLETED
         
+    def test_save_rejects_stale_version(self, order_repository, sample_order):
+        """Test that save() refuses to overwrite an order changed since it was read"""
+        # Arrange - two admins read the same pending order
+        first_read = order_repository.find_by_id(sample_order.id)
+        second_read = order_repository.find_by_id(sample_order.id)
+        first_read.ship()
+        order_repository.save(first_read)
+        
+        # Act & Assert
+        second_read.cancel()
+        with pytest.raises(ConcurrencyConflictException):
+            order_repository.save(second_read)
+        assert first_read.version == second_read.version + 1
+        
     def test_cancel_pending_order(self, order_repository, sample_order):
         """Test cancelling a pending order"""
         # Arrange - Order should be PENDING
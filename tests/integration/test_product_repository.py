@@ -98,6 +98,33 @@ class TestProductRepositoryIntegration:
         assert len(visible_products) > 0
         assert all(p.is_visible for p in visible_products)
 
+    def test_available_only_excludes_out_of_stock(self, product_repository, sample_product):
+        """Test that available_only parameter drops out-of-stock products in the query"""
+        # Arrange
+        sold_out = product_repository.save(Product(
+            name="Sold Out Camera",
+            description="Out of stock product",
+            price=Money(1000.00),
+            stock_quantity=0,
+            category_id=sample_product.category_id,
+            brand_id=sample_product.brand_id
+        ))
+
+        # Act
+        all_products = product_repository.find_all(skip=0, limit=10)
+        available = product_repository.find_all(skip=0, limit=10, available_only=True)
+        by_category = product_repository.find_by_category(
+            category_id=sample_product.category_id,
+            available_only=True
+        )
+
+        # Assert
+        assert any(p.id == sold_out.id for p in all_products)
+        assert all(p.id != sold_out.id for p in available)
+        assert all(p.is_available_for_purchase() for p in available)
+        assert any(p.id == sample_product.id for p in by_category)
+        assert all(p.id != sold_out.id for p in by_category)
+
     def test_pagination_with_skip_and_limit(self, product_repository):
         """Test that skip and limit pagination works correctly"""
         # Act - Get first 3 products
@@ -164,3 +191,54 @@ class TestProductRepositoryIntegration:
         # Assert
         assert updated_product.is_in_stock() is True
         assert updated_product.is_available_for_purchase() is True
+
+    def test_save_many_updates_all_products(self, product_repository, sample_product):
+        """Test that save_many() persists stock changes for several products at once"""
+        # Arrange
+        second = product_repository.save(Product(
+            name="Second Camera",
+            description="Another product",
+            price=Money(2000.00),
+            stock_quantity=20,
+            category_id=sample_product.category_id,
+            brand_id=sample_product.brand_id
+        ))
+        sample_product.reduce_stock(5)
+        second.reduce_stock(20)
+
+        # Act
+        product_repository.save_many([sample_product, second])
+
+        # Assert
+        assert product_repository.find_by_id(sample_product.id).stock_quantity == 45
+        assert product_repository.find_by_id(second.id).stock_quantity == 0
+
+    def test_fetch_update_context_flags_references_and_name(self, product_repository, sample_product):
+        """Test that fetch_update_context() checks category, brand and name in one SELECT"""
+        # Arrange
+        other = product_repository.save(Product(
+            name="Other Camera",
+            description="Another product",
+            price=Money(2000.00),
+            stock_quantity=1,
+            category_id=sample_product.category_id,
+            brand_id=sample_product.brand_id
+        ))
+
+        # Act
+        valid = product_repository.fetch_update_context(
+            sample_product.id, sample_product.category_id, sample_product.brand_id, sample_product.name
+        )
+        invalid = product_repository.fetch_update_context(
+            sample_product.id, 99999, 99999, other.name
+        )
+
+        # Assert
+        assert valid.product.id == sample_product.id
+        assert valid.category_exists is True
+        assert valid.brand_exists is True
+        assert valid.name_taken is False
+        assert invalid.category_exists is False
+        assert invalid.brand_exists is False
+        assert invalid.name_taken is True
+        assert product_repository.fetch_update_context(99999, 1, 1, "Any") is None
@@ -6,7 +6,11 @@ import pytest
 from app.domain.entities.user import User
 from app.domain.value_objects.email import Email
 from app.domain.enums import UserRole
-from app.domain.exceptions import UserNotFoundException, UserAlreadyExistsException
+from app.domain.exceptions import (
+    UserNotFoundException,
+    UserAlreadyExistsException,
+    ConcurrencyConflictException
+)
 from app.adapters.repositories.user_repository_adapter import UserRepositoryAdapter
 
 
@@ -130,6 +134,75 @@ class TestUserRepositoryIntegration:
         found_user = user_repository.find_by_id(sample_user.id)
         assert found_user.full_name == "Updated Name"
 
+    def test_save_rejects_stale_version(self, user_repository, sample_user):
+        """Test that save() refuses to overwrite a user changed since it was read"""
+        # Arrange
+        first_read = user_repository.find_by_id(sample_user.id)
+        second_read = user_repository.find_by_id(sample_user.id)
+        first_read.update_profile(full_name="First Writer")
+        user_repository.save(first_read)
+
+        # Act & Assert
+        second_read.update_profile(full_name="Second Writer")
+        with pytest.raises(ConcurrencyConflictException):
+            user_repository.save(second_read)
+        assert first_read.version == second_read.version + 1
+
+    def test_save_keeps_entity_version_in_step(self, user_repository, sample_user):
+        """Test that the same entity can be saved repeatedly"""
+        # Arrange
+        user = user_repository.find_by_id(sample_user.id)
+
+        # Act
+        user.update_profile(full_name="Once")
+        user_repository.save(user)
+        user.update_profile(full_name="Twice")
+        saved = user_repository.save(user)
+
+        # Assert
+        assert saved.full_name == "Twice"
+        assert saved.version == user.version
+
+    def test_search_by_query_matches_username_name_and_email(self, user_repository, sample_user):
+        """Test that search_by_query() matches a lowercased query against every searched column"""
+        # Act
+        by_username = user_repository.search_by_query("testuser")
+        by_full_name = user_repository.search_by_query("test user")
+        by_email = user_repository.search_by_query("@example.com")
+        
+        # Assert
+        assert any(u.id == sample_user.id for u in by_username)
+        assert any(u.id == sample_user.id for u in by_full_name)
+        assert any(u.id == sample_user.id for u in by_email)
+
+    def test_fetch_for_update_reports_conflicts_with_other_users(self, user_repository, sample_user):
+        """Test that fetch_for_update() flags names owned by other users only"""
+        # Arrange
+        other = user_repository.save(User(
+            username="otheruser",
+            email=Email("other@example.com"),
+            password_hash="hashed_pwd",
+            full_name="Other User"
+        ))
+
+        # Act
+        own_names = user_repository.fetch_for_update(
+            sample_user.id, sample_user.username, sample_user.email
+        )
+        taken_names = user_repository.fetch_for_update(
+            sample_user.id, other.username, other.email
+        )
+        unchecked = user_repository.fetch_for_update(sample_user.id)
+
+        # Assert
+        assert own_names.user.id == sample_user.id
+        assert own_names.username_taken is False
+        assert own_names.email_taken is False
+        assert taken_names.username_taken is True
+        assert taken_names.email_taken is True
+        assert unchecked.username_taken is False and unchecked.email_taken is False
+        assert user_repository.fetch_for_update(99999) is None
+
     def test_user_count_increases_after_save(self, user_repository, db_session):
         """Test that user count increases after saving a new user"""
         # Arrange